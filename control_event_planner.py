@@ -0,0 +1,132 @@
+"""Planner for control events (Period Start, Period End, Game End).
+
+Reporting a control event may require implicit events: a Period End needs a
+Period Start for the same period, and a Game End needs both. The planner is a
+pure function of the current events and the requested control event. It
+returns an ordered list of creates and updates that an executor dispatches,
+so planning can be tested and timed separately from the API calls.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from event_payload_builder import control_event_payload
+
+PERIOD_START = 31
+PERIOD_END = 32
+GAME_END = 23
+
+CONTROL_EVENT_NAMES = {
+    PERIOD_START: "Period Start",
+    PERIOD_END: "Period End",
+    GAME_END: "Game End",
+}
+
+# (matchhandelsetypid, period) -> first event of that type in the period
+ControlEventLookup = Dict[Tuple[int, int], Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class PlannedEvent:
+    """A single create or update call in a control event plan."""
+
+    payload: Dict[str, Any]
+    implicit: bool = False  # True for events added only to satisfy ordering
+
+    @property
+    def is_update(self) -> bool:
+        """True if the step updates an existing event."""
+        return bool(self.payload["matchhandelseid"])
+
+    @property
+    def event_type_id(self) -> int:
+        """The matchhandelsetypid of the planned event."""
+        return int(self.payload["matchhandelsetypid"])
+
+    def describe(self) -> str:
+        """Returns a short human-readable description of the step."""
+        action = "Updating existing" if self.is_update else "Creating new"
+        name = CONTROL_EVENT_NAMES.get(self.event_type_id, "control")
+        suffix = " (implicit)" if self.implicit else ""
+        return f"{action} {name} event for period {self.payload['period']}{suffix}"
+
+
+def control_event_lookup(events: Iterable[Dict[str, Any]]) -> ControlEventLookup:
+    """Indexes control events by (type, period) in a single pass.
+
+    Events missing ``matchhandelsetypid`` or ``period`` are ignored. When a
+    type occurs more than once in a period, the first occurrence wins.
+    """
+    lookup: ControlEventLookup = {}
+    for event in events:
+        if "matchhandelsetypid" not in event or "period" not in event:
+            continue
+        key = (int(event["matchhandelsetypid"]), int(event["period"]))
+        if key[0] in CONTROL_EVENT_NAMES:
+            lookup.setdefault(key, event)
+    return lookup
+
+
+def _implicit_event(
+    control_event: Dict[str, Any], event_type_id: int, match_minute: int
+) -> Dict[str, Any]:
+    """Builds a new control event payload derived from the requested one."""
+    return control_event_payload(
+        control_event["matchid"],
+        event_type_id,
+        control_event["period"],
+        match_minute,
+        control_event["hemmamal"],
+        control_event["bortamal"],
+    )
+
+
+def _requested_event(
+    control_event: Dict[str, Any], existing: Optional[Dict[str, Any]]
+) -> PlannedEvent:
+    """Plans the requested event, reusing the id of an existing one."""
+    payload = dict(control_event)
+    if existing is not None:
+        payload["matchhandelseid"] = existing["matchhandelseid"]
+    return PlannedEvent(payload)
+
+
+def plan_control_event(
+    control_event: Dict[str, Any],
+    lookup: ControlEventLookup,
+    period_start_minute: int,
+) -> List[PlannedEvent]:
+    """Plans the API calls needed to report a control event.
+
+    Args:
+        control_event: The requested control event payload
+        lookup: Existing control events, see control_event_lookup()
+        period_start_minute: Match minute at which the event's period starts
+
+    Returns:
+        Steps in chronological order: Period Start, Period End, Game End.
+        Existing events of the requested type are updated in place.
+    """
+    event_type_id = int(control_event["matchhandelsetypid"])
+    period = int(control_event["period"])
+    match_minute = control_event["matchminut"]
+    plan: List[PlannedEvent] = []
+
+    if event_type_id in (PERIOD_END, GAME_END):
+        if (PERIOD_START, period) not in lookup:
+            plan.append(
+                PlannedEvent(
+                    _implicit_event(control_event, PERIOD_START, period_start_minute),
+                    implicit=True,
+                )
+            )
+    if event_type_id == GAME_END and (PERIOD_END, period) not in lookup:
+        plan.append(
+            PlannedEvent(
+                _implicit_event(control_event, PERIOD_END, match_minute),
+                implicit=True,
+            )
+        )
+
+    plan.append(_requested_event(control_event, lookup.get((event_type_id, period))))
+    return plan
@@ -0,0 +1,112 @@
+"""Terminal display width of emoji, team names and other non-ASCII text.
+
+Table and menu alignment needs the number of terminal columns a string
+takes, which differs from len() for emoji ("🟨" is two columns), ZWJ
+sequences ("👨‍💼" is one two-column glyph made of three code points) and
+combining characters. display_width() answers from a cache that is preloaded
+with every emoji in emoji_config and fills up with team and player names as
+they are rendered.
+
+Widths are measured with wcwidth, the library tabulate uses, so tables
+rendered by either agree. Without wcwidth a stdlib implementation of the same
+rules is used.
+"""
+
+import unicodedata
+from typing import Callable, Dict, Iterable
+
+from emoji_config import EVENT_EMOJIS, MENU_EMOJIS
+
+_ZWJ = "\u200d"
+_VS16 = "\ufe0f"  # Emoji presentation selector
+
+# Bound on memoized strings; the preloaded emoji are kept separately
+_MAX_MEMOIZED = 4096
+
+
+def _stdlib_width(text: str) -> int:
+    """Display width by the wcwidth rules, or -1 for non-printable text."""
+    width = 0
+    last_width = 0
+    joined = False
+    for char in text:
+        if char == _ZWJ:
+            # The next character is drawn as part of the previous glyph
+            joined = True
+            continue
+        if joined:
+            joined = False
+            continue
+        if char == _VS16:
+            # Emoji presentation widens a narrow base character
+            if last_width == 1:
+                width += 1
+                last_width = 2
+            continue
+        code_point = ord(char)
+        if code_point < 0x20 or 0x7F <= code_point < 0xA0:
+            return -1
+        if unicodedata.combining(char) or unicodedata.category(char) in (
+            "Mn",
+            "Me",
+            "Cf",
+        ):
+            continue
+        last_width = 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+        width += last_width
+    return width
+
+
+try:
+    from wcwidth import wcswidth as _wcswidth
+except ImportError:
+    _wcswidth = None
+
+measure_width: Callable[[str], int] = (
+    _wcswidth if _wcswidth is not None else _stdlib_width
+)
+
+_preloaded: Dict[str, int] = {}
+_memoized: Dict[str, int] = {}
+
+
+def preload(texts: Iterable[str]) -> None:
+    """Measures strings ahead of rendering and keeps them for the session."""
+    for text in texts:
+        _preloaded[text] = measure_width(text)
+
+
+def display_width(text: str) -> int:
+    """Returns the number of terminal columns text takes.
+
+    Returns -1 if text contains non-printable characters, as wcswidth does.
+    """
+    if text.isascii() and text.isprintable():
+        return len(text)
+    width = _preloaded.get(text)
+    if width is not None:
+        return width
+    width = _memoized.get(text)
+    if width is not None:
+        return width
+
+    # Event cells and menu lines are an emoji followed by ASCII text
+    head, separator, rest = text.partition(" ")
+    head_width = _preloaded.get(head)
+    if head_width is not None and rest.isascii() and rest.isprintable():
+        return head_width + len(separator) + len(rest)
+
+    width = measure_width(text)
+    if len(_memoized) >= _MAX_MEMOIZED:
+        _memoized.clear()
+    _memoized[text] = width
+    return width
+
+
+def ljust(text: str, width: int) -> str:
+    """Pads text with spaces to width terminal columns."""
+    return text + " " * (width - display_width(text))
+
+
+preload(EVENT_EMOJIS.values())
+preload(MENU_EMOJIS.values())
@@ -40,7 +40,11 @@ MENU_EMOJIS = {
     "team1_events": "⚽",
     "team2_events": "⚽",
     "clear_events": "🗑️",
+    "edit_events": "✏️",
+    "live_clock": "⏲️",
+    "sync": "🔄",
     "back": "🔙",
     "control_events": "⏱️",
-    "staff_events": "👨‍💼"
+    "staff_events": "👨‍💼",
+    "export": "📤"
 }
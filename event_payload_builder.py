@@ -0,0 +1,297 @@
+"""Builder for matchhandelse payloads sent to report_match_event.
+
+Every reported event (goal, card, substitution, control event) is sent as the
+same 17-field dictionary. The builder is bound to a match, precomputes the
+fields that are constant for it and offers typed constructors that return a
+validated, serialisation-ready payload. payload_builder_for returns the one
+builder of a match.
+"""
+
+from typing import Any, Dict, Optional
+
+from match_context import MatchContext
+from match_event_sync import GOAL_EVENT_TYPE_IDS
+
+# Fields of a matchhandelse payload, in the order the API expects them
+EVENT_PAYLOAD_FIELDS = (
+    "matchhandelseid",
+    "matchid",
+    "period",
+    "matchminut",
+    "sekund",
+    "matchhandelsetypid",
+    "matchlagid",
+    "spelareid",
+    "spelareid2",
+    "planpositionx",
+    "planpositiony",
+    "matchdeltagareid",
+    "matchdeltagareid2",
+    "fotbollstypId",
+    "relateradTillMatchhandelseID",
+    "hemmamal",
+    "bortamal",
+)
+
+SUBSTITUTION_EVENT_TYPE_ID = 17
+# Yellow card and the two red cards
+CARD_EVENT_TYPE_IDS = frozenset({20, 8, 9})
+
+# Values used for fields that an event does not set explicitly
+_FIELD_DEFAULTS: Dict[str, Any] = {
+    "matchhandelseid": 0,  # 0 for new event
+    "sekund": 0,
+    "matchlagid": 0,
+    "spelareid": 0,
+    "spelareid2": 0,
+    "planpositionx": "-1",
+    "planpositiony": "-1",
+    "matchdeltagareid": 0,
+    "matchdeltagareid2": 0,
+    "fotbollstypId": 1,
+    "relateradTillMatchhandelseID": 0,
+}
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def validate_event_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Checks that a payload has every field with a sensible value.
+
+    Args:
+        payload: The payload to validate
+
+    Returns:
+        The payload itself, for chaining
+
+    Raises:
+        ValueError: If a field is missing or has an invalid value
+    """
+    missing = [key for key in EVENT_PAYLOAD_FIELDS if key not in payload]
+    if missing:
+        raise ValueError(f"Invalid event payload: missing fields {missing}")
+    for key, minimum in (
+        ("matchhandelsetypid", 1),
+        ("period", 1),
+        ("matchminut", 0),
+        ("hemmamal", 0),
+        ("bortamal", 0),
+    ):
+        if not _is_int(payload[key]) or payload[key] < minimum:
+            raise ValueError(f"Invalid event payload: {key}={payload[key]!r}")
+    return payload
+
+
+def control_event_payload(
+    match_id: int,
+    event_type_id: int,
+    period: int,
+    match_minute: int,
+    home_score: int,
+    away_score: int,
+    event_id: int = 0,
+) -> Dict[str, Any]:
+    """Returns a control event payload (Period Start/End, Game End)."""
+    payload = dict(_FIELD_DEFAULTS)
+    payload.update(
+        matchhandelseid=event_id,
+        matchid=match_id,
+        period=period,
+        matchminut=match_minute,
+        matchhandelsetypid=event_type_id,
+        hemmamal=home_score,
+        bortamal=away_score,
+    )
+    return {key: payload[key] for key in EVENT_PAYLOAD_FIELDS}
+
+
+class EventPayloadBuilder:
+    """Builds matchhandelse payloads for a single match."""
+
+    def __init__(self, match_context: MatchContext):
+        """Initializes the builder and precomputes per-match constant fields.
+
+        Args:
+            match_context: The match the payloads are reported for
+        """
+        self.match_context = match_context
+        self._template = dict(_FIELD_DEFAULTS)
+        self._template["matchid"] = match_context.match_id
+
+    def team_id(self, team_number: int) -> int:
+        """Returns the matchlagid of team 1 (home) or team 2 (away)."""
+        if team_number == 1:
+            return int(self.match_context.team1_id)
+        return int(self.match_context.team2_id)
+
+    def _build(self, **fields: Any) -> Dict[str, Any]:
+        payload = dict(self._template)
+        payload.update(fields)
+        return validate_event_payload(
+            {key: payload[key] for key in EVENT_PAYLOAD_FIELDS}
+        )
+
+    def player_event(
+        self,
+        event_type_id: int,
+        team_number: int,
+        player_id: int,
+        participant_id: Optional[int],
+        period: int,
+        minute: int,
+        home_score: int,
+        away_score: int,
+        second: int = 0,
+    ) -> Dict[str, Any]:
+        """Returns the payload of an event involving a single player."""
+        return self._build(
+            period=period,
+            matchminut=minute,
+            sekund=second,
+            matchhandelsetypid=event_type_id,
+            matchlagid=self.team_id(team_number),
+            spelareid=int(player_id),
+            matchdeltagareid=int(participant_id) if participant_id else 0,
+            hemmamal=home_score,
+            bortamal=away_score,
+        )
+
+    def goal(
+        self,
+        event_type_id: int,
+        team_number: int,
+        player_id: int,
+        participant_id: Optional[int],
+        period: int,
+        minute: int,
+        home_score: int,
+        away_score: int,
+        second: int = 0,
+    ) -> Dict[str, Any]:
+        """Returns a goal payload; the scores must already include the goal.
+
+        Raises:
+            ValueError: If event_type_id is not a goal type
+        """
+        if event_type_id not in GOAL_EVENT_TYPE_IDS:
+            raise ValueError(f"Not a goal event type: {event_type_id}")
+        return self.player_event(
+            event_type_id,
+            team_number,
+            player_id,
+            participant_id,
+            period,
+            minute,
+            home_score,
+            away_score,
+            second,
+        )
+
+    def card(
+        self,
+        event_type_id: int,
+        team_number: int,
+        player_id: int,
+        participant_id: Optional[int],
+        period: int,
+        minute: int,
+        home_score: int,
+        away_score: int,
+        second: int = 0,
+    ) -> Dict[str, Any]:
+        """Returns the payload of a yellow or red card.
+
+        Raises:
+            ValueError: If event_type_id is not a card type
+        """
+        if event_type_id not in CARD_EVENT_TYPE_IDS:
+            raise ValueError(f"Not a card event type: {event_type_id}")
+        return self.player_event(
+            event_type_id,
+            team_number,
+            player_id,
+            participant_id,
+            period,
+            minute,
+            home_score,
+            away_score,
+            second,
+        )
+
+    def substitution(
+        self,
+        team_number: int,
+        player_in_id: int,
+        player_out_id: int,
+        participant_in_id: Optional[int],
+        participant_out_id: Optional[int],
+        period: int,
+        minute: int,
+        home_score: int,
+        away_score: int,
+        second: int = 0,
+    ) -> Dict[str, Any]:
+        """Returns a substitution payload (player in first, player out second)."""
+        return self._build(
+            period=period,
+            matchminut=minute,
+            sekund=second,
+            matchhandelsetypid=SUBSTITUTION_EVENT_TYPE_ID,
+            matchlagid=self.team_id(team_number),
+            spelareid=int(player_in_id),
+            spelareid2=int(player_out_id),
+            matchdeltagareid=int(participant_in_id) if participant_in_id else 0,
+            matchdeltagareid2=int(participant_out_id) if participant_out_id else 0,
+            hemmamal=home_score,
+            bortamal=away_score,
+        )
+
+    def control(
+        self,
+        event_type_id: int,
+        period: int,
+        minute: int,
+        home_score: int,
+        away_score: int,
+        event_id: int = 0,
+    ) -> Dict[str, Any]:
+        """Returns a control event payload (Period Start/End, Game End)."""
+        return validate_event_payload(
+            control_event_payload(
+                self._template["matchid"],
+                event_type_id,
+                period,
+                minute,
+                home_score,
+                away_score,
+                event_id,
+            )
+        )
+
+    @staticmethod
+    def from_event(event: Dict[str, Any]) -> Dict[str, Any]:
+        """Builds a payload from an event fetched from the API.
+
+        The payload keeps the existing matchhandelseid, so reporting it updates
+        the event in place instead of creating a new one.
+
+        Raises:
+            ValueError: If the event has no matchid
+        """
+        if not event.get("matchid"):
+            raise ValueError(f"Event {event.get('matchhandelseid')} has no matchid")
+        return {
+            key: event.get(key, _FIELD_DEFAULTS.get(key, 0))
+            for key in EVENT_PAYLOAD_FIELDS
+        }
+
+
+def payload_builder_for(match_context: MatchContext) -> EventPayloadBuilder:
+    """Returns the payload builder of a match, creating it on first use."""
+    builder = match_context.payload_builder
+    if builder is None:
+        builder = EventPayloadBuilder(match_context)
+        match_context.payload_builder = builder
+    return builder
@@ -0,0 +1,126 @@
+"""Background polling of match events reported from other devices.
+
+Assistant referees and club officials can report events for the same match
+while the reporter is open. EventPoller fetches the event list in a daemon
+thread, detects changes by hashing the list and swaps the new list into the
+MatchContext, so the next report is based on the server state. Changes are
+posted as context notices that the menus print in their header.
+"""
+
+import threading
+from typing import Optional
+
+from api_utils import safe_fetch_json_list
+from emoji_config import MENU_EMOJIS
+from match_context import MatchContext
+from match_event_sync import EventDelta, events_list_hash
+from request_scheduler import background_requests
+
+
+def describe_delta(delta: EventDelta) -> str:
+    """Returns a one-line summary of an event list change."""
+    return (
+        f"{len(delta.added)} added, {len(delta.changed)} changed,"
+        f" {len(delta.removed)} removed"
+    )
+
+
+class EventPoller:
+    """Polls fetch_match_events_json with an adaptive interval.
+
+    The interval starts at min_interval, grows by backoff_factor after every
+    poll that finds no change (or fails) and drops back to min_interval as
+    soon as a change is seen, up to max_interval.
+    """
+
+    def __init__(
+        self,
+        match_context: MatchContext,
+        min_interval: float = 5.0,
+        max_interval: float = 60.0,
+        backoff_factor: float = 2.0,
+    ):
+        """Initializes the poller without starting it.
+
+        Args:
+            match_context: The match whose events are polled
+            min_interval: Seconds between polls while events are changing
+            max_interval: Upper bound for the interval while nothing changes
+            backoff_factor: Factor applied to the interval after a quiet poll
+        """
+        self.match_context = match_context
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.interval = min_interval
+        self._last_hash = events_list_hash(match_context.match_events_json or [])
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def poll_once(self) -> Optional[EventDelta]:
+        """Fetches the events once and applies them if they changed.
+
+        A local change made while the fetch was running wins: the fetched
+        list may predate it, so it is dropped and fetched again after
+        min_interval.
+
+        Returns:
+            The applied delta, or None if nothing changed, the fetch failed or
+            the result was dropped
+        """
+        version, _ = self.match_context.snapshot()
+        try:
+            events = safe_fetch_json_list(
+                self.match_context.api_client.fetch_match_events_json,
+                self.match_context.match_id,
+            )
+        except Exception:
+            # Transient API errors are retried on the next (slower) poll
+            self._back_off()
+            return None
+
+        events_hash = events_list_hash(events)
+        if events_hash == self._last_hash:
+            self._back_off()
+            return None
+        self.interval = self.min_interval
+
+        delta = self.match_context.apply_server_events(
+            [dict(event) for event in events], expected_version=version
+        )
+        if delta is None:
+            return None
+        self._last_hash = events_hash
+        if delta.is_empty:
+            # Our own report, already applied by the menu that made it
+            return None
+        self.match_context.post_notice(
+            f"{MENU_EMOJIS['sync']} Events updated on the server:"
+            f" {describe_delta(delta)}"
+        )
+        return delta
+
+    def _back_off(self) -> None:
+        self.interval = min(self.interval * self.backoff_factor, self.max_interval)
+
+    def _run(self) -> None:
+        with background_requests():
+            while not self._stop_event.wait(self.interval):
+                self.poll_once()
+
+    def start(self) -> None:
+        """Starts polling in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="event-poller", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops polling and waits for the thread to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
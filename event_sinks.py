@@ -0,0 +1,417 @@
+"""Fan-out of confirmed match events to local destinations.
+
+Reported events are delivered to several destinations besides FOGIS, such
+as NDJSON files, webhooks and archives. Each destination is an EventSink.
+EventFanout is attached to the match being reported and is notified by
+MatchContext whenever the event list changes; the reporting thread only
+hands the list to a queue.
+
+The fanout thread diffs the confirmed events against the previous list and
+turns the changes into SinkRecords: a "match" record when a match is
+attached, "event" and "control" records for added, changed and removed
+events, and a "score" record whenever the score changes. Every record gets
+a session-wide sequence number and the UTC time of the change.
+
+Each sink has a bounded queue and its own worker thread, which delivers the
+queued records in batches. A slow sink fills its own queue only: records
+that do not fit are dropped and counted rather than blocking the referee,
+and a sink that raises is retried and then skipped without affecting the
+other sinks. Sinks that must see every change, such as the match archive,
+are given an unbounded queue instead.
+"""
+
+import abc
+import json
+import queue
+import threading
+import time
+import urllib.request
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from match_context import MatchContext, Scores, confirmed_events
+from match_event_sync import MatchEventIndex
+
+KIND_MATCH = "match"
+KIND_EVENT = "event"
+KIND_CONTROL = "control"
+KIND_SCORE = "score"
+
+ACTION_ADDED = "added"
+ACTION_CHANGED = "changed"
+ACTION_REMOVED = "removed"
+
+DEFAULT_MAX_QUEUE = 1000
+DEFAULT_MAX_BATCH = 100
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY = 1.0
+
+# Intake items: (timestamp, match context, events), or None to stop
+_Intake = Optional[Tuple[str, MatchContext, List[Dict[str, Any]]]]
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+@dataclass(frozen=True)
+class SinkRecord:
+    """One change delivered to the sinks."""
+
+    seq: int  # Increases by one per record for the whole session
+    ts: str  # UTC time of the change, ISO 8601
+    kind: str  # One of the KIND_* constants
+    fields: Dict[str, Any]
+    # The FOGIS event of event and control records; not part of to_dict()
+    source: Optional[Dict[str, Any]] = field(default=None, compare=False, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the record as a flat JSON-serializable dictionary."""
+        record = {"seq": self.seq, "ts": self.ts, "kind": self.kind}
+        record.update(self.fields)
+        return record
+
+
+class EventSink(abc.ABC):
+    """A destination for SinkRecords.
+
+    deliver() is called from the sink's own worker thread with batches of
+    records in sequence order. It may block; raising an exception marks
+    the batch as failed and it is retried.
+    """
+
+    name = "sink"
+
+    @abc.abstractmethod
+    def deliver(self, records: List[SinkRecord]) -> None:
+        """Delivers a batch of records."""
+
+    def close(self) -> None:
+        """Releases the sink's resources after the last delivery."""
+
+
+class WebhookSink(EventSink):
+    """POSTs each batch as {"records": [...]} in a JSON body to a URL."""
+
+    name = "webhook"
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        """Initializes the sink.
+
+        Args:
+            url: The URL posted to
+            timeout: Seconds to wait for the receiver
+        """
+        self.url = url
+        self.timeout = timeout
+
+    def deliver(self, records: List[SinkRecord]) -> None:
+        """Posts the batch; any error or non-2xx status fails the batch."""
+        body = json.dumps(
+            {"records": [record.to_dict() for record in records]},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        request = urllib.request.Request(
+            self.url,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            if not 200 <= response.status < 300:
+                raise OSError(f"{self.url} answered {response.status}")
+
+
+@dataclass
+class SinkStats:
+    """Delivery counters of one sink."""
+
+    delivered: int = 0
+    dropped: int = 0  # Records that did not fit in the queue
+    failed: int = 0  # Records given up after max_attempts
+    batches: int = 0
+    last_error: Optional[str] = None
+
+
+@dataclass
+class _SinkWorker:
+    sink: EventSink
+    records: "queue.Queue[Optional[SinkRecord]]"
+    max_batch: int
+    stats: SinkStats = field(default_factory=SinkStats)
+    # Guards stats, which the fanout and the worker thread both update
+    stats_lock: threading.Lock = field(default_factory=threading.Lock)
+    thread: Optional[threading.Thread] = None
+
+
+class EventFanout:
+    """Delivers the confirmed changes of the attached match to every sink."""
+
+    def __init__(
+        self,
+        event_types: Dict[int, Dict[str, Any]],
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initializes the fanout and starts its thread.
+
+        Args:
+            event_types: Event type id -> {"name": ..., "control_event": ...},
+                as in fogis_api_client
+            max_attempts: Deliveries of a batch before it is given up
+            retry_delay: Seconds before the first retry, doubled per retry
+            sleep: Replaceable for testing
+        """
+        self.event_types = event_types
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._sleep = sleep
+        self.sequence = 0
+        self._workers: List[_SinkWorker] = []
+        self._intake: "queue.SimpleQueue[_Intake]" = queue.SimpleQueue()
+        self._context: Optional[MatchContext] = None
+        # Receives delivery warnings; kept after detach for late failures
+        self._notice_context: Optional[MatchContext] = None
+        # Confirmed events of the match last diffed, owned by the fanout thread
+        self._index: Optional[MatchEventIndex] = None
+        self._index_context: Optional[MatchContext] = None
+        self._scores: Optional[Tuple[int, int, int, int]] = None
+        self._thread = threading.Thread(
+            target=self._run, name="event-fanout", daemon=True
+        )
+        self._thread.start()
+
+    def add_sink(
+        self,
+        sink: EventSink,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        """Starts delivering to a sink.
+
+        Args:
+            sink: The destination
+            max_queue: Records queued for the sink before new ones are dropped;
+                0 queues without limit, for sinks that must not miss a record
+            max_batch: Largest number of records per deliver() call
+        """
+        worker = _SinkWorker(sink, queue.Queue(max_queue), max_batch)
+        worker.thread = threading.Thread(
+            target=self._deliver_loop,
+            args=(worker,),
+            name=f"sink-{sink.name}",
+            daemon=True,
+        )
+        worker.thread.start()
+        self._workers.append(worker)
+
+    def stats(self) -> Dict[str, SinkStats]:
+        """Returns a copy of the counters of every sink by name."""
+        stats = {}
+        for worker in self._workers:
+            with worker.stats_lock:
+                stats[worker.sink.name] = replace(worker.stats)
+        return stats
+
+    def attach(self, match_context: MatchContext) -> None:
+        """Delivers a match record, the current state, then every change."""
+        self.detach()
+        self._context = match_context
+        self._notice_context = match_context
+        match_context.add_listener(self._on_change)
+        _, events = match_context.snapshot()
+        self._intake.put((_utc_now(), match_context, events))
+
+    def detach(self) -> None:
+        """Stops delivering the changes of the attached match."""
+        if self._context is not None:
+            self._context.remove_listener(self._on_change)
+            self._context = None
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Delivers the queued records, then stops the threads and sinks.
+
+        Args:
+            timeout: Seconds to wait for each sink to finish
+        """
+        self.detach()
+        self._intake.put(None)
+        self._thread.join()
+        for worker in self._workers:
+            try:
+                worker.records.put(None, timeout=timeout)
+            except queue.Full:
+                continue  # The sink is stuck; its daemon thread is abandoned
+            if worker.thread is not None:
+                worker.thread.join(timeout)
+        for worker in self._workers:
+            worker.sink.close()
+
+    def _on_change(self, version: int, events: List[Dict[str, Any]]) -> None:
+        # Runs in the reporting thread under the context lock: hand off only
+        context = self._context
+        if context is not None:
+            self._intake.put((_utc_now(), context, events))
+
+    def _run(self) -> None:
+        while True:
+            item = self._intake.get()
+            if item is None:
+                return
+            for record in self._records_for(*item):
+                for worker in self._workers:
+                    try:
+                        worker.records.put_nowait(record)
+                    except queue.Full:
+                        with worker.stats_lock:
+                            worker.stats.dropped += 1
+
+    def _deliver_loop(self, worker: _SinkWorker) -> None:
+        while True:
+            record = worker.records.get()
+            if record is None:
+                return
+            batch = [record]
+            stop = False
+            while len(batch) < worker.max_batch:
+                try:
+                    record = worker.records.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    stop = True
+                    break
+                batch.append(record)
+            self._deliver(worker, batch)
+            if stop:
+                return
+
+    def _deliver(self, worker: _SinkWorker, batch: List[SinkRecord]) -> None:
+        delay = self.retry_delay
+        error = None
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                worker.sink.deliver(batch)
+            except Exception as e:
+                error = str(e)
+                with worker.stats_lock:
+                    worker.stats.last_error = error
+                if attempt < self.max_attempts:
+                    self._sleep(delay)
+                    delay *= 2
+                continue
+            with worker.stats_lock:
+                worker.stats.delivered += len(batch)
+                worker.stats.batches += 1
+            return
+        with worker.stats_lock:
+            worker.stats.failed += len(batch)
+        context = self._notice_context
+        if context is not None:
+            context.post_notice(
+                f"Warning: {len(batch)} events could not be delivered to"
+                f" {worker.sink.name}: {error}"
+            )
+
+    def _record(
+        self,
+        timestamp: str,
+        kind: str,
+        fields: Dict[str, Any],
+        source: Optional[Dict[str, Any]] = None,
+    ) -> SinkRecord:
+        self.sequence += 1
+        return SinkRecord(self.sequence, timestamp, kind, fields, source)
+
+    def _records_for(
+        self, timestamp: str, context: MatchContext, events: List[Dict[str, Any]]
+    ) -> List[SinkRecord]:
+        records = []
+        if self._index is None or self._index_context is not context:
+            self._index = MatchEventIndex(context.team1_id, context.team2_id)
+            self._index_context = context
+            self._scores = None
+            records.append(
+                self._record(
+                    timestamp,
+                    KIND_MATCH,
+                    {
+                        "match_id": context.match_id,
+                        "home": context.team1_name,
+                        "away": context.team2_name,
+                    },
+                )
+            )
+
+        delta = self._index.apply(confirmed_events(events))
+        for action, changed in (
+            (ACTION_ADDED, delta.added),
+            (ACTION_CHANGED, delta.changed),
+            (ACTION_REMOVED, delta.removed),
+        ):
+            for event in changed:
+                records.append(self._event_record(timestamp, context, action, event))
+
+        scores = self._index.scores()
+        score_key = _score_key(scores)
+        if score_key != self._scores:
+            self._scores = score_key
+            records.append(
+                self._record(
+                    timestamp,
+                    KIND_SCORE,
+                    {
+                        "match_id": context.match_id,
+                        "home": scores.regular_time.home,
+                        "away": scores.regular_time.away,
+                        "halftime_home": scores.halftime.home,
+                        "halftime_away": scores.halftime.away,
+                    },
+                )
+            )
+        return records
+
+    def _event_record(
+        self,
+        timestamp: str,
+        context: MatchContext,
+        action: str,
+        event: Dict[str, Any],
+    ) -> SinkRecord:
+        event_type = self.event_types.get(event.get("matchhandelsetypid", 0), {})
+        team_id = event.get("matchlagid")
+        if team_id == context.team1_id:
+            team = context.team1_name
+        elif team_id == context.team2_id:
+            team = context.team2_name
+        else:
+            team = None
+        kind = KIND_CONTROL if event_type.get("control_event") else KIND_EVENT
+        return self._record(
+            timestamp,
+            kind,
+            {
+                "action": action,
+                "match_id": context.match_id,
+                "event_id": event.get("matchhandelseid"),
+                "type_id": event.get("matchhandelsetypid"),
+                "type": event_type.get("name"),
+                "team": team,
+                "period": event.get("period"),
+                "minute": event.get("matchminut"),
+                "jersey": event.get("trojnummer"),
+                "jersey_out": event.get("trojnummer2"),
+            },
+            event,
+        )
+
+
+def _score_key(scores: Scores) -> Tuple[int, int, int, int]:
+    return (
+        scores.regular_time.home,
+        scores.regular_time.away,
+        scores.halftime.home,
+        scores.halftime.away,
+    )
@@ -0,0 +1,40 @@
+"""NDJSON stream of reported events for downstream consumers.
+
+Scoreboards and social feeds want events as they are reported. NdjsonSink
+writes every SinkRecord from the EventFanout as one compact JSON object per
+line: confirmed match events, control events and score changes, each with
+its session-wide sequence number and the UTC time of the change, so a
+consumer tailing the stream can detect gaps and order lines from several
+sessions. Lines are written by the sink's worker thread and flushed after
+every batch.
+"""
+
+import json
+from typing import List, TextIO
+
+from event_sinks import EventSink, SinkRecord
+
+
+class NdjsonSink(EventSink):
+    """Writes records as NDJSON lines to a text stream."""
+
+    name = "ndjson"
+
+    def __init__(self, stream: TextIO):
+        """Initializes the sink.
+
+        Args:
+            stream: The text stream written to; not closed by the sink
+        """
+        self.stream = stream
+
+    def deliver(self, records: List[SinkRecord]) -> None:
+        """Writes and flushes one line per record."""
+        self.stream.write(
+            "".join(
+                json.dumps(record.to_dict(), ensure_ascii=False, separators=(",", ":"))
+                + "\n"
+                for record in records
+            )
+        )
+        self.stream.flush()
@@ -0,0 +1,121 @@
+"""Idempotent submission of new match events.
+
+report_match_event can fail after the server has already stored the event,
+for example when the response times out. Blindly retrying would then create a
+duplicate goal or card and corrupt the running score. submit_event() counts
+the payload's fingerprint in the server event list before every retry and
+stops as soon as the server has the event, so retries are always safe.
+
+A submission can also fail on every attempt after the server stored it. The
+caller may pass a dictionary in which submit_event() keeps the fingerprints
+of such unresolved submissions. When the referee reports the same event
+again, the server list is checked before it is sent.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from fogis_api_client.fogis_api_client import FogisAPIRequestError, FogisApiClient
+
+from api_utils import safe_fetch_json_list
+from match_event_sync import EventFingerprint, event_fingerprint, fingerprint_counts
+
+# Errors after which the event may or may not have been stored
+RETRYABLE_ERRORS = (FogisAPIRequestError, ConnectionError, TimeoutError)
+
+
+@dataclass
+class SubmissionResult:
+    """Outcome of submit_event()."""
+
+    response: Any  # API response, None if the event was found on the server
+    attempts: int  # Number of report_match_event calls made
+    # True if a failed attempt had stored the event and no retry was needed
+    already_stored: bool = False
+    # The server's copy of the event if already_stored
+    stored_event: Optional[Dict[str, Any]] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """True if the server has the event."""
+        return self.already_stored or self.response is not None
+
+
+def submit_event(
+    api_client: FogisApiClient,
+    match_id: int,
+    payload: Dict[str, Any],
+    known_events: List[Dict[str, Any]],
+    unresolved: Optional[Dict[EventFingerprint, int]] = None,
+    max_attempts: int = 3,
+    retry_delay: float = 1.0,
+    sleep: Callable[[float], None] = time.sleep,
+) -> SubmissionResult:
+    """Reports an event, retrying transport errors without creating duplicates.
+
+    Args:
+        api_client: The API client
+        match_id: The match the event belongs to
+        payload: The event payload for report_match_event
+        known_events: The server events as known before this submission
+        unresolved: Fingerprint -> stored count before the submission, for
+            submissions whose every attempt failed; updated by this call
+        max_attempts: Maximum number of attempts
+        retry_delay: Delay before the first retry in seconds, doubled after
+            every further failure
+        sleep: Replaceable for testing
+
+    Returns:
+        The result of the successful attempt
+
+    Raises:
+        FogisAPIRequestError: Or another retryable error, if every attempt
+            failed and the event is not on the server
+    """
+    if payload.get("matchhandelseid"):
+        # Updates carry their id and are idempotent on the server
+        return SubmissionResult(api_client.report_match_event(payload), 1)
+
+    fingerprint = event_fingerprint(payload)
+    stored_before = fingerprint_counts(known_events)[fingerprint]
+    # An earlier submission of this event may have been stored after all
+    earlier = unresolved.pop(fingerprint, None) if unresolved is not None else None
+    check_server = earlier is not None
+    if earlier is not None:
+        stored_before = earlier
+    delay = retry_delay
+    last_error: Optional[Exception] = None
+    calls = 0
+    for _ in range(max_attempts):
+        if last_error is not None:
+            sleep(delay)
+            delay *= 2
+        if last_error is not None or check_server:
+            try:
+                server_events = safe_fetch_json_list(
+                    api_client.fetch_match_events_json, match_id
+                )
+            except RETRYABLE_ERRORS as e:
+                # Without the server list a retry could create a duplicate
+                last_error = e
+                continue
+            if fingerprint_counts(server_events)[fingerprint] > stored_before:
+                stored_event = [
+                    event
+                    for event in server_events
+                    if event_fingerprint(event) == fingerprint
+                ][-1]
+                return SubmissionResult(
+                    None, calls, already_stored=True, stored_event=stored_event
+                )
+            check_server = False
+        calls += 1
+        try:
+            return SubmissionResult(api_client.report_match_event(payload), calls)
+        except RETRYABLE_ERRORS as e:
+            last_error = e
+    assert last_error is not None
+    if unresolved is not None:
+        unresolved[fingerprint] = stored_before
+    raise last_error
@@ -3,6 +3,7 @@
 from typing import Any, Dict, List, Optional
 
 from match_context import MatchContext, Score, Scores
+from match_event_sync import GOAL_EVENT_TYPE_IDS
 
 
 class FogisDataParser:
@@ -80,7 +81,7 @@ class FogisDataParser:
 
         for event in match_events_json:
             # Goal event types (regular, penalty, own goal, etc.)
-            if event['matchhandelsetypid'] in [6, 39, 28, 29, 15, 14]:
+            if event['matchhandelsetypid'] in GOAL_EVENT_TYPE_IDS:
                 if event['matchlagid'] == team1_id:
                     team1_score += 1
                     if event['period'] == 1:
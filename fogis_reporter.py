@@ -3,24 +3,83 @@
 This module provides functionality for fogis reporter.
 """
 
+import argparse
 import json
 import os
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+import sqlite3
+import time
+from contextlib import ExitStack
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 from fogis_api_client.fogis_api_client import (
     EVENT_TYPES,
+    FogisAPIRequestError,
     FogisApiClient,
+    FogisDataError,
     FogisLoginError,
 )
 
 # Import safe API wrapper
 from api_utils import safe_fetch_json_list
 
+from control_event_planner import (
+    CONTROL_EVENT_NAMES,
+    PERIOD_START,
+    PlannedEvent,
+    control_event_lookup,
+    plan_control_event,
+)
+
 # Import emoji dictionaries
 from emoji_config import EVENT_EMOJIS, MENU_EMOJIS
+from event_payload_builder import EventPayloadBuilder, payload_builder_for
+from event_poller import EventPoller
+from event_sinks import EventFanout, WebhookSink
+from event_stream import NdjsonSink
+from event_submission import submit_event
 from fogis_data_parser import FogisDataParser
-from match_context import MatchContext, Score, Scores
+from match_archive import ArchiveSink, MatchArchive
+from match_clock import LiveMatchClock, get_match_clock, match_clock_for
+from match_context import MatchContext, Score, Scores, confirmed_events
+from match_dashboard import DashboardActions, MatchDashboard, dashboard_available
+from match_event_sync import MatchEventIndex
 from match_event_table_formatter import MatchEventTableFormatter
+from match_report_export import (
+    EXPORTERS,
+    FORMAT_MARKDOWN,
+    export_matches,
+    open_output,
+    summarize_match,
+)
+from optimistic_reporting import OptimisticReporter
+from request_scheduler import (
+    DEFAULT_BURST,
+    DEFAULT_RATE,
+    RequestScheduler,
+    ScheduledApiClient,
+    TokenBucket,
+)
+from result_validation import validate_results
+from results_pipeline import ResultsPipeline, poll_with_backoff
+from score_reconciliation import plan_score_corrections
+from scoreboard_server import ScoreboardServer
+from screen_writer import ScreenWriter
+from single_flight import CoalescingApiClient
+
+# Menu frames are written in one go; a menu shown again after an invalid
+# choice is not redrawn
+_screen = ScreenWriter(skip_unchanged=True)
 
 
 def select_match_interactively(matches):
@@ -75,86 +134,169 @@ def _parse_minute_input(
     extra_period_length_arg: int,
 ) -> Tuple[int, int]:
     """Parses the minute input from the user, handling regular time and extra time."""
+    return get_match_clock(
+        num_periods_arg,
+        period_length_arg,
+        num_extra_periods_arg,
+        extra_period_length_arg,
+    ).parse_minute(minute_str_arg)
+
+
+def _prompt_event_time(
+    match_context: MatchContext, prompt_text: str
+) -> Tuple[int, int, int]:
+    """Asks for the time of an event and returns (minute, period, second).
+
+    While the live match clock is running, the current match time is offered
+    as the default and accepted by pressing Enter.
+
+    Raises:
+        ValueError: If the entered minute is invalid
+    """
+    live_clock = match_context.live_clock
+    reading = live_clock.reading() if live_clock is not None else None
+    if reading is not None and reading.running:
+        minute_str = input(
+            f"{prompt_text.rstrip(': ')} [Enter = {reading.display}]: "
+        )
+        if minute_str.strip() == "":
+            return reading.minute, reading.period, reading.second
+    else:
+        minute_str = input(prompt_text)
+    minute, period = _parse_minute_input(
+        minute_str,
+        match_context.num_periods,
+        match_context.period_length,
+        match_context.num_extra_periods,
+        match_context.extra_period_length,
+    )
+    return minute, period, 0
+
+
+def _current_score_line(match_context: MatchContext, scores: Scores) -> str:
+    """Returns the CURRENT SCORE line of the menu headers."""
+    return (
+        f"CURRENT SCORE: {match_context.team1_name} {scores.regular_time.home} -"
+        f" {scores.regular_time.away} {match_context.team2_name}"
+    )
+
+
+def _run_requested_reconciliation(match_context: MatchContext) -> None:
+    """Runs a running score check requested by a background thread."""
+    if match_context.reconcile_requested.is_set():
+        match_context.reconcile_requested.clear()
+        _reconcile_running_scores(match_context)
+
+
+def _print_event_notices(match_context: MatchContext) -> None:
+    """Prints messages from background polling and reporting."""
+    for notice in match_context.drain_notices():
+        print(notice)
+
+
+def _start_event_poller(match_context: MatchContext) -> None:
+    """Starts background event polling if FOGIS_POLL_INTERVAL is set.
+
+    FOGIS_POLL_INTERVAL is the shortest interval between polls in seconds;
+    unset or 0 disables polling.
+    """
     try:
-        if "+" in minute_str_arg:
-            parts = minute_str_arg.split("+")
-            minute_parsed = int(parts[0])
-            stoppage_time = (
-                int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
-            )
-            # Assuming stoppage time is always added to the last minute of the current period
-            total_regular_time = num_periods_arg * period_length_arg
-            if minute_parsed > total_regular_time:
-                raise ValueError(
-                    "Invalid minute. Stoppage time can only be added to the last"
-                    "minute of regular time."
-                )
-            # Determine which period the minute belongs to
-            period_calculated = (minute_parsed - 1) // period_length_arg + 1
-            minute_parsed += stoppage_time  # Apply stoppage time
-        else:
-            minute_parsed = int(minute_str_arg)
-            total_regular_time = num_periods_arg * period_length_arg
-            total_extra_time = num_extra_periods_arg * extra_period_length_arg
-            if (
-                minute_parsed <= 0
-                or minute_parsed > total_regular_time + total_extra_time
-            ):
-                raise ValueError(
-                    "Invalid minute. Please enter a value within the valid range."
-                )
-            if minute_parsed <= total_regular_time:
-                # Determine which period the minute belongs to
-                period_calculated = (minute_parsed - 1) // period_length_arg + 1
-            else:
-                # Extra time period calculation
-                extra_time_start = total_regular_time
-                period_calculated = num_periods_arg + (
-                    (minute_parsed - extra_time_start - 1) // extra_period_length_arg
-                    + 1
-                )
+        min_interval = float(os.environ.get("FOGIS_POLL_INTERVAL", "0"))
+    except ValueError:
+        print("Warning: FOGIS_POLL_INTERVAL must be a number of seconds.")
+        return
+    if min_interval <= 0:
+        return
+    match_context.event_poller = EventPoller(
+        match_context,
+        min_interval=min_interval,
+        max_interval=max(min_interval, 60.0),
+    )
+    match_context.event_poller.start()
+
+
+def _dashboard_actions() -> DashboardActions:
+    """Returns the main menu entries as dashboard commands."""
+    return {
+        "1": ("events", report_match_events_menu),
+        "2": ("time", report_control_events_menu),
+        "3": ("staff", report_staff_events_menu),
+        "4": ("results", report_results_menu),
+        "5": ("export", export_match_report_menu),
+    }
+
+
+def _run_match_menus(match_context: MatchContext) -> None:
+    """Shows the full-screen dashboard if FOGIS_DASHBOARD is set, else the menus.
+
+    Falls back to the menus when the terminal does not support the dashboard.
+    """
+    if os.environ.get("FOGIS_DASHBOARD", "").lower() in ("1", "true", "yes"):
+        if dashboard_available():
+            MatchDashboard(match_context, EVENT_TYPES, _dashboard_actions()).run()
+            return
+        print("The dashboard needs an interactive terminal; showing the menus.")
+    display_main_menu(match_context)
+
 
-        return minute_parsed, period_calculated
+def _create_request_scheduler() -> Optional[RequestScheduler]:
+    """Creates the outbound request scheduler from the environment.
 
-    except ValueError as err:
-        raise ValueError(f"Invalid minute format: {err}")
+    FOGIS_RATE_LIMIT is the sustained number of API requests per second and
+    FOGIS_RATE_BURST the number that may be sent at once; a rate of 0
+    disables rate limiting.
+    """
+    try:
+        rate = float(os.environ.get("FOGIS_RATE_LIMIT", DEFAULT_RATE))
+        burst = int(os.environ.get("FOGIS_RATE_BURST", DEFAULT_BURST))
+    except ValueError:
+        print("Warning: FOGIS_RATE_LIMIT and FOGIS_RATE_BURST must be numbers.")
+        rate, burst = DEFAULT_RATE, DEFAULT_BURST
+    if rate <= 0:
+        return None
+    return RequestScheduler(TokenBucket(rate, max(1, burst)))
 
 
 def display_main_menu(match_context: MatchContext):
     """Displays the main menu with different event categories."""
     while True:
+        _run_requested_reconciliation(match_context)
         # Get current scores for display
         scores = match_context.scores
 
-        # Create a more visually appealing header with match info and current score
-        print("\n" + "=" * 60)
-        print(f"  MATCH: {match_context.team1_name} vs {match_context.team2_name}")
-        print(
-            f"CURRENT SCORE: {match_context.team1_name} {scores.regular_time.home} -"
-            "{scores.regular_time.away} {match_context.team2_name}"
-        )
-        print("=" * 60)
-
-        # Main menu options with better spacing and organization
-        print("\nMAIN MENU - Select an option:")
-        print(
-            f"1: {MENU_EMOJIS['report_events']} Report Match Events (goals, cards,"
-            "substitutions)"
-        )
-        print(
-            f"2: {MENU_EMOJIS['control_events']} Report Time Events (period start/end,"
-            "game end)"
-        )
-        print(
-            f"3: {MENU_EMOJIS['staff_events']} Report Staff Events (coach cards, officials)"
-        )
-        print(f"4: {MENU_EMOJIS['report_results']} Report Final Match Results")
-        print(
-            f"\n {MENU_EMOJIS['back']} Enter empty string to return to match selection"
-        )
-        print("-" * 60)
+        with _screen.frame() as frame:
+            # Header with match info and current score
+            frame.line("\n" + "=" * 60)
+            frame.line(
+                f"  MATCH: {match_context.team1_name} vs {match_context.team2_name}"
+            )
+            frame.line(_current_score_line(match_context, scores))
+            frame.lines(match_context.drain_notices())
+            frame.line("=" * 60)
+
+            # Main menu options with better spacing and organization
+            frame.line("\nMAIN MENU - Select an option:")
+            frame.line(
+                f"1: {MENU_EMOJIS['report_events']} Report Match Events (goals, cards,"
+                " substitutions)"
+            )
+            frame.line(
+                f"2: {MENU_EMOJIS['control_events']} Report Time Events (period"
+                " start/end, game end)"
+            )
+            frame.line(
+                f"3: {MENU_EMOJIS['staff_events']} Report Staff Events (coach cards,"
+                " officials)"
+            )
+            frame.line(f"4: {MENU_EMOJIS['report_results']} Report Final Match Results")
+            frame.line(f"5: {MENU_EMOJIS['export']} Export Match Report")
+            frame.line(
+                f"\n {MENU_EMOJIS['back']} Enter empty string to return to match"
+                " selection"
+            )
+            frame.line("-" * 60)
 
-        choice = input("Select option [1-4]: ")
+        choice = input("Select option [1-5]: ")
 
         if choice == "":
             return
@@ -166,40 +308,86 @@ def display_main_menu(match_context: MatchContext):
             report_staff_events_menu(match_context)
         elif choice == "4":
             report_results_menu(match_context)
+        elif choice == "5":
+            export_match_report_menu(match_context)
         else:
             print("Invalid option. Please try again.")
+            _screen.retain_frame()
+
+
+def export_match_report_menu(match_context: MatchContext):
+    """Exports the confirmed events and scores of the match to a file or screen."""
+    formats = ", ".join(EXPORTERS)
+    export_format = input(f"Export format ({formats}) [markdown]: ").strip().lower()
+    if not export_format:
+        export_format = FORMAT_MARKDOWN
+    if export_format not in EXPORTERS:
+        print(f"Unknown format. Choose one of: {formats}")
+        return
+    path = input("File to write (empty for screen): ").strip() or None
+
+    formatter = _get_table_formatter(
+        match_context.team1_name,
+        match_context.team2_name,
+        match_context.team1_id,
+        match_context.team2_id,
+    )
+    _, events = match_context.snapshot()
+    events = confirmed_events(events)
+    match_index = MatchEventIndex(match_context.team1_id, match_context.team2_id)
+    match_index.apply(events)
+    summary = summarize_match(
+        formatter, match_context.match_id, events, match_index.scores()
+    )
+    try:
+        with open_output(path) as stream:
+            export_matches([summary], export_format, stream)
+    except OSError as e:
+        print(f"Error: Could not write {path}: {e}")
+        return
+    if path is not None:
+        print(f"Match report written to {path}")
 
 
 def report_match_events_menu(match_context: MatchContext):
     """Menu for reporting match events (goals, cards, etc.)"""
     while True:
+        _run_requested_reconciliation(match_context)
         # Get current scores for display
         scores = match_context.scores
 
-        # Create a more visually appealing header with match info and current score
-        print("\n" + "=" * 60)
-        print(
-            f"MATCH EVENTS - {match_context.team1_name} vs {match_context.team2_name}"
-        )
-        print(
-            f"CURRENT SCORE: {match_context.team1_name} {scores.regular_time.home} - {scores.regular_time.away} {match_context.team2_name}"
-        )
-        print("=" * 60)
-
-        # Team selection with better formatting
-        print("\nSelect a team to report events for:")
-        print(
-            f"1: {MENU_EMOJIS['team1_events']} {match_context.team1_name} (Home Team)"
-        )
-        print(
-            f"2: {MENU_EMOJIS['team2_events']} {match_context.team2_name} (Away Team)"
-        )
-        print("\nOther options:")
-        print(f"  3: {MENU_EMOJIS['clear_events']} Clear all recorded events")
-        print(f"\n  {MENU_EMOJIS['back']} Enter empty string to return to main menu")
-        print("-" * 60)
+        with _screen.frame() as frame:
+            # Header with match info and current score
+            frame.line("\n" + "=" * 60)
+            frame.line(
+                f"MATCH EVENTS - {match_context.team1_name} vs"
+                f" {match_context.team2_name}"
+            )
+            frame.line(_current_score_line(match_context, scores))
+            frame.lines(match_context.drain_notices())
+            frame.line("=" * 60)
+
+            # Team selection with better formatting
+            frame.line("\nSelect a team to report events for:")
+            frame.line(
+                f"1: {MENU_EMOJIS['team1_events']} {match_context.team1_name}"
+                " (Home Team)"
+            )
+            frame.line(
+                f"2: {MENU_EMOJIS['team2_events']} {match_context.team2_name}"
+                " (Away Team)"
+            )
+            frame.line("\nOther options:")
+            frame.line(f"  3: {MENU_EMOJIS['clear_events']} Clear all recorded events")
+            frame.line(
+                f"  4: {MENU_EMOJIS['edit_events']} Edit or delete a single event"
+            )
+            frame.line(
+                f"\n  {MENU_EMOJIS['back']} Enter empty string to return to main menu"
+            )
+            frame.line("-" * 60)
 
-        choice = input("Select option [1-3]: ")
+        choice = input("Select option [1-4]: ")
 
         if choice == "":
             return
@@ -213,12 +401,16 @@ def report_match_events_menu(match_context: MatchContext):
             )
             if confirm.lower() == "clear":
                 new_events = _handle_clear_events(match_context)
-                match_context.match_events_json = new_events
+                match_context.apply_server_events(new_events)
                 _display_current_events_table(match_context)
             else:
                 print("Clear operation cancelled.")
+        elif choice == "4":
+            if _handle_edit_or_delete_event(match_context):
+                _display_current_events_table(match_context)
         else:
             print("Invalid option. Please try again.")
+            _screen.retain_frame()
 
 
 def report_team_event(match_context: MatchContext, team_number: int):
@@ -239,12 +431,13 @@ def report_team_event(match_context: MatchContext, team_number: int):
     )
 
     # Display event type options
-    print(f"\n--- Event Types for {team_name} ---")
-    print("1: ⚽ Goal (NEW: Enter jersey number or goal type code)")
-    print("2: 🟨 Card (Yellow/Red)")
-    print("3: 🔄 Substitution")
-    print("4: 👨‍💼 Team Official Action")
-    print(f"{MENU_EMOJIS['back']} Enter empty string to go back")
+    with _screen.frame() as frame:
+        frame.line(f"\n--- Event Types for {team_name} ---")
+        frame.line("1: ⚽ Goal (NEW: Enter jersey number or goal type code)")
+        frame.line("2: 🟨 Card (Yellow/Red)")
+        frame.line("3: 🔄 Substitution")
+        frame.line("4: 👨‍💼 Team Official Action")
+        frame.line(f"{MENU_EMOJIS['back']} Enter empty string to go back")
 
     event_category = input("Select event category: ")
 
@@ -259,7 +452,9 @@ def report_team_event(match_context: MatchContext, team_number: int):
             team2_score,
         )
         if new_events is not None:
-            match_context.match_events_json = new_events
+            match_context.apply_server_events(new_events)
+            # A late goal changes the running score of every later event
+            _reconcile_running_scores(match_context)
             _display_current_events_table(
                 match_context
             )  # Display table after goal reporting
@@ -288,11 +483,12 @@ def report_team_event(match_context: MatchContext, team_number: int):
                     team2_score,
                 )
                 if new_events is not None:
-                    match_context.match_events_json = new_events
+                    match_context.apply_server_events(new_events)
+                    _reconcile_running_scores(match_context)
             elif selected_event_type["name"] == "Team Official Action":
                 new_events = _report_team_official_action_event(match_context)
                 if new_events is not None:
-                    match_context.match_events_json = new_events
+                    match_context.apply_server_events(new_events)
             else:
                 new_events = _report_player_event(
                     match_context,
@@ -303,7 +499,8 @@ def report_team_event(match_context: MatchContext, team_number: int):
                     team2_score,
                 )
                 if new_events is not None:
-                    match_context.match_events_json = new_events
+                    match_context.apply_server_events(new_events)
+                    _reconcile_running_scores(match_context)
 
                 if (
                     match_context.match_events_json is not None
@@ -333,48 +530,7 @@ def _determine_event_type_from_timestamp(
     Raises:
         ValueError: If the timestamp is invalid or doesn't map to a specific event
     """
-    num_periods = match_context.num_periods
-    period_length = match_context.period_length
-    num_extra_periods = match_context.num_extra_periods
-    extra_period_length = match_context.extra_period_length
-
-    # Calculate period boundaries
-    period_boundaries = []
-    for i in range(1, num_periods + 1):
-        start_minute = 1 + (i - 1) * period_length
-        end_minute = i * period_length
-        period_boundaries.append((start_minute, end_minute, i))
-
-    # Add extra time periods if applicable
-    if num_extra_periods > 0:
-        regular_time_end = num_periods * period_length
-        for i in range(1, num_extra_periods + 1):
-            start_minute = regular_time_end + 1 + (i - 1) * extra_period_length
-            end_minute = regular_time_end + i * extra_period_length
-            period = num_periods + i
-            period_boundaries.append((start_minute, end_minute, period))
-
-    # Determine event type based on timestamp
-    for start, end, period in period_boundaries:
-        if timestamp == start:
-            # Period Start
-            return 31, "Period Start", period
-        if timestamp == end or (timestamp > end and "+" in str(timestamp)):
-            # Period End
-            if period == num_periods and num_extra_periods == 0:
-                # Last period of regular time with no extra time - both Period End and Game End
-                return 33, "Game End", period
-            if period == num_periods + num_extra_periods and num_extra_periods > 0:
-                # Last period of extra time - both Period End and Game End
-                return 33, "Game End", period
-            else:
-                # Regular period end
-                return 32, "Period End", period
-
-    # If we get here, the timestamp doesn't map to a specific event
-    raise ValueError(
-        f"Timestamp {timestamp} doesn't correspond to a period start or end."
-    )
+    return match_clock_for(match_context).classify_timestamp(timestamp)
 
 
 def _report_smart_control_event(
@@ -385,7 +541,6 @@ def _report_smart_control_event(
     time_input: str,
 ):
     """Reports a control event based on smart timestamp detection."""
-    match_id = match_context.match_id
     team1_score = match_context.scores.regular_time.home
     team2_score = match_context.scores.regular_time.away
 
@@ -400,25 +555,9 @@ def _report_smart_control_event(
         )
 
         # Create the control event JSON in the correct API format
-        control_event = {
-            "matchhandelseid": 0,
-            "matchid": match_id,
-            "period": period,
-            "matchminut": match_minute,
-            "sekund": 0,
-            "matchhandelsetypid": event_type_id,
-            "matchlagid": 0,
-            "spelareid": 0,
-            "spelareid2": 0,
-            "planpositionx": "-1",
-            "planpositiony": "-1",
-            "matchdeltagareid": 0,
-            "matchdeltagareid2": 0,
-            "fotbollstypId": 1,
-            "relateradTillMatchhandelseID": 0,
-            "hemmamal": team1_score,
-            "bortamal": team2_score,
-        }
+        control_event = payload_builder_for(match_context).control(
+            event_type_id, period, match_minute, team1_score, team2_score
+        )
 
         # Handle automatic period start and period end logic AND API reporting
         _add_control_event_with_implicit_events(control_event, match_context)
@@ -428,91 +567,93 @@ def _report_smart_control_event(
         print(f"Error: {e}")
 
 
+def _report_next_period_start(match_context: MatchContext) -> None:
+    """Reports the Period Start of the first period that has not started."""
+    lookup = control_event_lookup(match_context.match_events_json or [])
+    model = match_clock_for(match_context)
+    for boundary in model.boundaries:
+        if (PERIOD_START, boundary.period) not in lookup:
+            _report_smart_control_event(
+                match_context,
+                PERIOD_START,
+                "Period Start",
+                boundary.period,
+                str(boundary.start_minute),
+            )
+            return
+    print("Every period of the match has already started.")
+
+
 def report_control_events_menu(match_context: MatchContext):
     """Menu for reporting control events (period end, game end) with smart timestamp detection"""
     while True:
+        _run_requested_reconciliation(match_context)
         # Get current scores for display
         scores = match_context.scores
 
-        # Create a more visually appealing header with match info
-        print("\n" + "=" * 60)
-        print(
-            f"TIME CONTROL EVENTS - {match_context.team1_name} vs"
-            "{match_context.team2_name}"
-        )
-        print(
-            f"CURRENT SCORE: {match_context.team1_name} {scores.regular_time.home} -"
-            "{scores.regular_time.away} {match_context.team2_name}"
-        )
-        print("=" * 60)
-
-        # Calculate period boundaries for help text
-        period_boundaries = []
-        for i in range(1, match_context.num_periods + 1):
-            start_minute = 1 + (i - 1) * match_context.period_length
-            end_minute = i * match_context.period_length
-            period_boundaries.append((start_minute, end_minute, i))
-
-        # Add extra time periods if applicable
-        if match_context.num_extra_periods > 0:
-            regular_time_end = match_context.num_periods * match_context.period_length
-            for i in range(1, match_context.num_extra_periods + 1):
-                start_minute = (
-                    regular_time_end + 1 + (i - 1) * match_context.extra_period_length
-                )
-                end_minute = regular_time_end + i * match_context.extra_period_length
-                period = match_context.num_periods + i
-                period_boundaries.append((start_minute, end_minute, period))
-
-        # Display smart timestamp input instructions
-        print(
-            "\nEnter a timestamp to automatically report the appropriate time control"
-            "event:"
-        )
-        print("  - Enter the minute number when the event occurred")
-        print(
-            "- The system will automatically determine if it's a period start, period"
-            "end, or game end"
-        )
-        print("\nValid timestamps for this match:")
-
-        for start, end, period in period_boundaries:
-            if period <= match_context.num_periods:
-                print(f"  {start} → Start of Period {period}")
-                print(
-                    f"  {end} → End of Period {period}"
-                    + (
-                        " and End of Game"
-                        if period == match_context.num_periods
-                        and match_context.num_extra_periods == 0
-                        else ""
-                    )
-                )
-            else:
-                # Extra time period
-                extra_period = period - match_context.num_periods
-                print(f"  {start} → Start of Extra Time Period {extra_period}")
-                print(
-                    f"  {end} → End of Extra Time Period {extra_period}"
-                    + (
-                        " and End of Game"
-                        if period
-                        == match_context.num_periods + match_context.num_extra_periods
-                        else ""
+        with _screen.frame() as frame:
+            # Header with match info
+            frame.line("\n" + "=" * 60)
+            frame.line(
+                f"TIME CONTROL EVENTS - {match_context.team1_name} vs"
+                f" {match_context.team2_name}"
+            )
+            frame.line(_current_score_line(match_context, scores))
+            live_clock = match_context.live_clock
+            if live_clock is not None:
+                reading = live_clock.reading()
+                if reading is None:
+                    frame.line("LIVE CLOCK: waiting for Period Start")
+                else:
+                    state = "running" if reading.running else "paused"
+                    frame.line(
+                        f"LIVE CLOCK: {reading.display}:{reading.second:02d}"
+                        f" (period {reading.period}, {state})"
                     )
-                )
+            frame.lines(match_context.drain_notices())
+            frame.line("=" * 60)
 
-        print("\nYou can also use stoppage time notation (e.g., 45+2, 90+3)")
-        print("\nOr select a specific event type:")
-        print(f"  1: {EVENT_EMOJIS['Period End']} Period End")
-        print(f"  2: {EVENT_EMOJIS['Game End']} Game End")
-        print(f"\n  {MENU_EMOJIS['back']} Enter empty string to return to main menu")
-        print("-" * 60)
+            # Display smart timestamp input instructions
+            frame.line(
+                "\nEnter a timestamp to automatically report the appropriate time"
+                " control event:"
+            )
+            frame.line("  - Enter the minute number when the event occurred")
+            frame.line(
+                "- The system will automatically determine if it's a period start,"
+                " period end, or game end"
+            )
+            frame.line("\nValid timestamps for this match:")
+            frame.lines(match_clock_for(match_context).timestamp_help_lines)
+
+            frame.line("\nYou can also use stoppage time notation (e.g., 45+2, 90+3)")
+            frame.line("\nOr select a specific event type:")
+            frame.line(f"  1: {EVENT_EMOJIS['Period End']} Period End")
+            frame.line(f"  2: {EVENT_EMOJIS['Game End']} Game End")
+            frame.line(
+                f"  s: {EVENT_EMOJIS['Period Start']} Period Start of the next period"
+            )
+            clock_action = "on" if match_context.live_clock is None else "off"
+            frame.line(
+                f"  c: {MENU_EMOJIS['live_clock']} Turn live match clock {clock_action}"
+            )
+            frame.line(
+                f"\n  {MENU_EMOJIS['back']} Enter empty string to return to main menu"
+            )
+            frame.line("-" * 60)
 
         choice = input("Enter timestamp or option [1-2]: ")
 
         if choice == "":
             return
+        if choice.lower() == "c":
+            _toggle_live_clock(match_context)
+            continue
+        if choice.lower() == "s":
+            # Timestamp 1 is taken by option 1, so the first half starts here
+            _report_next_period_start(match_context)
+            _display_current_events_table(match_context)
+            continue
         if choice in ["1", "2"]:
             # Use the existing control event reporting flow
             _report_control_event_interactively(match_context, choice)
@@ -559,29 +700,34 @@ def report_control_events_menu(match_context: MatchContext):
 def report_staff_events_menu(match_context: MatchContext):
     """Menu for reporting staff member events"""
     while True:
+        _run_requested_reconciliation(match_context)
         # Get current scores for display
         scores = match_context.scores
 
-        # Create a more visually appealing header with match info
-        print("\n" + "=" * 60)
-        print(
-            f"STAFF EVENTS - {match_context.team1_name} vs {match_context.team2_name}"
-        )
-        print(
-            f"CURRENT SCORE: {match_context.team1_name} {scores.regular_time.home} - {scores.regular_time.away} {match_context.team2_name}"
-        )
-        print("=" * 60)
-
-        # Staff event options with better formatting
-        print("\nSelect a staff event to report:")
-        print(
-            f"1: {EVENT_EMOJIS['Coach Warning']} Team Official Action (warnings, cards)"
-        )
-        print(
-            f"2: {EVENT_EMOJIS['Medical Staff Intervention']} Medical Staff Intervention"
-        )
-        print(f"\n  {MENU_EMOJIS['back']} Enter empty string to return to main menu")
-        print("-" * 60)
+        with _screen.frame() as frame:
+            # Header with match info
+            frame.line("\n" + "=" * 60)
+            frame.line(
+                f"STAFF EVENTS - {match_context.team1_name} vs"
+                f" {match_context.team2_name}"
+            )
+            frame.line(_current_score_line(match_context, scores))
+            frame.line("=" * 60)
+
+            # Staff event options with better formatting
+            frame.line("\nSelect a staff event to report:")
+            frame.line(
+                f"1: {EVENT_EMOJIS['Coach Warning']} Team Official Action (warnings,"
+                " cards)"
+            )
+            frame.line(
+                f"2: {EVENT_EMOJIS['Medical Staff Intervention']} Medical Staff"
+                " Intervention"
+            )
+            frame.line(
+                f"\n  {MENU_EMOJIS['back']} Enter empty string to return to main menu"
+            )
+            frame.line("-" * 60)
 
         choice = input("Select option [1-2]: ")
 
@@ -590,7 +736,7 @@ def report_staff_events_menu(match_context: MatchContext):
         if choice == "1":
             new_events = _report_team_official_action_event(match_context)
             if new_events is not None:
-                match_context.match_events_json = new_events
+                match_context.apply_server_events(new_events)
             if match_context.match_events_json is not None:
                 _display_current_events_table(match_context)
         elif choice == "2":
@@ -598,31 +744,35 @@ def report_staff_events_menu(match_context: MatchContext):
             print("This feature will be available in a future update.")
         else:
             print("Invalid option. Please try again.")
+            _screen.retain_frame()
 
 
 def report_results_menu(match_context: MatchContext):
     """Menu for reporting match results"""
     while True:
+        _run_requested_reconciliation(match_context)
         # Get current scores for display
         scores = match_context.scores
 
-        # Create a more visually appealing header with match info
-        print("\n" + "=" * 60)
-        print(
-            f"MATCH RESULTS - {match_context.team1_name} vs {match_context.team2_name}"
-        )
-
-        print(
-            f"CURRENT SCORE: {match_context.team1_name} {scores.regular_time.home} -"
-            "{scores.regular_time.away} {match_context.team2_name}"
-        )
-        print("=" * 60)
+        with _screen.frame() as frame:
+            # Header with match info
+            frame.line("\n" + "=" * 60)
+            frame.line(
+                f"MATCH RESULTS - {match_context.team1_name} vs"
+                f" {match_context.team2_name}"
+            )
+            frame.line(_current_score_line(match_context, scores))
+            frame.line("=" * 60)
 
-        # Results options with better formatting
-        print("\nMatch result options:")
-        print(f"  1: {MENU_EMOJIS['report_results']} Report final match results")
-        print(f"\n  {MENU_EMOJIS['back']} Enter empty string to return to main menu")
-        print("-" * 60)
+            # Results options with better formatting
+            frame.line("\nMatch result options:")
+            frame.line(
+                f"  1: {MENU_EMOJIS['report_results']} Report final match results"
+            )
+            frame.line(
+                f"\n  {MENU_EMOJIS['back']} Enter empty string to return to main menu"
+            )
+            frame.line("-" * 60)
 
         choice = input("Select option [1]: ")
 
@@ -633,6 +783,7 @@ def report_results_menu(match_context: MatchContext):
             # Simply continue in the loop, returning to the results menu
         else:
             print("Invalid option. Please try again.")
+            _screen.retain_frame()
 
 
 def _report_control_event_interactively(
@@ -641,7 +792,6 @@ def _report_control_event_interactively(
     """Interactively reports control events (Period End, Game End) - Updated for API" \
     "format.
     """
-    match_id = match_context.match_id
     team1_score = match_context.scores.regular_time.home
     team2_score = match_context.scores.regular_time.away
 
@@ -699,25 +849,13 @@ def _report_control_event_interactively(
             continue  # Loop again for valid time input
 
     # Create the control event JSON in the correct API format
-    control_event = {
-        "matchhandelseid": 0,
-        "matchid": match_id,
-        "period": period,
-        "matchminut": match_minute,
-        "sekund": 0,
-        "matchhandelsetypid": event_type_id,
-        "matchlagid": 0,
-        "spelareid": 0,
-        "spelareid2": 0,
-        "planpositionx": "-1",
-        "planpositiony": "-1",
-        "matchdeltagareid": 0,
-        "matchdeltagareid2": 0,
-        "fotbollstypId": 1,
-        "relateradTillMatchhandelseID": 0,
-        "hemmamal": team1_score,
-        "bortamal": team2_score,
-    }
+    try:
+        control_event = payload_builder_for(match_context).control(
+            event_type_id, period, match_minute, team1_score, team2_score
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
 
     # Handle automatic period start and period end logic AND API reporting
     _add_control_event_with_implicit_events(
@@ -731,310 +869,150 @@ def _report_control_event_interactively(
 def _add_control_event_with_implicit_events(
     control_event: Dict[str, Any], match_context: MatchContext
 ) -> None:
-    """Adds a control event, implicit period start/end events, and reports them to" \
-    "API - Context-Aware - ITERATIVE & ORDERED.
-    """
-    event_type_id = control_event["matchhandelsetypid"]
-    period = control_event["period"]
-    match_minute = control_event["matchminut"]
-    team1_score = control_event["hemmamal"]
-    team2_score = control_event["bortamal"]
-    api_client = match_context.api_client
-    match_id = match_context.match_id  # Get match_id from context
-
-    def _find_existing_event(
-        event_type_id: int, period: int
-    ) -> Optional[Dict[str, Any]]:
-        """Find an existing event of the given type and period."""
-        # Print debug information
-        print(f"Looking for event with type {event_type_id} and period {period}")
-        print(f"Current events: {match_context.match_events_json}")
-
-        for event in match_context.match_events_json:
-            # Check if the required keys exist in the event data
-            if "matchhandelsetypid" not in event or "period" not in event:
-                print(f"Warning: Event missing required keys. Available keys: {list(event.keys())}")
-                continue
+    """Adds a control event and any implicit period start/end events.
 
-            # Convert values to integers for comparison
-            event_type = int(event["matchhandelsetypid"])
-            event_period = int(event["period"])
+    The planner decides from the current events which Period Start/Period End
+    events must be created or updated; the executor then dispatches the plan.
+    """
+    plan = plan_control_event(
+        control_event,
+        control_event_lookup(match_context.match_events_json or []),
+        period_start_minute=match_clock_for(match_context).period_start_minute(
+            control_event["period"]
+        ),
+    )
+    _execute_control_event_plan(plan, match_context)
 
-            print(f"Checking event: type={event_type}, period={event_period}")
 
-            if event_type == event_type_id and event_period == period:
-                print(f"Found matching event: {event}")
-                return dict(event)
+def _dispatch_planned_event(
+    api_client: FogisApiClient, step: PlannedEvent
+) -> Tuple[Any, float]:
+    """Reports a single planned event and returns (response, elapsed seconds)."""
+    started = time.perf_counter()
+    try:
+        response = api_client.report_match_event(step.payload)
+    except Exception as api_error:
+        print(
+            f"API ERROR: Failed to report event type {step.event_type_id}"
+            f" to API. Exception: {api_error}"
+        )
+        response = None
+    return response, time.perf_counter() - started
 
-        print(f"No matching event found for type {event_type_id} and period {period}")
-        return None
 
-    def _report_event_to_api(
-        event_json: Dict[str, Any]
-    ) -> Optional[List[Dict[str, Any]]]:
-        action_type = None
-        try:
-            # Check if we're updating an existing event or creating a new one
-            is_update = event_json["matchhandelseid"] != 0
-            action_type = "updated" if is_update else "reported"
-
-            api_response = api_client.report_match_event(event_json)
-            if (
-                api_response is not None
-            ):  # Check if api_response is not None for success
-                print(
-                    f"API: Event type {event_json['matchhandelsetypid']} {action_type}"
-                    "successfully."
-                )
-                # Use safe_fetch_json_list to ensure the response is a list of dictionaries
-                # Cast the result to the expected return type
-                result = safe_fetch_json_list(lambda x: x, api_response)
-                # Convert to List[Dict[str, Any]]
-                return [dict(item) for item in result] if result else None
-            else:
-                print(
-                    f"API WARNING: Event type {event_json['matchhandelsetypid']} {action_type} - API acknowledged but no success response."
-                )
-                print(f"API WARNING: Response: {api_response}")
+def _execute_control_event_plan(
+    plan: List[PlannedEvent], match_context: MatchContext
+) -> None:
+    """Dispatches a control event plan and applies the final response once.
 
-                return None  # Return None to indicate failure
-        except Exception:
+    All steps belong to the same period and each depends on the one before
+    it (Period Start, Period End, Game End), so they are reported one after
+    another in plan order; the requested event is last so its response
+    reflects the whole plan. The context is updated once, after all steps
+    have completed.
+    """
+    api_client = match_context.api_client
+    results = [_dispatch_planned_event(api_client, step) for step in plan]
+
+    any_reported = False
+    for step, (response, elapsed) in zip(plan, results):
+        print(f"  {step.describe()}")
+        action_type = "updated" if step.is_update else "reported"
+        if response is not None:
+            any_reported = True
             print(
-                f"API ERROR: Failed to {action_type} event type"
-                "{event_json['matchhandelsetypid']} to API. Exception: {api_error}"
+                f"API: Event type {step.event_type_id} {action_type} successfully"
+                f" ({elapsed:.2f}s)."
             )
-            return None  # Return None to indicate failure
-
-    if event_type_id == 32:  # Period End (32)
-        # Check for existing Period Start (31) for the *current* period
-        existing_period_start = _find_existing_event(31, period)
-        if not existing_period_start:
-            # No existing Period Start, create a new one
-            period_start_minute = 1 + ((period - 1) * match_context.period_length)
-            period_start_event = {
-                "matchhandelseid": 0,  # 0 for new event
-                "matchid": match_id,
-                "period": period,
-                "matchminut": period_start_minute,
-                "sekund": 0,
-                "matchhandelsetypid": 31,
-                "matchlagid": 0,
-                "spelareid": 0,
-                "spelareid2": 0,
-                "planpositionx": "-1",
-                "planpositiony": "-1",
-                "matchdeltagareid": 0,
-                "matchdeltagareid2": 0,
-                "fotbollstypId": 1,
-                "relateradTillMatchhandelseID": 0,
-                "hemmamal": team1_score,
-                "bortamal": team2_score,
-            }
-            print(f"  Creating new Period Start event for period {period}")
-            api_response_start = _report_event_to_api(period_start_event)
-            if api_response_start is not None:
-                match_context.match_events_json = api_response_start  # Update context
-                print(
-                    "Context's match_events_json UPDATED with API response (Period"
-                    "Start Period {period})."
-                )
-            else:
-                print(
-                    f"WARNING: Period Start event (Period {period}) NOT reported to API!"
-                    "Context NOT updated for Period Start."
-                )
         else:
             print(
-                f"Found existing Period Start event for period {period} (ID:"
-                "{existing_period_start['matchhandelseid']})"
+                f"WARNING: {CONTROL_EVENT_NAMES.get(step.event_type_id, 'Control')}"
+                f" event (Period {step.payload['period']}) NOT reported to API!"
             )
 
-        # Check for existing Period End event
-        existing_period_end = _find_existing_event(32, period)
-        if existing_period_end:
-            # Update existing Period End event
-            print(
-                f"Updating existing Period End event for period {period} (ID:"
-                "{existing_period_end['matchhandelseid']})"
+    if not any_reported:
+        return
+    for step, (response, _) in zip(plan, results):
+        if response is not None:
+            # Implicit steps too: a Period End may start its period first
+            _update_live_clock(match_context, step)
+    final_response = results[-1][0]
+    if isinstance(final_response, list):
+        # The API returned the updated event list for the final step
+        match_context.apply_server_events([dict(item) for item in final_response])
+    else:
+        match_context.apply_server_events(
+            safe_fetch_json_list(
+                api_client.fetch_match_events_json, match_context.match_id
             )
-            # Copy the control_event data but use the existing event ID
-            updated_event = control_event.copy()
-            updated_event["matchhandelseid"] = existing_period_end["matchhandelseid"]
-            api_response_end = _report_event_to_api(updated_event)
-        else:
-            # Create new Period End event
-            print(f"  Creating new Period End event for period {period}")
-            api_response_end = _report_event_to_api(control_event)
+        )
 
-        if api_response_end is not None:
-            match_context.match_events_json = api_response_end  # Update context
-            print(
-                "Context's match_events_json UPDATED with API response (Period End"
-                "Period {period})."
-            )
-        else:
-            print(
-                f"WARNING: Period End event (Period {period}) NOT reported to API!"
-                "Context NOT updated for Period End."
-            )
 
-    elif event_type_id == 23:  # Game End (23)
-        # Check for existing Period End (32) for the *current* period
-        existing_period_end = _find_existing_event(32, period)
-        if not existing_period_end:
-            # No existing Period End, create a new one
-            period_end_event = {
-                "matchhandelseid": 0,  # 0 for new event
-                "matchid": match_id,
-                "period": period,
-                "matchminut": match_minute,
-                "sekund": 0,
-                "matchhandelsetypid": 32,
-                "matchlagid": 0,
-                "spelareid": 0,
-                "spelareid2": 0,
-                "planpositionx": "-1",
-                "planpositiony": "-1",
-                "matchdeltagareid": 0,
-                "matchdeltagareid2": 0,
-                "fotbollstypId": 1,
-                "relateradTillMatchhandelseID": 0,
-                "hemmamal": team1_score,
-                "bortamal": team2_score,
-            }
-            print(
-                f"Creating new Period End event for period {period} (implicit with Game"
-                "End)"
-            )
-            api_response_period_end = _report_event_to_api(period_end_event)
-            if api_response_period_end is not None:
-                match_context.match_events_json = (
-                    api_response_period_end  # Update context
-                )
-                print(
-                    "Context's match_events_json UPDATED with API response (Implicit"
-                    "Period End Period {period} with Game End)."
-                )
-            else:
-                print(
-                    f"WARNING: Implicit Period End event (Period {period}, with Game"
-                    "End) NOT reported to API! Context NOT updated for implicit Period"
-                    "End."
-                )
-        else:
-            print(
-                f"Found existing Period End event for period {period} (ID:"
-                "{existing_period_end['matchhandelseid']})"
-            )
+def _report_new_event(
+    match_context: MatchContext, event_data: Dict[str, Any]
+) -> Any:
+    """Reports an event, retrying timeouts without creating duplicates.
 
-        # Check for existing Period Start (31) for the *current* period
-        existing_period_start = _find_existing_event(31, period)
-        if not existing_period_start:
-            # No existing Period Start, create a new one
-            period_start_minute = 1 + ((period - 1) * match_context.period_length)
-            period_start_event = {
-                "matchhandelseid": 0,  # 0 for new event
-                "matchid": match_id,
-                "period": period,
-                "matchminut": period_start_minute,
-                "sekund": 0,
-                "matchhandelsetypid": 31,
-                "matchlagid": 0,
-                "spelareid": 0,
-                "spelareid2": 0,
-                "planpositionx": "-1",
-                "planpositiony": "-1",
-                "matchdeltagareid": 0,
-                "matchdeltagareid2": 0,
-                "fotbollstypId": 1,
-                "relateradTillMatchhandelseID": 0,
-                "hemmamal": team1_score,
-                "bortamal": team2_score,
-            }
-            print(
-                f"Creating new Period Start event for period {period} (implicit with"
-                "Game End)"
-            )
-            api_response_start = _report_event_to_api(period_start_event)
-            if api_response_start is not None:
-                match_context.match_events_json = api_response_start  # Update context
-                print(
-                    "Context's match_events_json UPDATED with API response (Period"
-                    "Start Period {period}, implicit with Game End)."
-                )
-            else:
-                print(
-                    f"WARNING: Implicit Period Start event (Period {period}, with Game"
-                    "End) NOT reported to API! Context NOT updated for implicit Period"
-                    "Start."
-                )
-        else:
-            print(
-                f"Found existing Period Start event for period {period} (ID:"
-                "{existing_period_start['matchhandelseid']})"
-            )
+    Returns:
+        The API response or, if a failed attempt had already stored the event,
+        the server's copy of the event
+    """
+    result = submit_event(
+        match_context.api_client,
+        match_context.match_id,
+        event_data,
+        confirmed_events(match_context.match_events_json or []),
+        match_context.unresolved_submissions,
+    )
+    if result.already_stored:
+        print("The event was already stored by an earlier attempt; not resent.")
+        return result.stored_event
+    return result.response
 
-        # Check for existing Game End event
-        existing_game_end = _find_existing_event(23, period)
-        if existing_game_end:
-            # Update existing Game End event
-            print(
-                f"Updating existing Game End event for period {period} (ID:"
-                "{existing_game_end['matchhandelseid']})"
-            )
-            # Copy the control_event data but use the existing event ID
-            updated_event = control_event.copy()
-            updated_event["matchhandelseid"] = existing_game_end["matchhandelseid"]
-            api_response_game_end = _report_event_to_api(updated_event)
-        else:
-            # Create new Game End event
-            print(f"  Creating new Game End event for period {period}")
-            api_response_game_end = _report_event_to_api(control_event)
 
-        if api_response_game_end is not None:
-            match_context.match_events_json = api_response_game_end  # Update context
-            print(
-                "Context's match_events_json UPDATED with API response (Game End Period"
-                "{period})."
-            )
-        else:
-            print(
-                f"WARNING: Game End event (Period {period}) NOT reported to API! Context"
-                "NOT updated for Game End."
-            )
+def _submit_optimistically(
+    match_context: MatchContext,
+    event_data: Dict[str, Any],
+    description: str,
+    local_fields: Dict[str, Any],
+) -> bool:
+    """Applies an event locally and reports it in the background.
 
-    else:  # Period Start (31) - if we ever allow explicit Period Start input
-        # Check for existing Period Start event
-        existing_period_start = _find_existing_event(31, period)
-        if existing_period_start:
-            # Update existing Period Start event
-            print(
-                f"Updating existing Period Start event for period {period} (ID:"
-                "{existing_period_start['matchhandelseid']})"
-            )
-            # Copy the control_event data but use the existing event ID
-            updated_event = control_event.copy()
-            updated_event["matchhandelseid"] = existing_period_start["matchhandelseid"]
-            api_response_period_start = _report_event_to_api(updated_event)
-        else:
-            # Create new Period Start event
-            print(f"  Creating new Period Start event for period {period}")
-            period_start_event = control_event  # For Period Start, control_event is the period_start_event itself
-            api_response_period_start = _report_event_to_api(period_start_event)
-
-        if api_response_period_start is not None:
-            match_context.match_events_json = (
-                api_response_period_start  # Update context
-            )
-            print(
-                "Context's match_events_json UPDATED with API response (Period Start"
-                "Period {period})."
-            )
-        else:
-            print(
-                f"WARNING: Period Start event (Period {period}) NOT reported to API! Context NOT updated for Period Start."
-            )
-            return
+    Returns:
+        True if optimistic mode is on and the event was submitted, False if the
+        caller should report the event directly
+    """
+    reporter = match_context.optimistic_reporter
+    if reporter is None:
+        return False
+    reporter.submit(event_data, description, local_fields)
+    print(f"{description} recorded (pending server confirmation).")
+    return True
+
+
+def _update_live_clock(match_context: MatchContext, step: PlannedEvent) -> None:
+    """Starts the live match clock on Period Start and pauses it otherwise."""
+    live_clock = match_context.live_clock
+    if live_clock is None:
+        return
+    if step.event_type_id == PERIOD_START:
+        live_clock.start_period(int(step.payload["period"]))
+    else:
+        # Period End and Game End both stop play
+        live_clock.stop_period()
+
+
+def _toggle_live_clock(match_context: MatchContext) -> None:
+    """Turns the live match clock on or off."""
+    if match_context.live_clock is None:
+        match_context.live_clock = LiveMatchClock(match_clock_for(match_context))
+        print(
+            "Live match clock ON. It starts when a Period Start is reported and"
+            " pauses at Period End."
+        )
+    else:
+        match_context.live_clock = None
+        print("Live match clock OFF.")
 
 
 def _report_substitution_event(
@@ -1047,12 +1025,6 @@ def _report_substitution_event(
     """Reports a substitution event based on user input."""
     api_client = match_context.api_client
     match_id = match_context.match_id
-    team1_id = match_context.team1_id
-    team2_id = match_context.team2_id
-    num_periods = match_context.num_periods
-    period_length = match_context.period_length
-    num_extra_periods = match_context.num_extra_periods
-    extra_period_length = match_context.extra_period_length
 
     jersey_number_in = input("Jersey number of player coming IN (substitute): ")
     jersey_number_out = input("Jersey number of player going OUT (being substituted): ")
@@ -1110,49 +1082,42 @@ def _report_substitution_event(
         "{player_name_out} (#{jersey_number_out_int}) OUT for {team_name}"
     )
 
-    minute_str = input(
-        "Minute when substitution occurred (1-90, or '45+X' for stoppage time):"
-    )
+    try:
+        minute, period, second = _prompt_event_time(
+            match_context,
+            "Minute when substitution occurred (1-90, or '45+X' for stoppage time):",
+        )
+    except ValueError as e:
+        print(e)
+        return None  # Indicate failure
 
     try:
-        minute, period = _parse_minute_input(
-            minute_str,
-            num_periods,
-            period_length,
-            num_extra_periods,
-            extra_period_length,
+        event_data = payload_builder_for(match_context).substitution(
+            team_number,
+            int(player_id_in),
+            int(player_id_out),
+            game_participant_id_in,
+            game_participant_id_out,
+            period,
+            minute,
+            team1_score,
+            team2_score,
+            second=second,
         )
     except ValueError as e:
         print(e)
         return None  # Indicate failure
 
-    game_team_id = team1_id if team_number == 1 else team2_id
-    event_data = {
-        "matchhandelseid": 0,
-        "matchid": match_id,
-        "period": period,
-        "matchminut": minute,
-        "sekund": 0,
-        "matchhandelsetypid": EVENT_TYPES[17],  # Substitution event type ID (17)
-        "matchlagid": game_team_id,
-        "spelareid": int(player_id_in),
-        "spelareid2": int(player_id_out),
-        "hemmamal": team1_score,
-        "bortamal": team2_score,
-        "planpositionx": "-1",
-        "planpositiony": "-1",
-        "matchdeltagareid": int(game_participant_id_in)
-        if game_participant_id_in
-        else 0,
-        "matchdeltagareid2": int(game_participant_id_out)
-        if game_participant_id_out
-        else 0,
-        "fotbollstypId": 1,
-        "relateradTillMatchhandelseID": 0,
-    }
+    if _submit_optimistically(
+        match_context,
+        event_data,
+        f"Substitution #{jersey_number_in_int} for #{jersey_number_out_int}",
+        {"trojnummer": jersey_number_in_int, "trojnummer2": jersey_number_out_int},
+    ):
+        return None  # Confirmed in the background
 
     try:
-        report_response = api_client.report_match_event(event_data)
+        report_response = _report_new_event(match_context, event_data)
         if report_response:
             print("\nMatch Event Report Response (Substitution):")
             print("Event Type: Substitution")
@@ -1244,12 +1209,6 @@ def _report_goal_with_smart_input(
     """
     api_client = match_context.api_client
     match_id = match_context.match_id
-    team1_id = match_context.team1_id
-    team2_id = match_context.team2_id
-    num_periods = match_context.num_periods
-    period_length = match_context.period_length
-    num_extra_periods = match_context.num_extra_periods
-    extra_period_length = match_context.extra_period_length
     team_name = (
         match_context.team1_name if team_number == 1 else match_context.team2_name
     )
@@ -1345,57 +1304,50 @@ def _report_goal_with_smart_input(
     )
 
     # Get timestamp for the goal
-    minute_str = input(
-        f"Minute when goal by {player_name} (#{jersey_number_int}) occurred (1-90, or '45+X' for stoppage time): "
-    )
     try:
-        minute, period = _parse_minute_input(
-            minute_str,
-            num_periods,
-            period_length,
-            num_extra_periods,
-            extra_period_length,
+        minute, period, second = _prompt_event_time(
+            match_context,
+            f"Minute when goal by {player_name} (#{jersey_number_int}) occurred (1-90, or '45+X' for stoppage time): ",
         )
     except ValueError as e:
         print(e)
         return None  # Indicate failure
 
     # Update score
-    game_team_id = team1_id if team_number == 1 else team2_id
     if team_number == 1:
         team1_score += 1
     elif team_number == 2:
         team2_score += 1
 
     # Create event data
-    event_data = {
-        "matchhandelseid": 0,
-        "matchid": match_id,
-        "period": period,
-        "matchminut": minute,
-        "sekund": 0,
-        "matchhandelsetypid": event_type_id,
-        "matchlagid": game_team_id,
-        "spelareid": int(player_id),
-        "spelareid2": 0,
-        "planpositionx": "-1",
-        "planpositiony": "-1",
-        "matchdeltagareid": int(game_participant_id) if game_participant_id else 0,
-        "matchdeltagareid2": 0,
-        "fotbollstypId": 1,
-        "relateradTillMatchhandelseID": 0,
-    }
+    try:
+        event_data = payload_builder_for(match_context).goal(
+            event_type_id,
+            team_number,
+            int(player_id),
+            game_participant_id,
+            period,
+            minute,
+            team1_score,
+            team2_score,
+            second=second,
+        )
+    except ValueError as e:
+        print(e)
+        return None
 
-    if team_number == 1:
-        event_data["hemmamal"] = team1_score
-        event_data["bortamal"] = team2_score
-    elif team_number == 2:
-        event_data["hemmamal"] = team1_score
-        event_data["bortamal"] = team2_score
+    if _submit_optimistically(
+        match_context,
+        event_data,
+        f"{event_type_name} by #{jersey_number_int}",
+        {"trojnummer": jersey_number_int},
+    ):
+        _display_current_events_table(match_context)
+        return None  # Confirmed in the background
 
     # Report the event
     try:
-        api_response = api_client.report_match_event(event_data)
+        api_response = _report_new_event(match_context, event_data)
         if api_response is None:
             print(f"Error reporting {event_type_name} for player #{jersey_number_int}.")
             return None
@@ -1424,12 +1376,6 @@ def _report_player_event(
     """Reports a general player event (goal, card, etc.) based on user input."""
     api_client = match_context.api_client
     match_id = match_context.match_id
-    team1_id = match_context.team1_id
-    team2_id = match_context.team2_id
-    num_periods = match_context.num_periods
-    period_length = match_context.period_length
-    num_extra_periods = match_context.num_extra_periods
-    extra_period_length = match_context.extra_period_length
     event_type_id = list(EVENT_TYPES.keys())[
         list(EVENT_TYPES.values()).index(selected_event_type)
     ]  # Get numeric event_type_id from selected_event_type
@@ -1473,56 +1419,48 @@ def _report_player_event(
         f"\nSelected player: {player_name} (#{jersey_number_int}) for {event_type_name}"
     )
 
-    minute_str = input(
-        f"Minute when {event_type_name} for {player_name} (#{jersey_number_int})"
-        "occurred (1-90, or '45+X' for stoppage time):"
-    )
     try:
-        minute, period = _parse_minute_input(
-            minute_str,
-            num_periods,
-            period_length,
-            num_extra_periods,
-            extra_period_length,
+        minute, period, second = _prompt_event_time(
+            match_context,
+            f"Minute when {event_type_name} for {player_name} (#{jersey_number_int})"
+            "occurred (1-90, or '45+X' for stoppage time):",
         )
     except ValueError as e:
         print(e)
         return None  # Indicate failure
 
-    game_team_id = team1_id if team_number == 1 else team2_id
     if is_goal_event:
         if team_number == 1:
             team1_score += 1
         elif team_number == 2:
             team2_score += 1
 
-    event_data = {
-        "matchhandelseid": 0,
-        "matchid": match_id,
-        "period": period,
-        "matchminut": minute,
-        "sekund": 0,
-        "matchhandelsetypid": event_type_id,
-        "matchlagid": game_team_id,
-        "spelareid": int(player_id),
-        "spelareid2": 0,
-        "planpositionx": "-1",
-        "planpositiony": "-1",
-        "matchdeltagareid": int(game_participant_id) if game_participant_id else 0,
-        "matchdeltagareid2": 0,
-        "fotbollstypId": 1,
-        "relateradTillMatchhandelseID": 0,
-    }
+    try:
+        event_data = payload_builder_for(match_context).player_event(
+            event_type_id,
+            team_number,
+            int(player_id),
+            game_participant_id,
+            period,
+            minute,
+            team1_score,
+            team2_score,
+            second=second,
+        )
+    except ValueError as e:
+        print(e)
+        return None  # Indicate failure
 
-    if team_number == 1:
-        event_data["hemmamal"] = team1_score
-        event_data["bortamal"] = team2_score
-    elif team_number == 2:
-        event_data["hemmamal"] = team1_score
-        event_data["bortamal"] = team2_score
+    if _submit_optimistically(
+        match_context,
+        event_data,
+        f"{event_type_name} for #{jersey_number_int}",
+        {"trojnummer": jersey_number_int},
+    ):
+        return None  # Confirmed in the background
 
     try:
-        report_response = api_client.report_match_event(event_data)
+        report_response = _report_new_event(match_context, event_data)
         if report_response:
             print("\nMatch Event Report Response:")
             print(f"Event Type: {event_type_name}")
@@ -1556,50 +1494,239 @@ def _handle_clear_events(match_context: MatchContext) -> List[Dict[str, Any]]:
     return cast(List[Dict[str, Any]], match_events_json)  # Return with proper type
 
 
-def _display_current_events_table(match_context: MatchContext):
-    """Displays the current match events table with enhanced formatting."""
-    scores: Scores = FogisDataParser.calculate_scores(match_context)
-    team1_score = scores.regular_time.home
-    team2_score = scores.regular_time.away
-    halftime_score_team1 = scores.halftime.home
-    halftime_score_team2 = scores.halftime.away
-    match_events_json = match_context.match_events_json
-
-    # Create a more visually appealing header
-    print("\n" + "=" * 60)
-    print(
-        f"MATCH EVENTS SUMMARY - {match_context.team1_name} vs"
-        "{match_context.team2_name}"
+def _describe_event(match_context: MatchContext, event: Dict[str, Any]) -> str:
+    """Returns a one-line description of an event for the edit/delete list."""
+    event_type_name = EVENT_TYPES.get(event.get("matchhandelsetypid"), {}).get(
+        "name", "Unknown Event"
     )
-    print(
-        f"CURRENT SCORE: {match_context.team1_name} {team1_score} - {team2_score}"
-        "{match_context.team2_name}"
+    team_id = event.get("matchlagid")
+    if team_id == match_context.team1_id:
+        team_name = match_context.team1_name
+    elif team_id == match_context.team2_id:
+        team_name = match_context.team2_name
+    else:
+        team_name = ""
+    jersey = event.get("trojnummer")
+    player = f" #{jersey}" if jersey is not None else ""
+    team_part = f" - {team_name}{player}" if team_name else ""
+    return (
+        f"[ID {event.get('matchhandelseid')}] "
+        f"{EVENT_EMOJIS.get(event_type_name, '')} {event_type_name}{team_part}"
+        f" - {event.get('matchminut')}' (period {event.get('period')})"
     )
-    if halftime_score_team1 is not None and halftime_score_team2 is not None:
-        print(
-            f"HALFTIME SCORE: {match_context.team1_name} {halftime_score_team1} -"
-            "{halftime_score_team2} {match_context.team2_name}"
+
+
+def _edit_event_payload(
+    match_context: MatchContext, event: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Prompts for a new minute and player and returns the updated payload."""
+    try:
+        payload = EventPayloadBuilder.from_event(event)
+    except ValueError as e:
+        print(e)
+        return None
+
+    minute_str = input(f"New minute [{event.get('matchminut')}]: ")
+    if minute_str:
+        try:
+            payload["matchminut"], payload["period"] = _parse_minute_input(
+                minute_str,
+                match_context.num_periods,
+                match_context.period_length,
+                match_context.num_extra_periods,
+                match_context.extra_period_length,
+            )
+        except ValueError as e:
+            print(e)
+            return None
+
+    team_id = event.get("matchlagid")
+    if team_id in (match_context.team1_id, match_context.team2_id):
+        team_players_json = (
+            match_context.team1_players_json
+            if team_id == match_context.team1_id
+            else match_context.team2_players_json
         )
-    print("=" * 60)
+        jersey_str = input(f"New jersey number [{event.get('trojnummer')}]: ")
+        if jersey_str:
+            if not jersey_str.isdigit():
+                print("Jersey number must be an integer.")
+                return None
+            player_id = FogisDataParser.get_player_id_by_team_jersey(
+                team_players_json, int(jersey_str)
+            )
+            if not player_id:
+                print(f"Player with jersey number {jersey_str} not found.")
+                return None
+            game_participant_id = FogisDataParser.get_matchdeltagareid_by_team_jersey(
+                team_players_json, int(jersey_str)
+            )
+            payload["spelareid"] = int(player_id)
+            payload["matchdeltagareid"] = (
+                int(game_participant_id) if game_participant_id else 0
+            )
+
+    return payload
 
-    formatter = MatchEventTableFormatter(
-        EVENT_TYPES,
+
+def _reconcile_running_scores(match_context: MatchContext) -> int:
+    """Re-sends events whose stamped hemmamal/bortamal no longer match.
+
+    The correct running score of every event is computed in one match-order
+    pass; only the events that are wrong get an update call, after which the
+    event list is fetched once and synced into the context.
+
+    Returns:
+        The number of events that were updated.
+    """
+    corrections = plan_score_corrections(
+        match_context.match_events_json or [],
+        match_context.team1_id,
+        match_context.team2_id,
+    )
+    api_client = match_context.api_client
+    updated = 0
+    for correction in corrections:
+        try:
+            payload = EventPayloadBuilder.from_event(correction.event)
+            payload["hemmamal"] = correction.home
+            payload["bortamal"] = correction.away
+            api_client.report_match_event(payload)
+            updated += 1
+        except Exception as e:
+            print(
+                "Failed to update running score for event"
+                f" {correction.event_id}: {e}"
+            )
+    if updated:
+        print(f"Running score corrected on {updated} event(s).")
+        match_context.apply_server_events(
+            safe_fetch_json_list(
+                api_client.fetch_match_events_json, match_context.match_id
+            )
+        )
+    return updated
+
+
+def _handle_edit_or_delete_event(match_context: MatchContext) -> bool:
+    """Lets the user edit or delete a single event instead of clearing all.
+
+    Edited events are re-posted with their existing matchhandelseid. Afterwards
+    the running scores of later events are recomputed and only the affected
+    events are re-sent.
+
+    Returns:
+        True if an event was changed, False otherwise.
+    """
+    events = list(match_context.match_events_json or [])
+    if not events:
+        print("No events reported yet.")
+        return False
+
+    print("\nReported events:")
+    for index, event in enumerate(events):
+        print(f"  {index + 1}: {_describe_event(match_context, event)}")
+
+    choice = input("Select event to edit/delete (empty string to go back): ")
+    if choice == "":
+        return False
+    if not choice.isdigit() or not 1 <= int(choice) <= len(events):
+        print("Invalid event number.")
+        return False
+    event = events[int(choice) - 1]
+
+    action = input("Edit or delete this event? (e/d): ").lower()
+    api_client = match_context.api_client
+    try:
+        if action == "e":
+            payload = _edit_event_payload(match_context, event)
+            if payload is None:
+                return False
+            api_client.report_match_event(payload)
+            print(f"Event {event.get('matchhandelseid')} updated.")
+        elif action == "d":
+            if not api_client.delete_match_event(event["matchhandelseid"]):
+                print(f"Failed to delete event {event.get('matchhandelseid')}.")
+                return False
+            print(f"Event {event.get('matchhandelseid')} deleted.")
+        else:
+            print("Invalid action. Please enter 'e' or 'd'.")
+            return False
+    except Exception as e:
+        print(f"Failed to update event: {e}")
+        return False
+
+    match_context.apply_server_events(
+        safe_fetch_json_list(
+            api_client.fetch_match_events_json, match_context.match_id
+        )
+    )
+    _reconcile_running_scores(match_context)
+    return True
+
+
+@lru_cache(maxsize=8)
+def _get_table_formatter(
+    team1_name: str, team2_name: str, team1_id: int, team2_id: int
+) -> MatchEventTableFormatter:
+    """Returns a table formatter for the match, reused across renders.
+
+    The formatter memoizes the rendered row of each event, so keeping one
+    instance per match means only added or changed events are re-formatted.
+    """
+    return MatchEventTableFormatter(
+        EVENT_TYPES, team1_name, team2_name, team1_id, team2_id
+    )
+
+
+def _display_current_events_table(match_context: MatchContext):
+    """Displays the current match events table with enhanced formatting."""
+    formatter = _get_table_formatter(
         match_context.team1_name,
         match_context.team2_name,
         match_context.team1_id,
         match_context.team2_id,
     )
-    table_string = formatter.format_structured_table(
-        match_events_json,
-        match_context.team1_players_json,
-        match_context.team2_players_json,
-        team1_score,
-        team2_score,
-        halftime_score_team1,
-        halftime_score_team2,
-    )
-    print(table_string)
-    print("-" * 60)
+
+    def render() -> Tuple[Scores, str]:
+        # Runs under the context lock, so scores and table match one version
+        scores = match_context.scores
+        return scores, formatter.format_structured_table(
+            match_context.match_events_json,
+            match_context.team1_players_json,
+            match_context.team2_players_json,
+            scores.regular_time.home,
+            scores.regular_time.away,
+            scores.halftime.home,
+            scores.halftime.away,
+        )
+
+    # Re-rendered only when the event list version changes
+    scores, table_string = match_context.derived("events_table", render)
+    team1_score = scores.regular_time.home
+    team2_score = scores.regular_time.away
+    halftime_score_team1 = scores.halftime.home
+    halftime_score_team2 = scores.halftime.away
+
+    with _screen.frame() as frame:
+        # Header with match info and scores
+        frame.line("\n" + "=" * 60)
+        frame.line(
+            f"MATCH EVENTS SUMMARY - {match_context.team1_name} vs"
+            f" {match_context.team2_name}"
+        )
+        frame.line(
+            f"CURRENT SCORE: {match_context.team1_name} {team1_score} -"
+            f" {team2_score} {match_context.team2_name}"
+        )
+        if halftime_score_team1 is not None and halftime_score_team2 is not None:
+            frame.line(
+                f"HALFTIME SCORE: {match_context.team1_name} {halftime_score_team1} -"
+                f" {halftime_score_team2} {match_context.team2_name}"
+            )
+        frame.line("=" * 60)
+        frame.line(table_string)
+        frame.line("-" * 60)
 
 
 def _get_event_details_from_input(
@@ -1748,6 +1875,19 @@ def _report_match_results_interactively(match_context: MatchContext):
     if halftime_score_team1_input is None:  # Input error in scores
         return
 
+    submitted_scores = Scores(
+        regular_time=Score(
+            home=fulltime_score_team1_input, away=fulltime_score_team2_input
+        ),
+        halftime=Score(
+            home=halftime_score_team1_input, away=halftime_score_team2_input
+        ),
+        extra_time=reported_scores.extra_time,
+        penalties=reported_scores.penalties,
+    )
+    if not _check_results_before_submission(match_context, submitted_scores):
+        return
+
     result_data = {
         "matchresultatListaJSON": [
             {
@@ -1771,47 +1911,85 @@ def _report_match_results_interactively(match_context: MatchContext):
         ]
     }
 
-    api_client = match_context.api_client
+    pipeline = match_context.results_pipeline
+    if isinstance(pipeline, ResultsPipeline) and pipeline.can_resume(result_data):
+        print(
+            "\nResuming the earlier report: results already submitted,"
+            f" continuing with {pipeline.next_step}."
+        )
+    else:
+        pipeline = ResultsPipeline(match_context.api_client, match_id, result_data)
+        match_context.results_pipeline = pipeline
+
     try:
-        api_client.report_match_result(result_data)  # Report results to API
-        # result_response is expected to be None or null, so we don't check it directly
-
-        fetched_scores = _verify_match_results(
-            match_context, reported_scores
-        )  # Verify and get fetched scores
-        if fetched_scores is None:
-            fetched_scores = Scores()  # Use default scores if verification fails
-        if (
-            fetched_scores
-        ):  # Verification successful (fetched_scores is a Scores object)
-            print("\nMatch Result Report Response: (API acknowledged)")
+        pipeline.submit()  # The response is expected to be None or null
+        print("\nMatch Result Report Response: (API acknowledged)")
 
+        if pipeline.verify(
+            lambda: _verify_match_results(match_context, submitted_scores)
+            is not None
+        ):
             print(
                 "Match result reporting verified successfully! Fetched scores match"
-                "reported scores."
+                " reported scores."
             )
-            # _mark_reporting_finished_with_error_handling(match_context) # Mark reporting finished - not yet implemented in API Client
-
-            # --- Example of accessing and displaying fetched scores (optional) ---
-            # print("\nFetched Scores from API:")
-            # print(f"  Full Time: {team1_name} {fetched_scores.regular_time.home} - {fetched_scores.regular_time.away} {team2_name}")
-            # print(f"  Halftime:  {team1_name} {fetched_scores.halftime.home} - {fetched_scores.halftime.away} {team2_name}")
-
-        else:  # verify_match_results returned None (verification failed)
-            print("\nMatch Result Report Response: (API acknowledged)")
-
+            if match_context.archive is not None:
+                _write_archive(
+                    match_context.archive.store_result, match_id, submitted_scores
+                )
+            _mark_reporting_finished_with_error_handling(
+                match_context, pipeline.mark_finished
+            )
+        else:
             print(
                 "\nERROR: Match result verification failed. Please check reported"
-                "scores in FOGIS."
+                " scores in FOGIS."
             )
+            print("Report the scores again to resubmit them.")
 
+    except KeyboardInterrupt:
+        print("\nResult reporting interrupted.")
+        print("Report the same scores again to resume where it stopped.")
     except Exception as e:  # Catch exceptions during API call
         print(f"\nERROR: Failed to report match results to API. Exception: {e}")
         print("Match result reporting and verification FAILED.")
 
+    if pipeline.timings:
+        print(f"Step timings: {pipeline.timing_summary()}")
     print("\n--- Match Result Reporting finished ---")
 
 
+def _check_results_before_submission(
+    match_context: MatchContext, entered_scores: Scores
+) -> bool:
+    """Checks entered results locally before anything is sent to the API.
+
+    Impossible results are rejected; results that differ from the reported
+    events, or a match without Game End, need the user's confirmation.
+
+    Returns:
+        True if the results may be submitted
+    """
+    issues = validate_results(
+        entered_scores,
+        match_context.scores,
+        match_context.match_events_json,
+        match_context.num_periods,
+        match_context.num_extra_periods,
+    )
+    if not issues:
+        return True
+
+    print("\nResult check:")
+    for issue in issues:
+        print(f"  {'ERROR' if issue.blocking else 'Warning'}: {issue.message}")
+    if any(issue.blocking for issue in issues):
+        print("The results were NOT submitted. Please correct them and try again.")
+        return False
+    confirm = input("Submit these results anyway? (yes/no): ")
+    return confirm.strip().lower() in ("y", "yes")
+
+
 def _get_score_input_from_user(
     halftime_score_team1,
     halftime_score_team2,
@@ -1883,9 +2061,20 @@ def _get_score_input_from_user(
         return None, None, None, None  # Indicate input error
 
 
-def _mark_reporting_finished_with_error_handling(match_context: MatchContext):
+def _mark_reporting_finished_with_error_handling(
+    match_context: MatchContext,
+    mark_finished: Optional[Callable[[], Any]] = None,
+) -> bool:
     """Prompts for confirmation and marks match reporting as finished with robust" \
     "error handling.
+
+    Args:
+        match_context: The match to mark as finished
+        mark_finished: Makes the API call, defaults to calling
+            mark_reporting_finished directly
+
+    Returns:
+        True if the match was marked as finished
     """
     # --- Prompt before marking reporting finished ---
     while True:  # Loop until valid input
@@ -1895,22 +2084,23 @@ def _mark_reporting_finished_with_error_handling(match_context: MatchContext):
             break  # Proceed to mark finished
         elif confirm_finished == "no":
             print("Skipping 'Mark Reporting Finished' for now.")
-            return
+            return False
         else:
             print("Invalid input. Please enter 'yes' or 'no'.")
-            return
+            return False
 
-    api_client = match_context.api_client
-    match_id = match_context.match_id
+    if mark_finished is None:
+        mark_finished = partial(
+            match_context.api_client.mark_reporting_finished, match_context.match_id
+        )
 
     # --- Robust Error Handling for Mark Reporting Finished ---
     try:
-        finished_response = api_client.mark_reporting_finished(
-            match_id
-        )  # Call mark_reporting_finished
+        finished_response = mark_finished()  # Call mark_reporting_finished
         if finished_response:
             print("\nMatch Reporting Marked as Finished Successfully!")
             print(json.dumps(finished_response, indent=2, ensure_ascii=False))
+            return True
         else:
             print(
                 "\nWarning: Failed to mark match reporting as finished (No response"
@@ -1926,6 +2116,37 @@ def _mark_reporting_finished_with_error_handling(match_context: MatchContext):
 
         print("Please check FOGIS manually or try again later.")  # User guidance
     # --- END Robust Error Handling for Mark Reporting Finished ---
+    return False
+
+
+def _fetch_result_scores(
+    api_client: FogisApiClient, match_id: int
+) -> Optional[Scores]:
+    """Fetches the reported halftime and fulltime results of a match.
+
+    Returns:
+        The fetched Scores, or None if either result is missing
+    """
+    fetched_result_json_list = api_client.fetch_match_result_json(match_id)
+    if not fetched_result_json_list:
+        return None
+
+    fetched_scores = Scores()
+    found_types = set()
+    for result in fetched_result_json_list:
+        if result["matchresultattypid"] == 2:  # Halftime result
+            fetched_scores.halftime = Score(
+                home=result["matchlag1mal"], away=result["matchlag2mal"]
+            )
+        elif result["matchresultattypid"] == 1:  # Fulltime result
+            fetched_scores.regular_time = Score(
+                home=result["matchlag1mal"], away=result["matchlag2mal"]
+            )
+        found_types.add(result["matchresultattypid"])
+
+    if not {1, 2} <= found_types:  # The API response is incomplete
+        return None
+    return fetched_scores
 
 
 def _verify_match_results(
@@ -1933,76 +2154,114 @@ def _verify_match_results(
     reported_scores: Scores,  # Still accept reported_scores as Scores object
 ) -> Optional[Scores]:
     """Verifies reported match results by fetching from API using MatchContext.
-    Compares fetched results to reported_scores.
+    Compares fetched results to reported_scores. The backend is eventually
+    consistent, so the results are fetched again with exponential backoff until
+    they match (see results_pipeline.poll_with_backoff).
     Returns fetched Scores object if verification successful, None otherwise.
     """
     api_client = match_context.api_client  # Get api_client from context
     match_id = match_context.match_id  # Get match_id from context
+    last_fetched: Optional[Scores] = None
+    last_error: Optional[Exception] = None
 
-    try:
-        fetched_result_json_list = api_client.fetch_match_result_json(match_id)
-        if not fetched_result_json_list:
-            print("Warning: No match result data fetched from API for verification.")
+    def check() -> Optional[Scores]:
+        nonlocal last_fetched, last_error
+        try:
+            last_fetched = _fetch_result_scores(api_client, match_id)
+        except Exception as e:
+            last_error = e
             return None
-
-        fetched_scores = Scores()
-
-        for result in fetched_result_json_list:
-            if result["matchresultattypid"] == 2:  # Halftime result
-                fetched_scores.halftime = Score(
-                    home=result["matchlag1mal"], away=result["matchlag2mal"]
-                )
-            elif result["matchresultattypid"] == 1:  # Fulltime result
-                fetched_scores.regular_time = Score(
-                    home=result["matchlag1mal"], away=result["matchlag2mal"]
-                )
-
-        # Check if we have both halftime and fulltime scores
-        missing_scores = (
-            fetched_scores.halftime is None or fetched_scores.regular_time is None
-        )
-        if (
-            missing_scores
-        ):  # This condition can be true if the API response is incomplete
-            print(
-                "ERROR: Could not find both halftime and fulltime results in API"
-                "response."
-            )
+        last_error = None
+        if last_fetched is None:
             return None
-
-        # --- Comparison (no change here) ---
         halftime_match = (
-            fetched_scores.halftime.home == reported_scores.halftime.home
-            and fetched_scores.halftime.away == reported_scores.halftime.away
+            last_fetched.halftime.home == reported_scores.halftime.home
+            and last_fetched.halftime.away == reported_scores.halftime.away
         )
         fulltime_match = (
-            fetched_scores.regular_time.home == reported_scores.regular_time.home
-            and fetched_scores.regular_time.away == reported_scores.regular_time.away
+            last_fetched.regular_time.home == reported_scores.regular_time.home
+            and last_fetched.regular_time.away == reported_scores.regular_time.away
         )
+        return last_fetched if halftime_match and fulltime_match else None
 
-        if halftime_match and fulltime_match:
-            print("Match result verification successful: Scores match API data.")
-            return fetched_scores
-        else:
-            print(
-                "ERROR: Match result verification failed. Scores DO NOT match API data!"
-            )
+    fetched_scores, attempts = poll_with_backoff(check)
+    if fetched_scores is not None:
+        retried = f" (after {attempts} attempts)" if attempts > 1 else ""
+        print(f"Match result verification successful: Scores match API data{retried}.")
+        return fetched_scores
 
-            print(
-                f"Reported Halftime: {reported_scores.halftime.home}-{reported_scores.halftime.away}, Fetched Halftime: {fetched_scores.halftime.home}-{fetched_scores.halftime.away}"
-            )
-            print(
-                f"Reported Fulltime: {reported_scores.regular_time.home}-{reported_scores.regular_time.away}, Fetched Fulltime: {fetched_scores.regular_time.home}-{fetched_scores.regular_time.away}"
-            )
-            return None
+    if last_error is not None:
+        print(f"Exception during match result verification: {last_error}")
+    elif last_fetched is None:
+        print(
+            "ERROR: Could not find both halftime and fulltime results in API"
+            " response."
+        )
+    else:
+        print("ERROR: Match result verification failed. Scores DO NOT match API data!")
+        print(
+            f"Reported Halftime: {reported_scores.halftime.home}-"
+            f"{reported_scores.halftime.away}, Fetched Halftime: "
+            f"{last_fetched.halftime.home}-{last_fetched.halftime.away}"
+        )
+        print(
+            f"Reported Fulltime: {reported_scores.regular_time.home}-"
+            f"{reported_scores.regular_time.away}, Fetched Fulltime: "
+            f"{last_fetched.regular_time.home}-{last_fetched.regular_time.away}"
+        )
+    return None
 
-    except Exception as e:
-        print(f"Exception during match result verification: {e}")
-        return None
+
+# Receives each match while it is being reported
+LiveOutput = Union[EventFanout, ScoreboardServer]
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Report match events to FOGIS.")
+    parser.add_argument(
+        "--emit-ndjson",
+        metavar="PATH",
+        help="write confirmed events and score changes as NDJSON to the file"
+        " PATH; stdout is not allowed, since the menus use it",
+    )
+    parser.add_argument(
+        "--webhook-url",
+        metavar="URL",
+        help="POST confirmed events and score changes as JSON batches to URL",
+    )
+    parser.add_argument(
+        "--archive",
+        metavar="PATH",
+        help="keep matches, team sheets, events and results in the SQLite"
+        " database PATH and use it when FOGIS cannot be reached",
+    )
+    parser.add_argument(
+        "--scoreboard-port",
+        type=int,
+        metavar="PORT",
+        help="serve a live scoreboard page on PORT",
+    )
+    parser.add_argument(
+        "--scoreboard-host",
+        default="127.0.0.1",
+        metavar="HOST",
+        help="address the scoreboard listens on (default 127.0.0.1)",
+    )
+    args = parser.parse_args(argv)
+    if args.emit_ndjson == "-":
+        # The stream would be interleaved with the menus and prompts
+        parser.error(
+            "--emit-ndjson cannot write to stdout, which the menus use;"
+            " give a file path (a named pipe works for live consumers)"
+        )
+    return args
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main function to orchestrate match reporting process."""
+    args = _parse_args(argv)
+
     # Display welcome banner
     print("\n" + "=" * 60)
     print("  FOGIS MATCH REPORTER")
@@ -2034,9 +2293,132 @@ def main():
         print("Please check your credentials and try again.")
         return
 
+    # Menus, the event poller and background reports share identical fetches
+    api_client = cast(FogisApiClient, CoalescingApiClient(api_client))
+    scheduler = _create_request_scheduler()
+    if scheduler is not None:
+        # Outside the coalescing: a menu read joining a poll keeps its priority
+        api_client = cast(FogisApiClient, ScheduledApiClient(api_client, scheduler))
+
+    with ExitStack() as stack:
+        if scheduler is not None:
+            # Registered first, so it is printed after everything is closed
+            stack.callback(lambda: print(f"\n{scheduler.metrics().summary()}"))
+        live_outputs: List[LiveOutput] = []
+        archive: Optional[MatchArchive] = None
+        if args.archive:
+            try:
+                archive = MatchArchive(args.archive)
+            except sqlite3.Error as e:
+                print(f"Error: Could not open the match archive: {e}")
+                return
+            stack.callback(archive.close)
+        if args.emit_ndjson or args.webhook_url or archive is not None:
+            fanout = EventFanout(EVENT_TYPES)
+            if args.emit_ndjson:
+                stream = stack.enter_context(open_output(args.emit_ndjson))
+                fanout.add_sink(NdjsonSink(stream))
+            if args.webhook_url:
+                fanout.add_sink(WebhookSink(args.webhook_url))
+            if archive is not None:
+                # Unbounded: a dropped record would leave the archive wrong
+                fanout.add_sink(ArchiveSink(archive), max_queue=0)
+            # Registered after the stream and archive, so it is closed first
+            stack.callback(fanout.close)
+            live_outputs.append(fanout)
+        if args.scoreboard_port is not None:
+            try:
+                scoreboard = ScoreboardServer(
+                    EVENT_TYPES, args.scoreboard_host, args.scoreboard_port
+                )
+            except OSError as e:
+                print(f"Error: Could not start the scoreboard server: {e}")
+                return
+            scoreboard.start()
+            stack.callback(scoreboard.stop)
+            host, port = scoreboard.address
+            print(f"Live scoreboard at http://{host}:{port}/")
+            live_outputs.append(scoreboard)
+        _report_matches(api_client, live_outputs, archive)
+
+
+def _write_archive(write: Callable[..., None], *args: Any) -> None:
+    """Runs an archive write; a failing archive never stops reporting."""
+    try:
+        write(*args)
+    except sqlite3.Error as e:
+        print(f"\nWarning: Could not write to the match archive: {e}")
+
+
+# Errors of a FOGIS request that the archived copy can stand in for
+_FETCH_ERRORS = (FogisAPIRequestError, FogisDataError, FogisLoginError)
+
+
+def _fetch_list(
+    fetch: Callable[[], Optional[List[Dict[str, Any]]]],
+    description: str,
+    archive: Optional[MatchArchive] = None,
+    archived: Callable[[MatchArchive], Optional[List[Dict[str, Any]]]] = (
+        lambda archive: None
+    ),
+    store: Optional[Callable[[MatchArchive, List[Dict[str, Any]]], None]] = None,
+    archive_when_empty: bool = False,
+) -> Optional[List[Dict[str, Any]]]:
+    """Fetches a list from FOGIS, using the archived copy if the fetch fails.
+
+    Args:
+        fetch: Returns the list, or None if FOGIS did not answer with one
+        description: What is fetched, for messages
+        archive: The archive, if enabled
+        archived: Returns the archived copy, or None if there is none
+        store: Archives the fetched list; only called with non-empty lists
+        archive_when_empty: Also use the archived copy if the list is empty
+
+    Returns:
+        The fetched list, the archived copy if the fetch failed, or None if
+        the fetch failed and there is no archived copy
+    """
+    try:
+        fetched = fetch()
+    except _FETCH_ERRORS as e:
+        print(f"\nError: Could not fetch {description}: {e}")
+        fetched = None
+    if archive is None:
+        return fetched
+    if fetched:
+        if store is not None:
+            _write_archive(store, archive, fetched)
+        return fetched
+    if fetched is not None and not archive_when_empty:
+        return fetched
+    cached = archived(archive)
+    if cached is None:
+        return fetched
+    print(f"Using the archived {description}.")
+    return cached
+
+
+def _report_matches(
+    api_client: FogisApiClient,
+    live_outputs: Sequence[LiveOutput] = (),
+    archive: Optional[MatchArchive] = None,
+) -> None:
+    """Lets the user select and report matches until they choose to stop.
+
+    Args:
+        api_client: The logged in API client
+        live_outputs: Show the events of each reported match while it is open
+        archive: Stores what is fetched and stands in for failed fetches
+    """
     while True:  # Main loop to allow returning to match selection
         print("\nFetching available matches...")
-        matches = api_client.fetch_matches_list_json()
+        matches = _fetch_list(
+            api_client.fetch_matches_list_json,
+            "match list",
+            archive,
+            MatchArchive.matches,
+            MatchArchive.store_matches,
+        )
         if not matches:
             print(
                 "Could not fetch match list. The API may be unavailable or there might"
@@ -2072,21 +2454,57 @@ def main():
         print(f"Extra Period Length: {extra_period_length} minutes")
 
         # Use safe API wrapper to ensure all JSON responses are always lists of dictionaries
-        team1_players_json = safe_fetch_json_list(
-            api_client.fetch_team_players_json, team1_id
+        # Failed fetches fall back to the archive; team sheets also when empty
+        team1_players_json = _fetch_list(
+            partial(safe_fetch_json_list, api_client.fetch_team_players_json, team1_id),
+            "Team 1 players",
+            archive,
+            lambda archived: archived.team_players(team1_id),
+            lambda archived, players: archived.store_team_sheet(
+                match_id, team1_id, players, None
+            ),
+            archive_when_empty=True,
         )
-        team2_players_json = safe_fetch_json_list(
-            api_client.fetch_team_players_json, team2_id
+        team2_players_json = _fetch_list(
+            partial(safe_fetch_json_list, api_client.fetch_team_players_json, team2_id),
+            "Team 2 players",
+            archive,
+            lambda archived: archived.team_players(team2_id),
+            lambda archived, players: archived.store_team_sheet(
+                match_id, team2_id, players, None
+            ),
+            archive_when_empty=True,
         )
-        team1_officials_json = safe_fetch_json_list(
-            api_client.fetch_team_officials_json, team1_id
+        team1_officials_json = _fetch_list(
+            partial(
+                safe_fetch_json_list, api_client.fetch_team_officials_json, team1_id
+            ),
+            "Team 1 officials",
+            archive,
+            lambda archived: archived.team_officials(team1_id),
+            lambda archived, officials: archived.store_team_sheet(
+                match_id, team1_id, None, officials
+            ),
+            archive_when_empty=True,
         )
-        team2_officials_json = safe_fetch_json_list(
-            api_client.fetch_team_officials_json, team2_id
+        team2_officials_json = _fetch_list(
+            partial(
+                safe_fetch_json_list, api_client.fetch_team_officials_json, team2_id
+            ),
+            "Team 2 officials",
+            archive,
+            lambda archived: archived.team_officials(team2_id),
+            lambda archived, officials: archived.store_team_sheet(
+                match_id, team2_id, None, officials
+            ),
+            archive_when_empty=True,
         )
-        # Use safe API wrapper to ensure match_events_json is always a list of dictionaries
-        match_events_json = safe_fetch_json_list(
-            api_client.fetch_match_events_json, match_id
+        # An empty event list is valid; the archive only stands in for errors
+        match_events_json = _fetch_list(
+            partial(safe_fetch_json_list, api_client.fetch_match_events_json, match_id),
+            "Match Events",
+            archive,
+            lambda archived: archived.match_events(match_id),
         )
 
         fetch_errors = False  # Flag to track fetch failures
@@ -2135,6 +2553,9 @@ def main():
 
         if (
             not fetch_errors
+            and team1_players_json is not None
+            and team2_players_json is not None
+            and match_events_json is not None
         ):  # Check the fetch_errors flag instead of combined fetch_success
             match_context = MatchContext(
                 api_client=api_client,
@@ -2152,13 +2573,14 @@ def main():
                 team2_id=team2_id,
                 match_id=match_id,
             )
+            match_context.archive = archive
 
             print("\nTeam Sheets and Match Events Fetched Successfully (or are empty)!")
 
             # --- Display event table immediately after match selection ---
-            formatter = MatchEventTableFormatter(
-                EVENT_TYPES, team1_name, team2_name, team1_id, team2_id
-            )  # Instantiate formatter
+            formatter = _get_table_formatter(
+                team1_name, team2_name, team1_id, team2_id
+            )  # Reused per match so unchanged event rows stay cached
 
             scores: Scores = FogisDataParser.calculate_scores(match_context)
             team1_score = scores.regular_time.home
@@ -2180,7 +2602,31 @@ def main():
             # --- End event table printing ---
 
             # Use the new main menu instead of directly calling reporting functions
-            display_main_menu(match_context)
+            _start_event_poller(match_context)
+            for live_output in live_outputs:
+                live_output.attach(match_context)
+            if os.environ.get("FOGIS_OPTIMISTIC_REPORTING", "").lower() in (
+                "1",
+                "true",
+                "yes",
+            ):
+                match_context.optimistic_reporter = OptimisticReporter(
+                    match_context,
+                    # Runs on the worker: only request the check
+                    on_confirmed=match_context.reconcile_requested.set,
+                )
+            try:
+                _run_match_menus(match_context)
+            finally:
+                if match_context.optimistic_reporter is not None:
+                    print("Waiting for pending events to be confirmed...")
+                    match_context.optimistic_reporter.close()
+                    _run_requested_reconciliation(match_context)
+                    _print_event_notices(match_context)
+                if match_context.event_poller is not None:
+                    match_context.event_poller.stop()
+                for live_output in live_outputs:
+                    live_output.detach()
 
         else:  # If fetch_errors flag is True (any fetch failed)
             print(
@@ -0,0 +1,70 @@
+"""Grid table renderer for the match event table.
+
+render_grid() produces the same text as
+tabulate(rows, headers, tablefmt="grid", stralign="left") for tables of
+single-line text cells, without tabulate's per-cell type inference. Cells are
+measured with display_width, which answers most of them from its cache.
+"""
+
+from typing import List, Sequence
+
+from tabulate import tabulate
+
+from display_width import display_width
+
+
+def _tabulate_grid(rows: Sequence[Sequence[str]], headers: Sequence[str]) -> str:
+    return str(
+        tabulate(
+            rows,
+            headers=list(headers),
+            tablefmt="grid",
+            numalign="left",
+            stralign="left",
+        )
+    )
+
+
+def render_grid(rows: Sequence[Sequence[str]], headers: Sequence[str]) -> str:
+    """Renders rows of text cells as a left-aligned grid table.
+
+    Tables with ANSI codes, line breaks or other non-printable characters are
+    left to tabulate, which handles them specially.
+
+    Args:
+        rows: The table rows, each with one string per header
+        headers: The column headers
+
+    Returns:
+        The table, identical to tabulate's "grid" format with stralign="left"
+    """
+    # tabulate strips data cells but not headers
+    table = [list(headers)] + [[cell.strip() for cell in row] for row in rows]
+    cell_widths: List[List[int]] = []
+    for row in table:
+        row_widths = []
+        for cell in row:
+            width = display_width(cell)
+            if width < 0:
+                return _tabulate_grid(rows, headers)
+            row_widths.append(width)
+        cell_widths.append(row_widths)
+
+    # Columns are at least two wider than their header, as in tabulate
+    widths = [width + 2 for width in cell_widths[0]]
+    for row_widths in cell_widths[1:]:
+        widths = [max(width, cell) for width, cell in zip(widths, row_widths)]
+
+    rule = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    lines: List[str] = [rule]
+    for index, (row, row_widths) in enumerate(zip(table, cell_widths)):
+        padded = [
+            cell + " " * (width - cell_width)
+            for cell, cell_width, width in zip(row, row_widths, widths)
+        ]
+        lines.append("| " + " | ".join(padded) + " |")
+        if index == 0:
+            lines.append("+" + "+".join("=" * (width + 2) for width in widths) + "+")
+        else:
+            lines.append(rule)
+    return "\n".join(lines)
@@ -0,0 +1,423 @@
+"""Local SQLite archive of reported matches.
+
+Everything fetched for a match is gone once the reporter moves on to the
+next one. MatchArchive keeps it in a SQLite database: the match list, the
+team sheets and officials, the confirmed events and the result of every
+reporting session. The archive is the reporter's offline cache, used when
+FOGIS cannot be reached, and a history that can be queried with SQL:
+
+    SELECT team_id, jersey, COUNT(*) FROM events
+    WHERE event_type IN (6, 39, 28, 29, 15, 14)
+    GROUP BY team_id, jersey ORDER BY 3 DESC;
+
+Events and scores arrive through ArchiveSink, an EventSink of the
+EventFanout, so the archive is written from the sink's worker thread and
+never delays the referee. The database runs in WAL mode, so other programs
+can read it while a match is being reported, and every call writes its rows
+with executemany in a single transaction.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from event_sinks import (
+    ACTION_REMOVED,
+    KIND_CONTROL,
+    KIND_EVENT,
+    KIND_SCORE,
+    EventSink,
+    SinkRecord,
+)
+from match_context import Score, Scores
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    ended_at TEXT
+);
+CREATE TABLE IF NOT EXISTS matches (
+    match_id INTEGER PRIMARY KEY,
+    team1_id INTEGER,
+    team2_id INTEGER,
+    team1_name TEXT,
+    team2_name TEXT,
+    session_id INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS players (
+    match_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    player_id INTEGER,
+    participant_id INTEGER,
+    jersey INTEGER,
+    name TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS players_team_jersey ON players (team_id, jersey);
+CREATE TABLE IF NOT EXISTS officials (
+    match_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    name TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS officials_team ON officials (team_id);
+CREATE TABLE IF NOT EXISTS events (
+    event_id INTEGER PRIMARY KEY,
+    match_id INTEGER NOT NULL,
+    event_type INTEGER,
+    team_id INTEGER,
+    player_id INTEGER,
+    period INTEGER,
+    minute INTEGER,
+    jersey INTEGER,
+    jersey_out INTEGER,
+    session_id INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_match ON events (match_id);
+CREATE INDEX IF NOT EXISTS events_type_period ON events (event_type, period);
+CREATE TABLE IF NOT EXISTS results (
+    session_id INTEGER NOT NULL,
+    match_id INTEGER NOT NULL,
+    home INTEGER NOT NULL,
+    away INTEGER NOT NULL,
+    halftime_home INTEGER NOT NULL,
+    halftime_away INTEGER NOT NULL,
+    reported INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (session_id, match_id)
+);
+"""
+
+# Scores computed from the events never replace a result reported to FOGIS
+_UPSERT_RESULT = """
+INSERT INTO results (
+    session_id, match_id, home, away, halftime_home, halftime_away, reported,
+    updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (session_id, match_id) DO UPDATE SET
+    home = excluded.home,
+    away = excluded.away,
+    halftime_home = excluded.halftime_home,
+    halftime_away = excluded.halftime_away,
+    reported = excluded.reported,
+    updated_at = excluded.updated_at
+WHERE results.reported = 0 OR excluded.reported = 1
+"""
+
+_UPSERT_EVENT = """
+INSERT OR REPLACE INTO events (
+    event_id, match_id, event_type, team_id, player_id, period, minute, jersey,
+    jersey_out, session_id, data
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _player_name(player: Dict[str, Any]) -> Optional[str]:
+    if "fornamn" in player and "efternamn" in player:
+        return f"{player['fornamn']} {player['efternamn']}"
+    name = player.get("namn") or player.get("name")
+    return str(name) if name else None
+
+
+class MatchArchive:
+    """A SQLite database of matches, team sheets, events and results.
+
+    Every MatchArchive is one reporting session. The connection is shared by
+    the reporting thread and the ArchiveSink worker, so all access goes
+    through a lock.
+    """
+
+    def __init__(self, path: str):
+        """Opens or creates the archive and starts a session.
+
+        Args:
+            path: The database file, or ":memory:"
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            cursor = self._connection.execute(
+                "INSERT INTO sessions (started_at) VALUES (?)", (_utc_now(),)
+            )
+        self.session_id = int(cursor.lastrowid or 0)
+
+    def close(self) -> None:
+        """Ends the session and closes the database."""
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE sessions SET ended_at = ? WHERE session_id = ?",
+                    (_utc_now(), self.session_id),
+                )
+            self._connection.close()
+
+    def store_matches(self, matches: List[Dict[str, Any]]) -> None:
+        """Stores the match list as fetched by fetch_matches_list_json."""
+        rows = [
+            (
+                match["matchid"],
+                match.get("matchlag1id"),
+                match.get("matchlag2id"),
+                match.get("lag1namn"),
+                match.get("lag2namn"),
+                self.session_id,
+                _dumps(match),
+            )
+            for match in matches
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def store_team_sheet(
+        self,
+        match_id: int,
+        team_id: int,
+        players: Optional[List[Dict[str, Any]]],
+        officials: Optional[List[Dict[str, Any]]],
+    ) -> None:
+        """Replaces the players and officials of a team.
+
+        Args:
+            match_id: The match the team sheet belongs to
+            team_id: The team (matchlagid)
+            players: The fetched players; None leaves the archived ones
+            officials: The fetched officials; None leaves the archived ones
+        """
+        with self._lock, self._connection:
+            if players is not None:
+                self._connection.execute(
+                    "DELETE FROM players WHERE team_id = ?", (team_id,)
+                )
+                self._connection.executemany(
+                    "INSERT INTO players VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            match_id,
+                            team_id,
+                            player.get("spelareid"),
+                            player.get("matchdeltagareid"),
+                            player.get("trojnummer"),
+                            _player_name(player),
+                            _dumps(player),
+                        )
+                        for player in players
+                    ],
+                )
+            if officials is not None:
+                self._connection.execute(
+                    "DELETE FROM officials WHERE team_id = ?", (team_id,)
+                )
+                self._connection.executemany(
+                    "INSERT INTO officials VALUES (?, ?, ?, ?)",
+                    [
+                        (match_id, team_id, _player_name(official), _dumps(official))
+                        for official in officials
+                    ],
+                )
+
+    def store_changes(
+        self,
+        events: Iterable[Tuple[int, Dict[str, Any]]],
+        removed_event_ids: Iterable[int],
+        scores: Iterable[Tuple[int, Scores]],
+    ) -> None:
+        """Stores event changes and computed scores in one transaction.
+
+        Args:
+            events: (match id, event) of added and changed events
+            removed_event_ids: Events deleted from FOGIS
+            scores: (match id, scores) computed from the confirmed events
+        """
+        event_rows = [
+            (
+                event["matchhandelseid"],
+                match_id,
+                event.get("matchhandelsetypid"),
+                event.get("matchlagid"),
+                event.get("spelareid"),
+                event.get("period"),
+                event.get("matchminut"),
+                event.get("trojnummer"),
+                event.get("trojnummer2"),
+                self.session_id,
+                _dumps(event),
+            )
+            for match_id, event in events
+        ]
+        now = _utc_now()
+        result_rows = [
+            self._result_row(match_id, match_scores, False, now)
+            for match_id, match_scores in scores
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM events WHERE event_id = ?",
+                [(event_id,) for event_id in removed_event_ids],
+            )
+            self._connection.executemany(_UPSERT_EVENT, event_rows)
+            self._connection.executemany(_UPSERT_RESULT, result_rows)
+
+    def store_result(self, match_id: int, scores: Scores) -> None:
+        """Stores the result reported to FOGIS in this session."""
+        row = self._result_row(match_id, scores, True, _utc_now())
+        with self._lock, self._connection:
+            self._connection.execute(_UPSERT_RESULT, row)
+
+    def _result_row(
+        self, match_id: int, scores: Scores, reported: bool, updated_at: str
+    ) -> Tuple[Any, ...]:
+        return (
+            self.session_id,
+            match_id,
+            scores.regular_time.home,
+            scores.regular_time.away,
+            scores.halftime.home,
+            scores.halftime.away,
+            int(reported),
+            updated_at,
+        )
+
+    def matches(self) -> List[Dict[str, Any]]:
+        """Returns the archived match list."""
+        return self._documents("SELECT data FROM matches ORDER BY match_id", ())
+
+    def team_players(self, team_id: int) -> Optional[List[Dict[str, Any]]]:
+        """Returns the archived players of a team, or None if there are none."""
+        return (
+            self._documents(
+                "SELECT data FROM players WHERE team_id = ? ORDER BY rowid", (team_id,)
+            )
+            or None
+        )
+
+    def team_officials(self, team_id: int) -> Optional[List[Dict[str, Any]]]:
+        """Returns the archived officials of a team, or None if there are none."""
+        return (
+            self._documents(
+                "SELECT data FROM officials WHERE team_id = ? ORDER BY rowid",
+                (team_id,),
+            )
+            or None
+        )
+
+    def match_events(self, match_id: int) -> Optional[List[Dict[str, Any]]]:
+        """Returns the archived events of a match, or None if there are none."""
+        return (
+            self._documents(
+                "SELECT data FROM events WHERE match_id = ? ORDER BY event_id",
+                (match_id,),
+            )
+            or None
+        )
+
+    def result(self, match_id: int) -> Optional[Scores]:
+        """Returns the latest archived result of a match.
+
+        A result reported to FOGIS is preferred over a computed one.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT home, away, halftime_home, halftime_away FROM results"
+                " WHERE match_id = ? ORDER BY reported DESC, session_id DESC"
+                " LIMIT 1",
+                (match_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return Scores(
+            regular_time=Score(row[0], row[1]), halftime=Score(row[2], row[3])
+        )
+
+    def event_rows(self) -> List[Tuple[int, int, int, int, int]]:
+        """Returns (type id, team id, player id, period, minute) of every event.
+
+        Missing values are -1, so the rows can be loaded into integer columns.
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COALESCE(event_type, -1), COALESCE(team_id, -1),"
+                " COALESCE(player_id, -1), COALESCE(period, -1),"
+                " COALESCE(minute, -1) FROM events"
+            ).fetchall()
+
+    def team_names(self) -> Dict[int, str]:
+        """Returns the team name of every archived team id (matchlagid)."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT team1_id, team1_name FROM matches"
+                " UNION SELECT team2_id, team2_name FROM matches"
+            ).fetchall()
+        return {team_id: name for team_id, name in rows if team_id is not None}
+
+    def player_names(self) -> Dict[int, str]:
+        """Returns the name of every archived player id (spelareid)."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT player_id, name FROM players"
+                " WHERE player_id IS NOT NULL AND name IS NOT NULL"
+            ).fetchall()
+        return dict(rows)
+
+    def _documents(self, sql: str, parameters: Tuple[Any, ...]) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._connection.execute(sql, parameters).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+
+class ArchiveSink(EventSink):
+    """Stores the event changes and scores of the fanout in a MatchArchive."""
+
+    name = "archive"
+
+    def __init__(self, archive: MatchArchive):
+        """Initializes the sink.
+
+        Args:
+            archive: The archive written to; not closed by the sink
+        """
+        self.archive = archive
+
+    def deliver(self, records: List[SinkRecord]) -> None:
+        """Writes the net changes of the batch in one transaction."""
+        # event id -> (match id, event), or None once removed
+        events: Dict[int, Optional[Tuple[int, Dict[str, Any]]]] = {}
+        scores: Dict[int, Scores] = {}
+        for record in records:
+            fields = record.fields
+            if record.kind in (KIND_EVENT, KIND_CONTROL):
+                if fields["action"] == ACTION_REMOVED:
+                    events[fields["event_id"]] = None
+                elif record.source is not None:
+                    events[fields["event_id"]] = (fields["match_id"], record.source)
+            elif record.kind == KIND_SCORE:
+                scores[fields["match_id"]] = Scores(
+                    regular_time=Score(fields["home"], fields["away"]),
+                    halftime=Score(fields["halftime_home"], fields["halftime_away"]),
+                )
+        self.archive.store_changes(
+            [change for change in events.values() if change is not None],
+            [event_id for event_id, change in events.items() if change is None],
+            scores.items(),
+        )
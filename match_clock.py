@@ -0,0 +1,267 @@
+"""Per-match clock model shared by the control event menu and minute parsing.
+
+The period structure of a match (number and length of regular and extra time
+periods) is fixed once the match is selected. MatchClockModel computes the
+period boundaries once and answers minute → period and timestamp → control
+event questions with table lookups instead of rebuilding the boundaries on
+every call.
+
+LiveMatchClock follows the match in real time: it runs from a reported Period
+Start until the Period End, so event prompts can offer the current minute.
+"""
+
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from control_event_planner import GAME_END, PERIOD_END, PERIOD_START
+from match_context import MatchContext
+
+# (event_type_id, event_type_name, period)
+ControlEventClassification = Tuple[int, str, int]
+
+
+@dataclass(frozen=True)
+class PeriodBoundary:
+    """First and last minute of a period."""
+
+    period: int
+    start_minute: int
+    end_minute: int
+    is_extra_time: bool
+
+
+class MatchClockModel:
+    """Period boundaries and minute lookups for one match structure."""
+
+    def __init__(
+        self,
+        num_periods: int,
+        period_length: int,
+        num_extra_periods: int,
+        extra_period_length: int,
+    ):
+        """Computes the period boundaries and lookup tables.
+
+        Args:
+            num_periods: Number of regular time periods
+            period_length: Length of a regular time period in minutes
+            num_extra_periods: Number of extra time periods (0 if none)
+            extra_period_length: Length of an extra time period in minutes
+        """
+        self.num_periods = num_periods
+        self.period_length = period_length
+        self.num_extra_periods = num_extra_periods
+        self.extra_period_length = extra_period_length
+        self.total_regular_time = num_periods * period_length
+        self.total_time = (
+            self.total_regular_time + num_extra_periods * extra_period_length
+        )
+
+        boundaries: List[PeriodBoundary] = []
+        for i in range(1, num_periods + 1):
+            boundaries.append(
+                PeriodBoundary(i, 1 + (i - 1) * period_length, i * period_length, False)
+            )
+        for i in range(1, num_extra_periods + 1):
+            boundaries.append(
+                PeriodBoundary(
+                    num_periods + i,
+                    self.total_regular_time + 1 + (i - 1) * extra_period_length,
+                    self.total_regular_time + i * extra_period_length,
+                    True,
+                )
+            )
+        self.boundaries: Tuple[PeriodBoundary, ...] = tuple(boundaries)
+
+        # Index 0 is unused so that the list can be indexed by match minute
+        self._period_by_minute: List[int] = [0]
+        for boundary in self.boundaries:
+            self._period_by_minute.extend(
+                [boundary.period] * (boundary.end_minute - boundary.start_minute + 1)
+            )
+
+        last_period = num_periods + num_extra_periods
+        self._control_events: Dict[int, ControlEventClassification] = {}
+        for boundary in self.boundaries:
+            self._control_events.setdefault(
+                boundary.start_minute, (PERIOD_START, "Period Start", boundary.period)
+            )
+            if boundary.period == last_period:
+                # Last period of the match - both Period End and Game End
+                end_event = (GAME_END, "Game End", boundary.period)
+            else:
+                end_event = (PERIOD_END, "Period End", boundary.period)
+            self._control_events.setdefault(boundary.end_minute, end_event)
+
+        self.timestamp_help_lines: Tuple[str, ...] = tuple(self._help_lines())
+
+    def _help_lines(self) -> List[str]:
+        lines = []
+        last_period = self.num_periods + self.num_extra_periods
+        for boundary in self.boundaries:
+            game_end = " and End of Game" if boundary.period == last_period else ""
+            if boundary.is_extra_time:
+                name = f"Extra Time Period {boundary.period - self.num_periods}"
+            else:
+                name = f"Period {boundary.period}"
+            lines.append(f"  {boundary.start_minute} → Start of {name}")
+            lines.append(f"  {boundary.end_minute} → End of {name}{game_end}")
+        return lines
+
+    def period_for_minute(self, minute: int) -> int:
+        """Returns the period a match minute (without stoppage time) falls in.
+
+        Raises:
+            ValueError: If the minute is outside the match
+        """
+        if minute <= 0 or minute > self.total_time:
+            raise ValueError(
+                "Invalid minute. Please enter a value within the valid range."
+            )
+        return self._period_by_minute[minute]
+
+    def period_start_minute(self, period: int) -> int:
+        """Returns the first minute of a period."""
+        return self.boundaries[period - 1].start_minute
+
+    def classify_timestamp(self, timestamp: int) -> ControlEventClassification:
+        """Returns the control event that a period boundary minute stands for.
+
+        Raises:
+            ValueError: If the timestamp is not a period start or end
+        """
+        try:
+            return self._control_events[timestamp]
+        except KeyError:
+            raise ValueError(
+                f"Timestamp {timestamp} doesn't correspond to a period start or end."
+            ) from None
+
+    def parse_minute(self, minute_str: str) -> Tuple[int, int]:
+        """Parses a minute entered by the user into (match minute, period).
+
+        Stoppage time ("45+2") is added to the base minute and counts towards
+        the period of the base minute.
+
+        Raises:
+            ValueError: If the input is not a valid minute for this match
+        """
+        try:
+            if "+" in minute_str:
+                parts = minute_str.split("+")
+                base_minute = int(parts[0])
+                stoppage_time = (
+                    int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+                )
+                if base_minute > self.total_time:
+                    raise ValueError(
+                        "Invalid minute. Stoppage time can only be added to a"
+                        " minute within the match."
+                    )
+                period = self.period_for_minute(base_minute)
+                return base_minute + stoppage_time, period
+
+            minute = int(minute_str)
+            return minute, self.period_for_minute(minute)
+        except ValueError as err:
+            raise ValueError(f"Invalid minute format: {err}") from err
+
+
+@dataclass(frozen=True)
+class ClockReading:
+    """The match time shown by a LiveMatchClock at one instant."""
+
+    period: int
+    minute: int  # matchminut, stoppage time included
+    second: int
+    stoppage: int  # Minutes played after the scheduled end of the period
+    running: bool
+
+    @property
+    def display(self) -> str:
+        """The minute as a referee writes it, e.g. "45+2"."""
+        if self.stoppage > 0:
+            return f"{self.minute - self.stoppage}+{self.stoppage}"
+        return str(self.minute)
+
+
+class LiveMatchClock:
+    """Match clock that runs from Period Start until Period End.
+
+    Elapsed time is measured with a monotonic clock, so changes to the system
+    time during the match do not affect the reported minutes.
+    """
+
+    def __init__(
+        self,
+        model: MatchClockModel,
+        time_source: Callable[[], float] = time.monotonic,
+    ):
+        """Initializes a stopped clock.
+
+        Args:
+            model: The clock model of the match
+            time_source: Monotonic time in seconds, replaceable for testing
+        """
+        self.model = model
+        self._time_source = time_source
+        self._period: Optional[int] = None
+        self._started_at = 0.0
+        self._stopped_at: Optional[float] = None
+
+    @property
+    def is_running(self) -> bool:
+        """True between a Period Start and the following Period End."""
+        return self._period is not None and self._stopped_at is None
+
+    def start_period(self, period: int) -> None:
+        """Starts the clock at the first minute of a period."""
+        self._period = period
+        self._started_at = self._time_source()
+        self._stopped_at = None
+
+    def stop_period(self) -> None:
+        """Pauses the clock at the end of the running period."""
+        if self.is_running:
+            self._stopped_at = self._time_source()
+
+    def reading(self) -> Optional[ClockReading]:
+        """Returns the current match time, or None before the first period."""
+        if self._period is None:
+            return None
+        now = self._stopped_at if self._stopped_at is not None else self._time_source()
+        elapsed_minutes, second = divmod(int(now - self._started_at), 60)
+        boundary = self.model.boundaries[self._period - 1]
+        minute = boundary.start_minute + elapsed_minutes
+        return ClockReading(
+            period=self._period,
+            minute=minute,
+            second=second,
+            stoppage=max(0, minute - boundary.end_minute),
+            running=self.is_running,
+        )
+
+
+@lru_cache(maxsize=16)
+def get_match_clock(
+    num_periods: int,
+    period_length: int,
+    num_extra_periods: int,
+    extra_period_length: int,
+) -> MatchClockModel:
+    """Returns the shared clock model for a match structure."""
+    return MatchClockModel(
+        num_periods, period_length, num_extra_periods, extra_period_length
+    )
+
+
+def match_clock_for(match_context: MatchContext) -> MatchClockModel:
+    """Returns the clock model for the structure of the given match."""
+    return get_match_clock(
+        match_context.num_periods,
+        match_context.period_length,
+        match_context.num_extra_periods,
+        match_context.extra_period_length,
+    )
@@ -1,10 +1,43 @@
 """Data classes for storing match context and score information."""
 
+import threading
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+    overload,
+)
 
 from fogis_api_client.fogis_api_client import FogisApiClient
 
+if TYPE_CHECKING:
+    from event_payload_builder import EventPayloadBuilder
+    from event_poller import EventPoller
+    from match_archive import MatchArchive
+    from match_clock import LiveMatchClock
+    from match_event_sync import EventDelta, EventFingerprint, MatchEventIndex
+    from optimistic_reporting import OptimisticReporter
+    from results_pipeline import ResultsPipeline
+
+T = TypeVar('T')
+
+# Marks events in match_events_json that the server has not confirmed yet
+PENDING_EVENT_KEY = "pending"
+
+
+def confirmed_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Returns the events that are known to be stored on the server."""
+    return [event for event in events if not event.get(PENDING_EVENT_KEY)]
+
 
 @dataclass
 class Score:
@@ -48,11 +81,261 @@ class MatchContext:
     team1_id: int
     team2_id: int
     match_id: int
+    # Live match clock, None unless the referee has turned it on
+    live_clock: Optional['LiveMatchClock'] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Background poller for events reported from other devices, if enabled
+    event_poller: Optional['EventPoller'] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Background reporter for optimistic mode, None when reporting directly
+    optimistic_reporter: Optional['OptimisticReporter'] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Last result report, kept so an interrupted report can be resumed
+    results_pipeline: Optional['ResultsPipeline'] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Local archive of the session, if enabled
+    archive: Optional['MatchArchive'] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Set by background threads when the running scores must be re-checked;
+    # the menus run the check on the reporting thread
+    reconcile_requested: threading.Event = field(
+        default_factory=threading.Event, init=False, repr=False, compare=False
+    )
+    # New events whose every submission attempt failed, see submit_event
+    unresolved_submissions: Dict['EventFingerprint', int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Payload builder of the match, created on first use by payload_builder_for
+    payload_builder: Optional['EventPayloadBuilder'] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Incremented whenever the event list changes; derived caches key on it
+    version: int = field(default=0, init=False, compare=False)
+    # Index of the current event list
+    event_index: Optional['MatchEventIndex'] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_events: Optional[List[Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # match_events_json is _server_events followed by _pending_events
+    _server_events: List[Dict[str, Any]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _pending_events: List[Dict[str, Any]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # name -> (version, value) for values derived from the event list
+    _derived: Dict[str, Tuple[int, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Messages from background work, shown in the next menu header
+    _notices: Deque[str] = field(
+        default_factory=lambda: deque(maxlen=20),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    # Called with (version, events) after every change of the event list
+    _listeners: List[Callable[[int, List[Dict[str, Any]]], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Guards the event list, its index, the version and the derived caches
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False, compare=False
+    )
+
+    def _refresh_index(self) -> 'MatchEventIndex':
+        """Reindexes match_events_json if it was replaced by direct assignment.
+
+        Must be called with the lock held. Event lists are never modified in
+        place; every update installs a new list, so a reader holding an old
+        list keeps a consistent view of it.
+        """
+        from match_event_sync import MatchEventIndex
+
+        if (
+            self.event_index is None
+            or self._indexed_events is not self.match_events_json
+        ):
+            self.event_index = MatchEventIndex(self.team1_id, self.team2_id)
+            self.event_index.apply(self.match_events_json or [])
+            self._indexed_events = self.match_events_json
+            self._server_events = self.match_events_json or []
+            self._pending_events = []
+            self.version += 1
+        return self.event_index
+
+    def _install_events(self, server_events: List[Dict[str, Any]]) -> 'EventDelta':
+        """Installs server events plus pending local events as the event list.
+
+        Bumps the version if the list changed. Must be called with the lock held.
+        """
+        index = self._refresh_index()
+        events = (
+            server_events + self._pending_events
+            if self._pending_events
+            else server_events
+        )
+        delta = index.apply(events)
+        self.match_events_json = events
+        self._indexed_events = events
+        self._server_events = server_events
+        if not delta.is_empty:
+            self.version += 1
+            for listener in self._listeners:
+                listener(self.version, events)
+        return delta
+
+    def _remove_pending(self, event: Dict[str, Any]) -> None:
+        self._pending_events = [
+            pending for pending in self._pending_events if pending is not event
+        ]
+
+    @overload
+    def apply_server_events(
+        self, server_events: List[Dict[str, Any]]
+    ) -> 'EventDelta':
+        ...
+
+    @overload
+    def apply_server_events(
+        self, server_events: List[Dict[str, Any]], expected_version: int
+    ) -> Optional['EventDelta']:
+        ...
+
+    def apply_server_events(
+        self,
+        server_events: List[Dict[str, Any]],
+        expected_version: Optional[int] = None,
+    ) -> Optional['EventDelta']:
+        """Applies a fresh server event list and returns what changed.
+
+        The event index is patched with the delta only, instead of every
+        derived view being recomputed from the full list. Pending local
+        events stay at the end of the list until they are resolved.
+
+        Args:
+            server_events: The event list fetched from the server
+            expected_version: The version the list was fetched at. If the
+                event list has changed since, the fetched list may be older
+                than the local state and is not applied.
+
+        Returns:
+            What changed, or None if the version no longer matched
+        """
+        with self._lock:
+            self._refresh_index()
+            if expected_version is not None and self.version != expected_version:
+                return None
+            return self._install_events(server_events)
+
+    def append_local_event(self, event: Dict[str, Any]) -> int:
+        """Appends an event that has not been confirmed by the server yet.
+
+        The event stays in the list until confirm_local_event() or
+        discard_local_event() is called with the same dictionary.
+
+        Returns:
+            The version of the event list that contains the event
+        """
+        with self._lock:
+            self._refresh_index()
+            self._pending_events = self._pending_events + [event]
+            self._install_events(self._server_events)
+            return self.version
+
+    def confirm_local_event(
+        self,
+        event: Dict[str, Any],
+        server_events: Optional[List[Dict[str, Any]]] = None,
+    ) -> 'EventDelta':
+        """Replaces a pending event by its server version.
+
+        Args:
+            event: The dictionary passed to append_local_event()
+            server_events: The server event list containing the event. If None,
+                the event is kept, without pending marker, until the next sync.
+        """
+        with self._lock:
+            self._refresh_index()
+            self._remove_pending(event)
+            if server_events is None:
+                confirmed = {
+                    key: value
+                    for key, value in event.items()
+                    if key != PENDING_EVENT_KEY
+                }
+                server_events = self._server_events + [confirmed]
+            return self._install_events(server_events)
+
+    def discard_local_event(self, event: Dict[str, Any]) -> 'EventDelta':
+        """Removes a pending event that the server did not accept."""
+        with self._lock:
+            self._refresh_index()
+            self._remove_pending(event)
+            return self._install_events(self._server_events)
+
+    def add_listener(
+        self, listener: Callable[[int, List[Dict[str, Any]]], None]
+    ) -> None:
+        """Calls listener(version, events) whenever the event list changes.
+
+        The listener runs with the context lock held, in the thread that made
+        the change, so it must only hand the list off, not process it.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(
+        self, listener: Callable[[int, List[Dict[str, Any]]], None]
+    ) -> None:
+        """Stops calling a listener added with add_listener()."""
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def post_notice(self, notice: str) -> None:
+        """Queues a message for the next menu header."""
+        self._notices.append(notice)
+
+    def drain_notices(self) -> List[str]:
+        """Returns and clears the queued menu header messages."""
+        notices = []
+        while self._notices:
+            notices.append(self._notices.popleft())
+        return notices
+
+    def snapshot(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """Returns the current version and event list as a consistent pair."""
+        with self._lock:
+            self._refresh_index()
+            return self.version, self.match_events_json
+
+    def derived(self, name: str, compute: Callable[[], T]) -> T:
+        """Returns a value derived from the events, cached per version.
+
+        compute() runs with the lock held, so it sees the same event list and
+        scores as the version the result is cached under.
+        """
+        with self._lock:
+            self._refresh_index()
+            cached = self._derived.get(name)
+            if cached is not None and cached[0] == self.version:
+                return cast(T, cached[1])
+            value = compute()
+            self._derived[name] = (self.version, value)
+            return value
 
     @property
     def scores(self) -> 'Scores':
-        """Dynamically calculates and returns all scores for the match."""
+        """Returns all scores for the match, calculated once per version."""
         from fogis_data_parser import FogisDataParser
-        # Use explicit cast to ensure correct return type
-        from typing import cast
-        return cast('Scores', FogisDataParser.calculate_scores(self))
+
+        return self.derived(
+            "scores", lambda: cast('Scores', FogisDataParser.calculate_scores(self))
+        )
@@ -0,0 +1,375 @@
+"""Full-screen dashboard for reporting a match.
+
+The menus print a new header, score and event table after every action, so
+the screen scrolls and the referee loses the overview. MatchDashboard keeps
+a persistent score header, an event timeline pane, a status line and a
+command line on screen. Commands run the existing menu actions; while one
+runs the dashboard is suspended and the terminal behaves as before.
+
+Each tick the dashboard renders the text of every region and only rewrites
+the screen lines that differ from what is already drawn, so a new event or
+a score change touches a few lines instead of repainting the terminal. The
+timeline is rebuilt only when the context's event list version changes.
+Refreshing from the server runs in a background thread, so the dashboard
+keeps redrawing the clock and accepting input while the API is slow.
+"""
+
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from display_width import display_width, ljust
+from emoji_config import EVENT_EMOJIS, MENU_EMOJIS
+from match_context import PENDING_EVENT_KEY, MatchContext
+
+try:
+    import curses
+except ImportError:  # Not available in the Windows standard library
+    curses = None  # type: ignore[assignment]
+
+# Regions from top to bottom
+REGION_HEADER = "header"
+REGION_TIMELINE = "timeline"
+REGION_STATUS = "status"
+REGION_COMMAND = "command"
+
+HEADER_ROWS = 4  # Title, score, clock, rule
+STATUS_ROWS = 3  # Rule and two notices
+COMMAND_ROWS = 1
+
+# Milliseconds to wait for a key before redrawing the clock
+TICK_MS = 250
+
+# Key -> (label, action run with the menus' terminal I/O)
+DashboardActions = Dict[str, Tuple[str, Callable[[MatchContext], Any]]]
+
+
+@dataclass(frozen=True)
+class Region:
+    """Screen rows assigned to a region."""
+
+    top: int
+    rows: int
+
+
+def layout(height: int) -> Dict[str, Region]:
+    """Divides a terminal of the given height into the dashboard regions.
+
+    The timeline gets every row the other regions do not need, but at least
+    one.
+    """
+    timeline_rows = max(1, height - HEADER_ROWS - STATUS_ROWS - COMMAND_ROWS)
+    status_top = HEADER_ROWS + timeline_rows
+    return {
+        REGION_HEADER: Region(0, HEADER_ROWS),
+        REGION_TIMELINE: Region(HEADER_ROWS, timeline_rows),
+        REGION_STATUS: Region(status_top, STATUS_ROWS),
+        REGION_COMMAND: Region(status_top + STATUS_ROWS, COMMAND_ROWS),
+    }
+
+
+def clip(text: str, width: int) -> str:
+    """Shortens text to at most width terminal columns."""
+    if display_width(text) <= width:
+        return text
+    while text and display_width(text) > width:
+        text = text[:-1]
+    return text
+
+
+class LineDiffer:
+    """Remembers the drawn screen lines and reports which ones changed."""
+
+    def __init__(self) -> None:
+        """Initializes an empty screen."""
+        self._drawn: Dict[int, str] = {}
+
+    def changes(
+        self, regions: Dict[str, Region], content: Dict[str, List[str]]
+    ) -> List[Tuple[int, str]]:
+        """Returns (row, text) for every row whose text differs from the screen.
+
+        Regions are filled with their lines from the top; rows without a
+        line are blank. The returned rows are recorded as drawn.
+        """
+        changed = []
+        for name, region in regions.items():
+            lines = content.get(name, [])
+            for offset in range(region.rows):
+                row = region.top + offset
+                text = lines[offset] if offset < len(lines) else ""
+                if self._drawn.get(row) != text:
+                    self._drawn[row] = text
+                    changed.append((row, text))
+        return changed
+
+    def invalidate(self) -> None:
+        """Forgets the drawn lines, e.g. after the screen was cleared."""
+        self._drawn.clear()
+
+
+class DashboardView:
+    """Builds the lines of each region from the match context."""
+
+    def __init__(
+        self,
+        match_context: MatchContext,
+        event_types: Dict[int, Dict[str, Any]],
+        actions: DashboardActions,
+    ):
+        """Initializes the view.
+
+        Args:
+            match_context: The match shown
+            event_types: Event type id -> {"name": ...}, as in fogis_api_client
+            actions: The commands listed in the command line
+        """
+        self.match_context = match_context
+        self.event_types = event_types
+        self.actions = actions
+        self.notices: Deque[str] = deque(maxlen=STATUS_ROWS - 1)
+        self.busy: Optional[str] = None
+
+    def header_lines(self, width: int) -> List[str]:
+        """Returns the title, score, clock and rule lines."""
+        context = self.match_context
+        scores = context.scores
+        lines = [
+            f"{context.team1_name} vs {context.team2_name}",
+            f"SCORE: {context.team1_name} {scores.regular_time.home} -"
+            f" {scores.regular_time.away} {context.team2_name}"
+            f"   (HT {scores.halftime.home} - {scores.halftime.away})",
+        ]
+        clock_line = ""
+        if context.live_clock is not None:
+            reading = context.live_clock.reading()
+            if reading is None:
+                clock_line = f"{MENU_EMOJIS['live_clock']} waiting for Period Start"
+            else:
+                state = "running" if reading.running else "paused"
+                clock_line = (
+                    f"{MENU_EMOJIS['live_clock']} {reading.display}:"
+                    f"{reading.second:02d} (period {reading.period}, {state})"
+                )
+        lines.append(clock_line)
+        lines.append("=" * width)
+        return lines
+
+    def timeline_line(self, event: Dict[str, Any]) -> str:
+        """Returns the timeline entry of one event."""
+        context = self.match_context
+        type_name = self.event_types.get(event.get("matchhandelsetypid", 0), {}).get(
+            "name", "Unknown Event"
+        )
+        emoji = EVENT_EMOJIS.get(type_name, " ")
+        team_id = event.get("matchlagid")
+        if team_id == context.team1_id:
+            team_name = context.team1_name
+        elif team_id == context.team2_id:
+            team_name = context.team2_name
+        else:
+            team_name = ""
+        line = f"{event.get('matchminut') or 0:>3}'  {ljust(emoji, 2)} {type_name}"
+        if team_name:
+            line += f" - {team_name}"
+        jersey = event.get("trojnummer")
+        if jersey:
+            line += f" #{jersey}"
+            jersey_out = event.get("trojnummer2")
+            if jersey_out:
+                line += f" for #{jersey_out}"
+        if event.get(PENDING_EVENT_KEY):
+            line += " (pending)"
+        return line
+
+    def timeline_lines(self) -> List[str]:
+        """Returns the timeline of all events, oldest first.
+
+        Cached per event list version, so the timeline is rebuilt only after
+        an event was reported, edited or synced.
+        """
+
+        def build() -> List[str]:
+            events = sorted(
+                self.match_context.match_events_json or [],
+                key=lambda event: (
+                    event.get("period") or 0,
+                    event.get("matchminut") or 0,
+                ),
+            )
+            if not events:
+                return ["No events reported yet."]
+            return [self.timeline_line(event) for event in events]
+
+        return self.match_context.derived("dashboard_timeline", build)
+
+    def status_lines(self, width: int) -> List[str]:
+        """Returns the rule and the latest notices or background activity."""
+        lines = ["-" * width]
+        if self.busy is not None:
+            lines.append(f"{MENU_EMOJIS['sync']} {self.busy}...")
+            lines.extend(list(self.notices)[-(STATUS_ROWS - 2) :])
+        else:
+            lines.extend(self.notices)
+        return lines
+
+    def command_line(self, entered: str) -> str:
+        """Returns the command line with the available commands."""
+        commands = "  ".join(
+            f"{key}:{label}" for key, (label, _) in self.actions.items()
+        )
+        return f"{commands}  r:refresh  q:quit > {entered}"
+
+    def render(
+        self, regions: Dict[str, Region], width: int, entered: str
+    ) -> Dict[str, List[str]]:
+        """Returns the lines of every region, clipped to the screen."""
+        timeline = self.timeline_lines()
+        # Keep the most recent events in view
+        visible = timeline[-regions[REGION_TIMELINE].rows :]
+        content = {
+            REGION_HEADER: self.header_lines(width),
+            REGION_TIMELINE: visible,
+            REGION_STATUS: self.status_lines(width),
+            # The last column of the last row cannot be written in curses
+            REGION_COMMAND: [self.command_line(entered)],
+        }
+        limit = {REGION_COMMAND: width - 1}
+        return {
+            name: [clip(line, limit.get(name, width)) for line in lines]
+            for name, lines in content.items()
+        }
+
+
+class MatchDashboard:
+    """Curses front end that runs the menu actions of a match."""
+
+    def __init__(
+        self,
+        match_context: MatchContext,
+        event_types: Dict[int, Dict[str, Any]],
+        actions: DashboardActions,
+    ):
+        """Initializes the dashboard.
+
+        Args:
+            match_context: The match being reported
+            event_types: Event type id -> {"name": ...}, as in fogis_api_client
+            actions: Key -> (label, action); each action gets the match context
+                and may use input() and print()
+        """
+        self.match_context = match_context
+        self.view = DashboardView(match_context, event_types, actions)
+        self.actions = actions
+        self.differ = LineDiffer()
+        self._entered = ""
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="dashboard"
+        )
+        self._refresh: Optional[Future[Any]] = None
+
+    def run(self) -> None:
+        """Shows the dashboard until the user quits."""
+        if curses is None:
+            raise RuntimeError("The dashboard requires the curses module")
+        try:
+            curses.wrapper(self._main)
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _main(self, screen: Any) -> None:
+        screen.timeout(TICK_MS)
+        while True:
+            self._collect_notices()
+            self._draw(screen)
+            try:
+                key = screen.get_wch()
+            except curses.error:
+                continue  # Timeout; redraw the clock
+            if key == curses.KEY_RESIZE:
+                screen.clear()
+                self.differ.invalidate()
+            elif key in ("\n", "\r", curses.KEY_ENTER):
+                command, self._entered = self._entered.strip(), ""
+                if command == "q":
+                    return
+                self._dispatch(screen, command)
+            elif key in ("\b", "\x7f", curses.KEY_BACKSPACE):
+                self._entered = self._entered[:-1]
+            elif isinstance(key, str) and key.isprintable():
+                self._entered += key
+
+    def _draw(self, screen: Any) -> None:
+        height, width = screen.getmaxyx()
+        regions = layout(height)
+        content = self.view.render(regions, width, self._entered)
+        changes = self.differ.changes(regions, content)
+        for row, text in changes:
+            if row >= height:
+                continue
+            screen.move(row, 0)
+            screen.clrtoeol()
+            screen.addstr(row, 0, text)
+        command_row = regions[REGION_COMMAND].top
+        if command_row < height:
+            cursor = min(width - 1, display_width(content[REGION_COMMAND][0]))
+            screen.move(command_row, cursor)
+        if changes:
+            screen.refresh()
+
+    def _collect_notices(self) -> None:
+        for notice in self.match_context.drain_notices():
+            self.view.notices.append(notice)
+        refresh = self._refresh
+        if refresh is not None and refresh.done():
+            self._refresh = None
+            self.view.busy = None
+            error = refresh.exception()
+            if error is not None:
+                self.view.notices.append(f"Refresh failed: {error}")
+
+    def _dispatch(self, screen: Any, command: str) -> None:
+        if command == "r":
+            self.start_refresh()
+        elif command in self.actions:
+            self._suspend(screen, self.actions[command][1])
+        elif command:
+            self.view.notices.append(f"Unknown command: {command}")
+
+    def start_refresh(self) -> "Future[Any]":
+        """Fetches the server events in the background.
+
+        Returns:
+            The running refresh; a second call while it runs returns it again
+        """
+        if self._refresh is not None:
+            return self._refresh
+        poller = self.match_context.event_poller
+        if poller is None:
+            from event_poller import EventPoller
+
+            poller = EventPoller(self.match_context)
+        self.view.busy = "Refreshing events"
+        self._refresh = self._executor.submit(poller.poll_once)
+        return self._refresh
+
+    def _suspend(self, screen: Any, action: Callable[[MatchContext], Any]) -> None:
+        """Runs an action on the normal terminal, then restores the dashboard."""
+        curses.def_prog_mode()
+        curses.endwin()
+        try:
+            action(self.match_context)
+        except KeyboardInterrupt:
+            print("\nBack to the dashboard.")
+        finally:
+            sys.stdout.flush()
+            curses.reset_prog_mode()
+            screen.clear()
+            self.differ.invalidate()
+
+
+def dashboard_available() -> bool:
+    """True if curses is available and the terminal is interactive."""
+    return curses is not None and sys.stdin.isatty() and sys.stdout.isatty()
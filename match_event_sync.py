@@ -0,0 +1,221 @@
+"""Delta synchronisation of match events.
+
+Diffs a freshly fetched server event list against the locally held one by
+``matchhandelseid`` and a content hash, so derived views only need to be
+patched for the events that were actually added, changed or removed.
+"""
+
+import hashlib
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from match_context import Score, Scores
+
+# Goal event types (regular, header, corner, free kick, own goal, penalty)
+GOAL_EVENT_TYPE_IDS = frozenset({6, 39, 28, 29, 15, 14})
+
+EventKey = Union[int, str]
+
+# (matchhandelsetypid, matchlagid, spelareid, period, matchminut)
+EventFingerprint = Tuple[int, int, int, int, int]
+
+
+def event_content_hash(event: Dict[str, Any]) -> str:
+    """Returns a stable hash of the full content of a match event."""
+    encoded = json.dumps(
+        event, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def events_list_hash(events: List[Dict[str, Any]]) -> str:
+    """Returns a hash of an event list that ignores the order of the events.
+
+    Serves as an ETag for fetch_match_events_json, which has none of its own.
+    """
+    digest = hashlib.sha1()
+    for content_hash in sorted(event_content_hash(event) for event in events):
+        digest.update(content_hash.encode("ascii"))
+    return digest.hexdigest()
+
+
+def event_fingerprint(event: Dict[str, Any]) -> EventFingerprint:
+    """Returns what identifies an event independently of its matchhandelseid.
+
+    An outgoing payload and the event the server stores for it have the same
+    fingerprint, so a payload can be found in the server list even when the
+    response carrying its id was lost.
+    """
+    return (
+        int(event.get("matchhandelsetypid") or 0),
+        int(event.get("matchlagid") or 0),
+        int(event.get("spelareid") or 0),
+        int(event.get("period") or 0),
+        int(event.get("matchminut") or 0),
+    )
+
+
+def fingerprint_counts(events: Iterable[Dict[str, Any]]) -> "Counter[EventFingerprint]":
+    """Counts the events in a list by fingerprint."""
+    return Counter(event_fingerprint(event) for event in events)
+
+
+def event_key(event: Dict[str, Any], content_hash: Optional[str] = None) -> EventKey:
+    """Returns the identity key of a match event.
+
+    Server events are identified by ``matchhandelseid``. Events without an id
+    (not yet stored by the server) fall back to their content hash.
+    """
+    event_id = event.get("matchhandelseid")
+    if event_id:
+        return int(event_id)
+    return f"hash:{content_hash or event_content_hash(event)}"
+
+
+@dataclass
+class EventDelta:
+    """The difference between two versions of a match event list."""
+
+    added: List[Dict[str, Any]] = field(default_factory=list)
+    changed: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        """True if nothing was added, changed or removed."""
+        return not (self.added or self.changed or self.removed)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.changed) + len(self.removed)
+
+
+def diff_match_events(
+    old_events: List[Dict[str, Any]], new_events: List[Dict[str, Any]]
+) -> EventDelta:
+    """Diffs two match event lists by ``matchhandelseid`` and content hash.
+
+    Args:
+        old_events: The locally held event list
+        new_events: The event list as returned by the server
+
+    Returns:
+        EventDelta with the new versions of added/changed events and the old
+        versions of removed events.
+    """
+    index = MatchEventIndex()
+    index.apply(old_events)
+    return index.apply(new_events)
+
+
+class MatchEventIndex:
+    """Keeps match events indexed by id and patches derived state incrementally.
+
+    The index tracks a content hash per event, lookups by
+    (``matchhandelsetypid``, ``period``) and running goal tallies, and updates
+    them only for the events reported in each delta.
+    """
+
+    def __init__(self, team1_id: Optional[int] = None, team2_id: Optional[int] = None):
+        """Initializes an empty index.
+
+        Args:
+            team1_id: ID of team 1 (home team), used for goal tallies
+            team2_id: ID of team 2 (away team), used for goal tallies
+        """
+        self.team1_id = team1_id
+        self.team2_id = team2_id
+        self.events_by_key: Dict[EventKey, Dict[str, Any]] = {}
+        self.hashes: Dict[EventKey, str] = {}
+        self._by_type_period: Dict[Tuple[int, int], List[EventKey]] = {}
+        # [home, away] for full time and for period 1
+        self._goals = [0, 0]
+        self._halftime_goals = [0, 0]
+
+    def __len__(self) -> int:
+        return len(self.events_by_key)
+
+    def apply(self, events: List[Dict[str, Any]]) -> EventDelta:
+        """Replaces the indexed events with ``events`` and returns the delta.
+
+        Only events whose key or content hash differs from the indexed version
+        touch the lookup tables and goal tallies.
+        """
+        delta = EventDelta()
+        seen = set()
+        for event in events:
+            content_hash = event_content_hash(event)
+            key = event_key(event, content_hash)
+            seen.add(key)
+            previous_hash = self.hashes.get(key)
+            if previous_hash == content_hash:
+                continue
+            if previous_hash is None:
+                delta.added.append(event)
+            else:
+                self._unindex(key)
+                delta.changed.append(event)
+            self._index(key, event, content_hash)
+
+        for key in [key for key in self.events_by_key if key not in seen]:
+            delta.removed.append(self.events_by_key[key])
+            self._unindex(key)
+        return delta
+
+    def get(self, event_id: int) -> Optional[Dict[str, Any]]:
+        """Returns the event with the given ``matchhandelseid``, if indexed."""
+        return self.events_by_key.get(int(event_id))
+
+    def find(self, event_type_id: int, period: int) -> Optional[Dict[str, Any]]:
+        """Returns the first event of the given type in the given period."""
+        keys = self._by_type_period.get((int(event_type_id), int(period)))
+        return self.events_by_key[keys[0]] if keys else None
+
+    def scores(self) -> Scores:
+        """Returns the regular time and halftime scores from the goal tallies."""
+        return Scores(
+            regular_time=Score(self._goals[0], self._goals[1]),
+            halftime=Score(self._halftime_goals[0], self._halftime_goals[1]),
+        )
+
+    def _index(self, key: EventKey, event: Dict[str, Any], content_hash: str) -> None:
+        self.events_by_key[key] = event
+        self.hashes[key] = content_hash
+        type_period = self._type_period(event)
+        if type_period is not None:
+            self._by_type_period.setdefault(type_period, []).append(key)
+        self._tally_goal(event, 1)
+
+    def _unindex(self, key: EventKey) -> None:
+        event = self.events_by_key.pop(key)
+        del self.hashes[key]
+        type_period = self._type_period(event)
+        if type_period is not None:
+            keys = self._by_type_period[type_period]
+            keys.remove(key)
+            if not keys:
+                del self._by_type_period[type_period]
+        self._tally_goal(event, -1)
+
+    @staticmethod
+    def _type_period(event: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+        if event.get("matchhandelsetypid") is None or event.get("period") is None:
+            return None
+        return int(event["matchhandelsetypid"]), int(event["period"])
+
+    def _tally_goal(self, event: Dict[str, Any], sign: int) -> None:
+        if event.get("matchhandelsetypid") not in GOAL_EVENT_TYPE_IDS:
+            return
+        team_id = event.get("matchlagid")
+        if team_id is None:
+            return
+        if team_id == self.team1_id:
+            side = 0
+        elif team_id == self.team2_id:
+            side = 1
+        else:
+            return
+        self._goals[side] += sign
+        if event.get("period") == 1:
+            self._halftime_goals[side] += sign
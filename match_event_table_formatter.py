@@ -3,11 +3,26 @@
 This module provides functionality for match event table formatter.
 """
 
-from typing import Any, Dict, List, Optional
-
-from tabulate import tabulate
+from typing import Any, Dict, List, Optional, Tuple
 
 from emoji_config import EVENT_EMOJIS
+from grid_renderer import render_grid
+
+# (category, team name, cell text) for a single event
+EventRow = Tuple[Optional[str], str, str]
+
+# category -> team name -> cell texts, in category and event order
+GroupedEvents = Dict[str, Dict[str, List[str]]]
+
+# Event fields that determine how an event is rendered in the table
+_ROW_CACHE_KEYS = (
+    'matchhandelsetypid',
+    'matchlagid',
+    'matchminut',
+    'trojnummer',
+    'trojnummer2',
+    'pending',  # Set on local events not yet confirmed by the server
+)
 
 
 class MatchEventTableFormatter:
@@ -49,6 +64,7 @@ class MatchEventTableFormatter:
             "Other Events": []
         }
         self._populate_other_events_category()
+        self._event_row_cache: Dict[Tuple[Any, ...], EventRow] = {}
 
         self.category_icons: Dict[str, str] = {
             "Goals": "⚽️ ",
@@ -85,65 +101,9 @@ class MatchEventTableFormatter:
         structured_data["Score"][self.team2_name].append(f"Full: {team2_score}")
         structured_data["Score"][self.team1_name].append(f"(HT: {halftime_score_team1})")
         structured_data["Score"][self.team2_name].append(f"(HT: {halftime_score_team2})")
-
-        for category in self.event_categories:
-            structured_data[category] = {self.team1_name: [], self.team2_name: []}
-
-        for event in match_events_json:
-            event_type_id = event['matchhandelsetypid']
-            event_type_name = self.event_types.get(
-                event_type_id,
-                {}).get('name',
-                'Unknown Event'
-            )
-            team_id = event['matchlagid']
-            team_name = self.team1_name if team_id == self.team1_id else self.team2_name if team_id == self.team2_id else "Unknown Team"
-
-            player_jersey = self._get_player_jersey_from_event(
-                event,
-                team_id,
-                team1_players_json,
-                team2_players_json
-            )
-
-            event_info = ""
-            event_emoji = EVENT_EMOJIS.get(event_type_name, "")
-
-            if event_type_name in self.event_categories["Yellow Cards"]:
-                event_info = f"{event_emoji} {player_jersey} - {event['matchminut']}'"
-            elif event_type_name in self.event_categories["Red Cards"]:
-                event_info = f"{event_emoji} {player_jersey} - {event['matchminut']}'"
-            elif event_type_name in self.event_categories["Substitutions"]:
-                player2_jersey_out = self._get_player2_jersey_from_event(
-                    event,
-                    team_id,
-                    team1_players_json,
-                    team2_players_json
-                )
-                event_info = f"{event_emoji} {player_jersey} in - {player2_jersey_out} out" \
-                    "({event['matchminut']}')"
-            elif event_type_name in self.event_categories["Goals"]:
-                goal_type_note = ""
-                if event_type_name != "Regular Goal":
-                    goal_type_note = f" ({event_type_name.replace(' Goal', '')})"
-                event_info = f"{event_emoji} {player_jersey} -" \
-                    "{event['matchminut']}'{goal_type_note}"
-            else:
-                event_info = f"{event_emoji} {event_type_name} ({player_jersey} -" \
-                    "{event['matchminut']}')"
-
-            category_found = False
-            for category_name, event_name_list in self.event_categories.items():
-                if event_type_name in event_name_list:
-                    # --- ADDED condition to skip "Unknown Team" events ---
-                    if team_name != "Unknown Team":
-                        structured_data[category_name][team_name].append(event_info)
-                    category_found = True
-                    break
-            if not category_found and event_type_name != "Unknown Event":
-                # --- ADDED condition to skip "Unknown Team" events here as well (for "Other Events" category) ---
-                if team_name != "Unknown Team":
-                    structured_data["Other Events"][team_name].append(event_info)
+        structured_data.update(
+            self.group_events(match_events_json, team1_players_json, team2_players_json)
+        )
 
         table_rows = []
         table_rows.append([f"{self.category_icons.get('Score', '')}**Score**", "", ""])
@@ -174,13 +134,99 @@ class MatchEventTableFormatter:
         if not table_rows:
             return "No events reported yet."
 
-        return tabulate(
-            table_rows,
-            headers=headers,
-            tablefmt="grid",
-            numalign="left",
-            stralign="left"
+        return render_grid(table_rows, headers=headers)
+
+    def group_events(self, match_events_json: List[Dict[str, Any]],
+                     team1_players_json: Optional[List[Dict[str, Any]]] = None,
+                     team2_players_json: Optional[List[Dict[str, Any]]] = None) -> GroupedEvents:
+        """Classifies the events once and groups their cell text by category and team.
+
+        This is the pass shared by the terminal table and the report exporters.
+        Every category is present; events of unknown teams are skipped.
+        """
+        grouped: GroupedEvents = {
+            category: {self.team1_name: [], self.team2_name: []}
+            for category in self.event_categories
+        }
+        for event in match_events_json:
+            category_name, team_name, event_info = self._classify_event(
+                event,
+                team1_players_json or [],
+                team2_players_json or []
+            )
+            if category_name is not None and team_name != "Unknown Team":
+                grouped[category_name][team_name].append(event_info)
+        return grouped
+
+    def _classify_event(self, event: Dict[str, Any],
+                        team1_players_json: List[Dict[str, Any]],
+                        team2_players_json: List[Dict[str, Any]]) -> EventRow:
+        """Returns (category, team name, cell text) for a single event.
+
+        Results are memoized on the event fields that affect the rendering, so
+        re-rendering after a sync only formats events that were added or changed.
+        """
+        cache_key = tuple(event.get(key) for key in _ROW_CACHE_KEYS)
+        cached_row = self._event_row_cache.get(cache_key)
+        if cached_row is not None:
+            return cached_row
+
+        event_type_id = event['matchhandelsetypid']
+        event_type_name = self.event_types.get(
+            event_type_id,
+            {}).get('name',
+            'Unknown Event'
         )
+        team_id = event['matchlagid']
+        team_name = self.team1_name if team_id == self.team1_id else self.team2_name if team_id == self.team2_id else "Unknown Team"
+
+        player_jersey = self._get_player_jersey_from_event(
+            event,
+            team_id,
+            team1_players_json,
+            team2_players_json
+        )
+
+        event_info = ""
+        event_emoji = EVENT_EMOJIS.get(event_type_name, "")
+
+        if event_type_name in self.event_categories["Yellow Cards"]:
+            event_info = f"{event_emoji} {player_jersey} - {event['matchminut']}'"
+        elif event_type_name in self.event_categories["Red Cards"]:
+            event_info = f"{event_emoji} {player_jersey} - {event['matchminut']}'"
+        elif event_type_name in self.event_categories["Substitutions"]:
+            player2_jersey_out = self._get_player2_jersey_from_event(
+                event,
+                team_id,
+                team1_players_json,
+                team2_players_json
+            )
+            event_info = f"{event_emoji} {player_jersey} in - {player2_jersey_out} out" \
+                f" ({event['matchminut']}')"
+        elif event_type_name in self.event_categories["Goals"]:
+            goal_type_note = ""
+            if event_type_name != "Regular Goal":
+                goal_type_note = f" ({event_type_name.replace(' Goal', '')})"
+            event_info = f"{event_emoji} {player_jersey} -" \
+                f" {event['matchminut']}'{goal_type_note}"
+        else:
+            event_info = f"{event_emoji} {event_type_name} ({player_jersey} -" \
+                f" {event['matchminut']}')"
+
+        if event.get('pending'):
+            event_info = f"{event_info} (pending)"
+
+        category: Optional[str] = None
+        for category_name, event_name_list in self.event_categories.items():
+            if event_type_name in event_name_list:
+                category = category_name
+                break
+        if category is None and event_type_name != "Unknown Event":
+            category = "Other Events"
+
+        row = (category, team_name, event_info)
+        self._event_row_cache[cache_key] = row
+        return row
 
     def _get_player_jersey_from_event(self, event: Dict[str, Any], team_id: int,
                                   team1_players_json: List[Dict[str, Any]],
@@ -0,0 +1,327 @@
+"""Export of match summaries as JSON, Markdown, CSV and HTML.
+
+Reports are published to club sites and archived, so besides the terminal
+table a match can be written as a document. A MatchSummary holds the teams,
+scores and categorised events of one match; the events are grouped by
+MatchEventTableFormatter.group_events, the same pass that builds the
+terminal table, so both show identical event texts.
+
+Exporters write one match at a time to a text stream. export_matches()
+consumes an iterable of summaries, so a whole season can be exported from a
+generator in linear time while only one match is held in memory.
+"""
+
+import abc
+import csv
+import html
+import json
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Type
+
+from match_context import Scores
+from match_event_table_formatter import GroupedEvents, MatchEventTableFormatter
+
+FORMAT_JSON = "json"
+FORMAT_MARKDOWN = "markdown"
+FORMAT_CSV = "csv"
+FORMAT_HTML = "html"
+
+
+@dataclass
+class MatchSummary:
+    """Teams, scores and categorised events of one match."""
+
+    match_id: int
+    team1_name: str
+    team2_name: str
+    scores: Scores
+    # category -> team name -> event texts; empty categories included
+    events: GroupedEvents
+
+    def team_events(self, category: str) -> List[List[str]]:
+        """Returns the event texts of a category as [team 1, team 2]."""
+        teams = self.events.get(category, {})
+        return [teams.get(self.team1_name, []), teams.get(self.team2_name, [])]
+
+    def categories(self) -> List[str]:
+        """Returns the categories that have at least one event."""
+        return [
+            category for category, teams in self.events.items() if any(teams.values())
+        ]
+
+
+def summarize_match(
+    formatter: MatchEventTableFormatter,
+    match_id: int,
+    match_events_json: List[Dict[str, Any]],
+    scores: Scores,
+) -> MatchSummary:
+    """Builds the summary of a match.
+
+    Args:
+        formatter: The table formatter of the match; its teams are used
+        match_id: The match
+        match_events_json: The match events
+        scores: The match scores
+    """
+    return MatchSummary(
+        match_id=match_id,
+        team1_name=formatter.team1_name,
+        team2_name=formatter.team2_name,
+        scores=scores,
+        events=formatter.group_events(match_events_json),
+    )
+
+
+def _score_text(scores: Scores) -> str:
+    text = (
+        f"{scores.regular_time.home} - {scores.regular_time.away}"
+        f" (HT {scores.halftime.home} - {scores.halftime.away})"
+    )
+    if scores.extra_time.home >= 0:
+        text += f", ET {scores.extra_time.home} - {scores.extra_time.away}"
+    if scores.penalties.home >= 0:
+        text += f", pens {scores.penalties.home} - {scores.penalties.away}"
+    return text
+
+
+def summary_document(summary: MatchSummary) -> Dict[str, Any]:
+    """Returns the match as a JSON-serializable dictionary."""
+    scores = summary.scores
+    return {
+        "match_id": summary.match_id,
+        "home_team": summary.team1_name,
+        "away_team": summary.team2_name,
+        "scores": {
+            "full_time": [scores.regular_time.home, scores.regular_time.away],
+            "half_time": [scores.halftime.home, scores.halftime.away],
+            "extra_time": (
+                [scores.extra_time.home, scores.extra_time.away]
+                if scores.extra_time.home >= 0
+                else None
+            ),
+            "penalties": (
+                [scores.penalties.home, scores.penalties.away]
+                if scores.penalties.home >= 0
+                else None
+            ),
+        },
+        "events": {
+            category: {"home": home, "away": away}
+            for category in summary.categories()
+            for home, away in [summary.team_events(category)]
+        },
+    }
+
+
+class MatchExporter(abc.ABC):
+    """Writes match summaries to a stream in one format.
+
+    Subclasses implement write_match() and, if the format needs a document
+    around the matches, begin() and end().
+    """
+
+    def __init__(self, stream: TextIO):
+        """Initializes the exporter.
+
+        Args:
+            stream: The text stream written to
+        """
+        self.stream = stream
+        self.matches_written = 0
+
+    def begin(self) -> None:
+        """Writes what precedes the first match."""
+
+    @abc.abstractmethod
+    def write_match(self, summary: MatchSummary) -> None:
+        """Writes one match."""
+
+    def end(self) -> None:
+        """Writes what follows the last match."""
+
+
+class JsonExporter(MatchExporter):
+    """Writes a JSON array with one object per match."""
+
+    def begin(self) -> None:
+        """Opens the array."""
+        self.stream.write("[")
+
+    def write_match(self, summary: MatchSummary) -> None:
+        """Writes the match object."""
+        document = summary_document(summary)
+        separator = "," if self.matches_written else ""
+        self.stream.write(f"{separator}\n{json.dumps(document, ensure_ascii=False)}")
+
+    def end(self) -> None:
+        """Closes the array."""
+        self.stream.write("\n]\n")
+
+
+class MarkdownExporter(MatchExporter):
+    """Writes a section with a two-column event table per match."""
+
+    def write_match(self, summary: MatchSummary) -> None:
+        """Writes the match section."""
+        lines = [
+            f"## {summary.team1_name} vs {summary.team2_name}",
+            "",
+            f"**Score:** {_score_text(summary.scores)}",
+            "",
+        ]
+        categories = summary.categories()
+        if categories:
+            lines.append(f"| | {summary.team1_name} | {summary.team2_name} |")
+            lines.append("|---|---|---|")
+            for category in categories:
+                home, away = summary.team_events(category)
+                cells = [
+                    "<br>".join(_markdown_cell(text) for text in texts)
+                    for texts in (home, away)
+                ]
+                lines.append(f"| **{category}** | {cells[0]} | {cells[1]} |")
+        else:
+            lines.append("No events reported.")
+        self.stream.write("\n".join(lines) + "\n\n")
+
+
+def _markdown_cell(text: str) -> str:
+    return text.replace("|", "\\|")
+
+
+class CsvExporter(MatchExporter):
+    """Writes one row per event, with the match and score on every row."""
+
+    COLUMNS = [
+        "match_id",
+        "home_team",
+        "away_team",
+        "home_score",
+        "away_score",
+        "category",
+        "team",
+        "event",
+    ]
+
+    def __init__(self, stream: TextIO):
+        """Initializes the exporter."""
+        super().__init__(stream)
+        self._writer = csv.writer(stream)
+
+    def begin(self) -> None:
+        """Writes the header row."""
+        self._writer.writerow(self.COLUMNS)
+
+    def write_match(self, summary: MatchSummary) -> None:
+        """Writes the event rows of the match."""
+        match_columns = [
+            summary.match_id,
+            summary.team1_name,
+            summary.team2_name,
+            summary.scores.regular_time.home,
+            summary.scores.regular_time.away,
+        ]
+        for category in summary.categories():
+            for team_name, texts in zip(
+                (summary.team1_name, summary.team2_name),
+                summary.team_events(category),
+            ):
+                for text in texts:
+                    self._writer.writerow(match_columns + [category, team_name, text])
+
+
+class HtmlExporter(MatchExporter):
+    """Writes a standalone HTML page with a section per match."""
+
+    def begin(self) -> None:
+        """Writes the document head."""
+        self.stream.write(
+            '<!DOCTYPE html>\n<html lang="sv">\n<head>\n<meta charset="utf-8">\n'
+            "<title>Match reports</title>\n</head>\n<body>\n"
+        )
+
+    def write_match(self, summary: MatchSummary) -> None:
+        """Writes the match section."""
+        team1 = html.escape(summary.team1_name)
+        team2 = html.escape(summary.team2_name)
+        parts = [
+            f'<section class="match" data-match-id="{summary.match_id}">',
+            f"<h2>{team1} vs {team2}</h2>",
+            f'<p class="score">{html.escape(_score_text(summary.scores))}</p>',
+        ]
+        categories = summary.categories()
+        if categories:
+            parts.append("<table>")
+            parts.append(f"<tr><th></th><th>{team1}</th><th>{team2}</th></tr>")
+            for category in categories:
+                cells = [
+                    "<br>".join(html.escape(text) for text in texts)
+                    for texts in summary.team_events(category)
+                ]
+                parts.append(
+                    f"<tr><th>{html.escape(category)}</th>"
+                    f"<td>{cells[0]}</td><td>{cells[1]}</td></tr>"
+                )
+            parts.append("</table>")
+        else:
+            parts.append("<p>No events reported.</p>")
+        parts.append("</section>")
+        self.stream.write("\n".join(parts) + "\n")
+
+    def end(self) -> None:
+        """Closes the document."""
+        self.stream.write("</body>\n</html>\n")
+
+
+EXPORTERS: Dict[str, Type[MatchExporter]] = {
+    FORMAT_JSON: JsonExporter,
+    FORMAT_MARKDOWN: MarkdownExporter,
+    FORMAT_CSV: CsvExporter,
+    FORMAT_HTML: HtmlExporter,
+}
+
+
+def export_matches(
+    summaries: Iterable[MatchSummary], export_format: str, stream: TextIO
+) -> int:
+    """Writes match summaries to a stream as they are produced.
+
+    Args:
+        summaries: The matches; may be a generator
+        export_format: One of the FORMAT_* constants
+        stream: The text stream written to
+
+    Returns:
+        The number of matches written
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    exporter_class = EXPORTERS.get(export_format)
+    if exporter_class is None:
+        raise ValueError(
+            f"Unknown export format {export_format!r};"
+            f" expected one of {', '.join(EXPORTERS)}"
+        )
+    exporter = exporter_class(stream)
+    exporter.begin()
+    for summary in summaries:
+        exporter.write_match(summary)
+        exporter.matches_written += 1
+        stream.flush()
+    exporter.end()
+    stream.flush()
+    return exporter.matches_written
+
+
+@contextmanager
+def open_output(path: Optional[str]) -> Iterator[TextIO]:
+    """Opens a file for writing, or yields stdout for None or "-"."""
+    if path is None or path == "-":
+        yield sys.stdout
+        return
+    with open(path, "w", encoding="utf-8", newline="") as stream:
+        yield stream
@@ -0,0 +1,107 @@
+"""Optimistic event reporting with confirmation in the background.
+
+In optimistic mode a reported event is appended to the match context at once,
+marked as pending, so the menus can redraw the events table without waiting
+for the API. A single worker thread then reports the events in the order they
+were entered. Each event is either confirmed, being replaced by the server's
+version with its matchhandelseid, or rolled back with a notice in the next
+menu header.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from api_utils import safe_fetch_json_list
+from event_submission import submit_event
+from match_context import PENDING_EVENT_KEY, MatchContext, confirmed_events
+
+
+class OptimisticReporter:
+    """Reports events in the background after applying them locally."""
+
+    def __init__(
+        self,
+        match_context: MatchContext,
+        on_confirmed: Optional[Callable[[], Any]] = None,
+    ):
+        """Initializes the reporter and its worker thread.
+
+        Args:
+            match_context: The match the events are reported for
+            on_confirmed: Called on the worker thread after an event has been
+                confirmed and the server event list applied
+        """
+        self.match_context = match_context
+        self.on_confirmed = on_confirmed
+        # One worker keeps the events in the order they were entered
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="event-report"
+        )
+
+    def submit(
+        self,
+        payload: Dict[str, Any],
+        description: str,
+        local_fields: Optional[Dict[str, Any]] = None,
+    ) -> "Future[bool]":
+        """Applies an event locally and reports it in the background.
+
+        Args:
+            payload: The payload for report_match_event
+            description: Short description of the event used in notices
+            local_fields: Display-only fields for the pending event, such as
+                trojnummer, that the server fills in for confirmed events
+
+        Returns:
+            A future that resolves to True once the event is confirmed and to
+            False if it was rolled back
+        """
+        local_event = dict(payload)
+        local_event.update(local_fields or {})
+        local_event[PENDING_EVENT_KEY] = True
+        self.match_context.append_local_event(local_event)
+        return self._executor.submit(self._report, payload, local_event, description)
+
+    def _report(
+        self, payload: Dict[str, Any], local_event: Dict[str, Any], description: str
+    ) -> bool:
+        api_client = self.match_context.api_client
+        try:
+            stored = submit_event(
+                api_client,
+                self.match_context.match_id,
+                payload,
+                confirmed_events(self.match_context.match_events_json or []),
+                self.match_context.unresolved_submissions,
+            ).succeeded
+            error = "no response from the API"
+        except Exception as e:
+            stored = False
+            error = str(e)
+        if not stored:
+            self.match_context.discard_local_event(local_event)
+            self.match_context.post_notice(
+                f"WARNING: {description} was NOT reported ({error}) and has been"
+                " removed. Please report it again."
+            )
+            return False
+
+        try:
+            server_events: Optional[List[Dict[str, Any]]] = [
+                dict(event)
+                for event in safe_fetch_json_list(
+                    api_client.fetch_match_events_json, self.match_context.match_id
+                )
+            ]
+        except Exception:
+            # Reported, but the list could not be refreshed; keep the event as
+            # confirmed until the next sync
+            server_events = None
+        self.match_context.confirm_local_event(local_event, server_events)
+        if self.on_confirmed is not None:
+            self.on_confirmed()
+        return True
+
+    def close(self) -> None:
+        """Waits for all submitted events to be confirmed or rolled back."""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,229 @@
+"""Rate limiting and prioritisation of outbound FOGIS API calls.
+
+Every API call takes a token from a TokenBucket before it is sent, so bulk
+operations cannot exceed the configured request rate. When calls have to wait
+for a token, RequestScheduler lets them through by priority class, so a goal
+being reported never queues behind a background refresh. ScheduledApiClient
+applies the scheduler to every FogisApiClient method. It wraps the coalescing
+client, so a call waits at its own priority before it can join a shared
+fetch, and the reporter prints the scheduler metrics on exit.
+"""
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from fogis_api_client.fogis_api_client import FogisApiClient
+
+T = TypeVar("T")
+
+# Priority classes, lower values are served first
+PRIORITY_INTERACTIVE_WRITE = 0
+PRIORITY_RESULT_REPORTING = 1
+PRIORITY_INTERACTIVE_READ = 2
+PRIORITY_BACKGROUND = 3
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE_WRITE: "interactive write",
+    PRIORITY_RESULT_REPORTING: "result reporting",
+    PRIORITY_INTERACTIVE_READ: "interactive read",
+    PRIORITY_BACKGROUND: "background",
+}
+
+# Priority of each FogisApiClient method; unlisted methods are reads
+METHOD_PRIORITIES = {
+    "report_match_event": PRIORITY_INTERACTIVE_WRITE,
+    "delete_match_event": PRIORITY_INTERACTIVE_WRITE,
+    "clear_match_events": PRIORITY_INTERACTIVE_WRITE,
+    "report_team_official_action": PRIORITY_INTERACTIVE_WRITE,
+    "report_match_result": PRIORITY_RESULT_REPORTING,
+    "mark_reporting_finished": PRIORITY_RESULT_REPORTING,
+}
+
+DEFAULT_RATE = 5.0  # Requests per second
+DEFAULT_BURST = 10
+
+_thread_priority = threading.local()
+
+
+@contextmanager
+def background_requests() -> Iterator[None]:
+    """Schedules the API calls made by this thread as background calls.
+
+    Used by pollers and prefetchers, whose reads must never delay the calls
+    made from the menus.
+    """
+    previous = getattr(_thread_priority, "priority", None)
+    _thread_priority.priority = PRIORITY_BACKGROUND
+    try:
+        yield
+    finally:
+        _thread_priority.priority = previous
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initializes a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens in the bucket
+            clock: Monotonic time in seconds, replaceable for testing
+        """
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def try_acquire(self) -> float:
+        """Takes a token if one is available.
+
+        Not thread-safe; RequestScheduler calls it under its lock.
+
+        Returns:
+            0.0 if a token was taken, otherwise the seconds until one is due
+        """
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return 0.0
+        return (1.0 - self._tokens) / self.rate
+
+
+@dataclass(frozen=True)
+class SchedulerMetrics:
+    """Snapshot of the scheduler queues."""
+
+    queue_depth: Dict[str, int]  # Calls waiting now, by priority name
+    max_queue_depth: int  # Most calls waiting at the same time
+    requests: Dict[str, int]  # Calls sent, by priority name
+    total_wait: float  # Seconds spent waiting for a token, all calls
+
+    def summary(self) -> str:
+        """Returns the calls per priority and the waiting time on one line."""
+        requests = ", ".join(
+            f"{count} {name}" for name, count in self.requests.items() if count
+        )
+        return (
+            f"API requests: {requests or 'none'};"
+            f" waited {self.total_wait:.2f}s for the rate limit,"
+            f" at most {self.max_queue_depth} queued"
+        )
+
+
+class RequestScheduler:
+    """Admits calls at the bucket rate, highest priority first.
+
+    Calls run on the caller's thread; only the wait for a token is queued.
+    Within a priority class calls are admitted in arrival order.
+    """
+
+    def __init__(self, bucket: TokenBucket):
+        """Initializes the scheduler.
+
+        Args:
+            bucket: The token bucket that limits the request rate
+        """
+        self.bucket = bucket
+        self._condition = threading.Condition()
+        self._waiting: List[Tuple[int, int]] = []  # Sorted (priority, sequence)
+        self._sequence = 0
+        self._max_queue_depth = 0
+        self._requests: Counter[int] = Counter()
+        self._total_wait = 0.0
+
+    def _acquire(self, priority: int) -> None:
+        with self._condition:
+            ticket = (priority, self._sequence)
+            self._sequence += 1
+            self._waiting.append(ticket)
+            self._waiting.sort()
+            self._max_queue_depth = max(self._max_queue_depth, len(self._waiting))
+            started = time.monotonic()
+            try:
+                while True:
+                    if self._waiting[0] == ticket:
+                        delay = self.bucket.try_acquire()
+                        if delay == 0.0:
+                            break
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+            finally:
+                self._waiting.remove(ticket)
+                self._condition.notify_all()
+            self._requests[priority] += 1
+            self._total_wait += time.monotonic() - started
+
+    def call(self, priority: int, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Waits for a token at the given priority and then calls fn."""
+        self._acquire(priority)
+        return fn(*args, **kwargs)
+
+    def metrics(self) -> SchedulerMetrics:
+        """Returns the current queue depths and totals."""
+        with self._condition:
+            depth: Counter[int] = Counter(priority for priority, _ in self._waiting)
+            return SchedulerMetrics(
+                queue_depth={
+                    name: depth[priority] for priority, name in PRIORITY_NAMES.items()
+                },
+                max_queue_depth=self._max_queue_depth,
+                requests={
+                    name: self._requests[priority]
+                    for priority, name in PRIORITY_NAMES.items()
+                },
+                total_wait=self._total_wait,
+            )
+
+
+class ScheduledApiClient:
+    """FogisApiClient wrapper that sends every call through a scheduler."""
+
+    def __init__(self, api_client: FogisApiClient, scheduler: RequestScheduler):
+        """Wraps an API client.
+
+        Args:
+            api_client: The client to forward calls to
+            scheduler: The scheduler that admits the calls
+        """
+        self.api_client = api_client
+        self.scheduler = scheduler
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.api_client, name)
+        if not callable(attribute):
+            return attribute
+
+        def scheduled(*args: Any, **kwargs: Any) -> Any:
+            return self.scheduler.call(
+                self.priority_for(name), attribute, *args, **kwargs
+            )
+
+        return scheduled
+
+    @staticmethod
+    def priority_for(method_name: str) -> int:
+        """Returns the priority class of a call made from the current thread."""
+        priority: Optional[int] = getattr(_thread_priority, "priority", None)
+        if priority is not None:
+            return priority
+        return METHOD_PRIORITIES.get(method_name, PRIORITY_INTERACTIVE_READ)
@@ -0,0 +1,107 @@
+"""Local consistency checks for match results before they are submitted.
+
+Verifying reported results needs a round trip to FOGIS. validate_results()
+catches most bad submissions before anything is sent: impossible scorelines
+are rejected outright, while scores that differ from the reported events or a
+match without a Game End event need the referee's confirmation.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from control_event_planner import GAME_END
+from match_context import Score, Scores
+
+
+@dataclass(frozen=True)
+class ResultIssue:
+    """A problem found in the entered results."""
+
+    message: str
+    # True if the results cannot be right; False if they need confirmation
+    blocking: bool
+
+
+def _format(score: Score) -> str:
+    return f"{score.home}-{score.away}"
+
+
+def validate_results(
+    entered: Scores,
+    calculated: Scores,
+    match_events: List[Dict[str, Any]],
+    num_periods: int,
+    num_extra_periods: int,
+) -> List[ResultIssue]:
+    """Checks entered results against each other and the reported events.
+
+    Args:
+        entered: The halftime and fulltime scores about to be submitted
+        calculated: The scores derived from the reported events
+        match_events: The reported match events
+        num_periods: Number of regular time periods of the match
+        num_extra_periods: Number of extra time periods of the match
+
+    Returns:
+        The issues found, blocking issues first
+    """
+    issues: List[ResultIssue] = []
+
+    for name, score in (
+        ("Halftime", entered.halftime),
+        ("Fulltime", entered.regular_time),
+    ):
+        if score.home < 0 or score.away < 0:
+            issues.append(
+                ResultIssue(f"{name} score {_format(score)} is negative.", True)
+            )
+    if (
+        entered.halftime.home > entered.regular_time.home
+        or entered.halftime.away > entered.regular_time.away
+    ):
+        issues.append(
+            ResultIssue(
+                f"Halftime score {_format(entered.halftime)} is higher than the"
+                f" fulltime score {_format(entered.regular_time)}.",
+                True,
+            )
+        )
+
+    last_period = num_periods + num_extra_periods
+    late_periods = sorted(
+        {
+            event["period"]
+            for event in match_events
+            if (event.get("period") or 0) > last_period
+        }
+    )
+    if late_periods:
+        issues.append(
+            ResultIssue(
+                f"Events are reported in period {late_periods[0]}, but the match"
+                f" has only {last_period} periods.",
+                True,
+            )
+        )
+
+    for name, entered_score, calculated_score in (
+        ("Halftime", entered.halftime, calculated.halftime),
+        ("Fulltime", entered.regular_time, calculated.regular_time),
+    ):
+        if (entered_score.home, entered_score.away) != (
+            calculated_score.home,
+            calculated_score.away,
+        ):
+            issues.append(
+                ResultIssue(
+                    f"{name} score {_format(entered_score)} does not match the"
+                    f" reported goals ({_format(calculated_score)}).",
+                    False,
+                )
+            )
+    if not any(event.get("matchhandelsetypid") == GAME_END for event in match_events):
+        issues.append(
+            ResultIssue("No Game End event has been reported for the match.", False)
+        )
+
+    return sorted(issues, key=lambda issue: not issue.blocking)
@@ -0,0 +1,169 @@
+"""Resumable report → verify → mark-finished pipeline for match results.
+
+Reporting results takes three API round trips: report_match_result, polling
+fetch_match_result_json until the backend shows the new results, and
+optionally mark_reporting_finished. ResultsPipeline runs these steps in
+order, times each one and remembers which have completed, so a report that
+was interrupted halfway resumes at the step that did not finish. Results
+that failed verification are submitted again.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from fogis_api_client.fogis_api_client import FogisApiClient
+
+T = TypeVar("T")
+
+STEP_SUBMIT = "submit"
+STEP_VERIFY = "verify"
+STEP_MARK_FINISHED = "mark finished"
+
+# Verification polls at 0.5, 1, 2 and 4 seconds after the first fetch
+DEFAULT_VERIFY_ATTEMPTS = 5
+DEFAULT_INITIAL_DELAY = 0.5
+DEFAULT_MAX_DELAY = 4.0
+
+
+@dataclass
+class StepTiming:
+    """Duration of one pipeline step."""
+
+    step: str
+    seconds: float
+    succeeded: bool
+
+
+def poll_with_backoff(
+    check: Callable[[], Optional[T]],
+    max_attempts: int = DEFAULT_VERIFY_ATTEMPTS,
+    initial_delay: float = DEFAULT_INITIAL_DELAY,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Tuple[Optional[T], int]:
+    """Calls check until it returns a value, doubling the delay in between.
+
+    Args:
+        check: Returns the value once the condition holds, None otherwise
+        max_attempts: Maximum number of calls to check
+        initial_delay: Delay before the second call in seconds
+        max_delay: Upper bound for the delay between calls
+        sleep: Replaceable for testing
+
+    Returns:
+        Tuple of (value or None, number of calls made)
+    """
+    delay = initial_delay
+    for attempt in range(1, max_attempts + 1):
+        value = check()
+        if value is not None:
+            return value, attempt
+        if attempt < max_attempts:
+            sleep(delay)
+            delay = min(delay * 2, max_delay)
+    return None, max_attempts
+
+
+class ResultsPipeline:
+    """The steps of one result report and which of them have completed."""
+
+    def __init__(
+        self,
+        api_client: FogisApiClient,
+        match_id: int,
+        result_data: Dict[str, Any],
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initializes a pipeline with no completed steps.
+
+        Args:
+            api_client: The API client
+            match_id: The match the results belong to
+            result_data: The payload for report_match_result
+            clock: Monotonic time in seconds, replaceable for testing
+        """
+        self.api_client = api_client
+        self.match_id = match_id
+        self.result_data = result_data
+        self._clock = clock
+        self.submitted = False
+        self.verified = False
+        self.finished = False
+        self.timings: List[StepTiming] = []
+
+    @property
+    def next_step(self) -> Optional[str]:
+        """The first step that has not completed, None once all have."""
+        if not self.submitted:
+            return STEP_SUBMIT
+        if not self.verified:
+            return STEP_VERIFY
+        if not self.finished:
+            return STEP_MARK_FINISHED
+        return None
+
+    def can_resume(self, result_data: Dict[str, Any]) -> bool:
+        """True if these results were submitted but not yet marked finished."""
+        return self.submitted and not self.finished and self.result_data == result_data
+
+    def _timed(self, step: str, fn: Callable[[], T]) -> T:
+        started = self._clock()
+        try:
+            result = fn()
+        except BaseException:
+            self.timings.append(StepTiming(step, self._clock() - started, False))
+            raise
+        self.timings.append(StepTiming(step, self._clock() - started, True))
+        return result
+
+    def submit(self) -> None:
+        """Reports the results unless an earlier run already did."""
+        if self.submitted:
+            return
+        self._timed(
+            STEP_SUBMIT, lambda: self.api_client.report_match_result(self.result_data)
+        )
+        self.submitted = True
+
+    def verify(self, check: Callable[[], bool]) -> bool:
+        """Runs the verification unless an earlier run already passed it.
+
+        A failed verification undoes the submission, so reporting the same
+        results again resubmits them. An interrupted one does not.
+
+        Args:
+            check: Verifies the submitted results, retrying as needed
+
+        Returns:
+            True if the results are verified
+        """
+        if not self.verified:
+            self.verified = self._timed(STEP_VERIFY, check)
+            # The results may never have reached FOGIS: submit them again
+            self.submitted = self.verified
+        return self.verified
+
+    def mark_finished(self) -> Any:
+        """Marks the reporting of the match as finished.
+
+        Returns:
+            The response of mark_reporting_finished, None if an earlier run
+            already marked it finished
+        """
+        if self.finished:
+            return None
+        response = self._timed(
+            STEP_MARK_FINISHED,
+            lambda: self.api_client.mark_reporting_finished(self.match_id),
+        )
+        self.finished = bool(response)
+        return response
+
+    def timing_summary(self) -> str:
+        """Returns the step durations of all runs on one line."""
+        return ", ".join(
+            f"{timing.step} {timing.seconds:.2f}s"
+            + ("" if timing.succeeded else " (failed)")
+            for timing in self.timings
+        )
@@ -0,0 +1,80 @@
+"""Running-score reconciliation for match events.
+
+Every event carries the running score (``hemmamal``/``bortamal``) at the time
+it happened. When a goal is reported late, or an event is edited or deleted,
+the scores stamped on later events go stale. This module walks the events in
+match order once, computes the correct running score for each event and plans
+the minimal set of updates needed to fix the stale ones.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from match_event_sync import GOAL_EVENT_TYPE_IDS
+
+
+@dataclass
+class ScoreCorrection:
+    """An event whose stamped running score is wrong."""
+
+    event: Dict[str, Any]
+    home: int  # Correct hemmamal for the event
+    away: int  # Correct bortamal for the event
+
+    @property
+    def event_id(self) -> int:
+        """The matchhandelseid of the event to update."""
+        return int(self.event["matchhandelseid"])
+
+
+def match_order_key(event: Dict[str, Any]) -> Tuple[int, int, int]:
+    """Returns the (period, minute, second) sort key of an event."""
+    return (
+        int(event.get("period") or 0),
+        int(event.get("matchminut") or 0),
+        int(event.get("sekund") or 0),
+    )
+
+
+def compute_running_scores(
+    events: List[Dict[str, Any]], team1_id: Optional[int], team2_id: Optional[int]
+) -> List[Tuple[Dict[str, Any], int, int]]:
+    """Computes the correct running score of every event in one pass.
+
+    The running score of a goal includes the goal itself, matching how goal
+    payloads are stamped when they are reported.
+
+    Args:
+        events: Match events in any order
+        team1_id: ID of team 1 (home team)
+        team2_id: ID of team 2 (away team)
+
+    Returns:
+        (event, home, away) tuples in match order. Events at the same time keep
+        their original relative order.
+    """
+    running_scores = []
+    home, away = 0, 0
+    for event in sorted(events, key=match_order_key):
+        if event.get("matchhandelsetypid") in GOAL_EVENT_TYPE_IDS:
+            if event.get("matchlagid") == team1_id:
+                home += 1
+            elif event.get("matchlagid") == team2_id:
+                away += 1
+        running_scores.append((event, home, away))
+    return running_scores
+
+
+def plan_score_corrections(
+    events: List[Dict[str, Any]], team1_id: Optional[int], team2_id: Optional[int]
+) -> List[ScoreCorrection]:
+    """Returns the events whose stamped running score is wrong.
+
+    Events without a ``matchhandelseid`` are skipped, as they cannot be updated.
+    """
+    return [
+        ScoreCorrection(event, home, away)
+        for event, home, away in compute_running_scores(events, team1_id, team2_id)
+        if event.get("matchhandelseid")
+        and (event.get("hemmamal"), event.get("bortamal")) != (home, away)
+    ]
@@ -0,0 +1,290 @@
+"""Live scoreboard served over HTTP with Server-Sent Events.
+
+Spectators and the clubhouse screen follow the match on a page served by
+the reporter itself. ScoreboardServer serves the score and categorised
+events of the attached match from the standard library HTTP server:
+
+    /             Scoreboard page that updates itself
+    /scores.json  The current snapshot
+    /events       Server-Sent Events stream with a snapshot per change
+
+Snapshots are built from the confirmed events only, once per event list
+version, and the encoded bytes are shared by every client. Clients never
+cause FOGIS requests, and the reporter only notifies waiting clients when
+the event list changes.
+"""
+
+import json
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from match_context import MatchContext, confirmed_events
+from match_event_sync import MatchEventIndex
+from match_event_table_formatter import MatchEventTableFormatter
+from match_report_export import summarize_match, summary_document
+
+# Seconds between keep-alive comments on idle event streams
+DEFAULT_HEARTBEAT = 15.0
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """The scoreboard state at one event list version, encoded once."""
+
+    json: bytes
+    sse: bytes  # The same data as a Server-Sent Events message
+
+
+_NO_MATCH = Snapshot(
+    json=b'{"match":null}', sse=b'event: update\ndata: {"match":null}\n\n'
+)
+
+_PAGE = b"""<!DOCTYPE html>
+<html lang="sv">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Live score</title>
+<style>
+body { font-family: sans-serif; text-align: center; }
+#score { font-size: 4em; margin: 0.3em 0; }
+table { margin: 0 auto; border-collapse: collapse; }
+td, th { padding: 0.2em 1em; vertical-align: top; }
+</style>
+</head>
+<body>
+<h1 id="teams">Waiting for a match</h1>
+<div id="score"></div>
+<div id="halftime"></div>
+<table id="events"></table>
+<script>
+function text(tag, value) {
+  const cell = document.createElement(tag);
+  cell.textContent = value;
+  return cell;
+}
+function show(match) {
+  const table = document.getElementById("events");
+  table.replaceChildren();
+  if (!match) return;
+  const full = match.scores.full_time, half = match.scores.half_time;
+  document.getElementById("teams").textContent =
+    match.home_team + " \\u2013 " + match.away_team;
+  document.getElementById("score").textContent = full[0] + " \\u2013 " + full[1];
+  document.getElementById("halftime").textContent =
+    "(" + half[0] + " \\u2013 " + half[1] + ")";
+  for (const [category, teams] of Object.entries(match.events)) {
+    const row = document.createElement("tr");
+    row.append(text("td", teams.home.join("\\n")), text("th", category),
+               text("td", teams.away.join("\\n")));
+    row.querySelectorAll("td").forEach(c => c.style.whiteSpace = "pre-line");
+    table.append(row);
+  }
+}
+const source = new EventSource("events");
+source.addEventListener("update", e => show(JSON.parse(e.data).match));
+</script>
+</body>
+</html>
+"""
+
+
+class ScoreboardServer:
+    """Serves the live score of the attached match."""
+
+    def __init__(
+        self,
+        event_types: Dict[int, Dict[str, Any]],
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        heartbeat: float = DEFAULT_HEARTBEAT,
+    ):
+        """Initializes the server without starting it.
+
+        Args:
+            event_types: Event type id -> {"name": ...}, as in fogis_api_client
+            host: The address to listen on
+            port: The port to listen on, 0 for any free port
+            heartbeat: Seconds between keep-alive comments on idle streams
+        """
+        self.event_types = event_types
+        self.heartbeat = heartbeat
+        self._httpd = ThreadingHTTPServer((host, port), _ScoreboardHandler)
+        self._httpd.daemon_threads = True
+        setattr(self._httpd, "scoreboard", self)
+        self._thread: Optional[threading.Thread] = None
+        self._changed = threading.Condition()
+        # Incremented on every attach and event list change
+        self._generation = 0
+        self._stopping = False
+        self._context: Optional[MatchContext] = None
+        self._formatter: Optional[MatchEventTableFormatter] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The (host, port) the server listens on."""
+        host, port = self._httpd.server_address[:2]
+        return str(host), int(port)
+
+    def start(self) -> None:
+        """Serves requests in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="scoreboard", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Closes the event streams and stops the server."""
+        self.detach()
+        with self._changed:
+            self._stopping = True
+            self._changed.notify_all()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def attach(self, match_context: MatchContext) -> None:
+        """Shows the match on the scoreboard."""
+        self.detach()
+        self._formatter = MatchEventTableFormatter(
+            self.event_types,
+            match_context.team1_name,
+            match_context.team2_name,
+            match_context.team1_id,
+            match_context.team2_id,
+        )
+        match_context.add_listener(self._on_change)
+        with self._changed:
+            self._context = match_context
+            self._generation += 1
+            self._changed.notify_all()
+
+    def detach(self) -> None:
+        """Clears the scoreboard."""
+        context = self._context
+        if context is None:
+            return
+        context.remove_listener(self._on_change)
+        with self._changed:
+            self._context = None
+            self._generation += 1
+            self._changed.notify_all()
+
+    def _on_change(self, version: int, events: List[Dict[str, Any]]) -> None:
+        # Runs in the reporting thread under the context lock: only notify
+        with self._changed:
+            self._generation += 1
+            self._changed.notify_all()
+
+    def snapshot(self) -> Snapshot:
+        """Returns the current snapshot, rendered at most once per version."""
+        context = self._context
+        formatter = self._formatter
+        if context is None or formatter is None:
+            return _NO_MATCH
+
+        def render() -> Snapshot:
+            events = confirmed_events(context.match_events_json or [])
+            index = MatchEventIndex(context.team1_id, context.team2_id)
+            index.apply(events)
+            summary = summarize_match(
+                formatter, context.match_id, events, index.scores()
+            )
+            data = json.dumps(
+                {"match": summary_document(summary)},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            return Snapshot(json=data, sse=b"event: update\ndata: " + data + b"\n\n")
+
+        return context.derived("scoreboard_snapshot", render)
+
+    def wait_for_change(self, generation: int, timeout: float) -> Optional[int]:
+        """Waits until the state differs from the given generation.
+
+        Returns:
+            The new generation, or None on timeout or when the server stops
+        """
+        with self._changed:
+            self._changed.wait_for(
+                lambda: self._stopping or self._generation != generation, timeout
+            )
+            if self._stopping or self._generation == generation:
+                return None
+            return self._generation
+
+    @property
+    def generation(self) -> int:
+        """Changes whenever the scoreboard state may have changed."""
+        with self._changed:
+            return self._generation
+
+    @property
+    def stopping(self) -> bool:
+        """True once stop() was called."""
+        return self._stopping
+
+
+class _ScoreboardHandler(BaseHTTPRequestHandler):
+    """Request handler of ScoreboardServer."""
+
+    server_version = "FogisScoreboard/1.0"
+
+    @property
+    def scoreboard(self) -> ScoreboardServer:
+        return getattr(self.server, "scoreboard")  # type: ignore[no-any-return]
+
+    def do_GET(self) -> None:  # noqa: N802 (name required by http.server)
+        path = self.path.split("?", 1)[0]
+        if path == "/":
+            self._send(200, "text/html; charset=utf-8", _PAGE)
+        elif path == "/scores.json":
+            self._send(200, "application/json", self.scoreboard.snapshot().json)
+        elif path == "/events":
+            self._stream_events()
+        else:
+            self._send(404, "text/plain; charset=utf-8", b"Not found\n")
+
+    def _send(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_events(self) -> None:
+        board = self.scoreboard
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.close_connection = True
+        generation = board.generation
+        last_sent = b""
+        try:
+            while True:
+                snapshot = board.snapshot()
+                # Changes to pending events only leave the snapshot as is
+                if snapshot.sse != last_sent:
+                    self.wfile.write(snapshot.sse)
+                    self.wfile.flush()
+                    last_sent = snapshot.sse
+                changed = board.wait_for_change(generation, board.heartbeat)
+                while changed is None:
+                    if board.stopping:
+                        return
+                    self.wfile.write(b": keep-alive\n\n")
+                    self.wfile.flush()
+                    changed = board.wait_for_change(generation, board.heartbeat)
+                generation = changed
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Requests must not interleave with the reporter's terminal output
+        pass
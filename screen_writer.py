@@ -0,0 +1,87 @@
+"""Buffered composition of menu screens.
+
+Each menu used to print its header, options and footer line by line, which
+over a slow SSH connection becomes a separate write per line. ScreenWriter
+collects a menu frame in a buffer and writes it with a single call. It can
+also skip a frame that is identical to the one still on screen, for example
+when a menu is shown again after an invalid choice.
+"""
+
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+
+class Frame:
+    """The lines of one menu screen."""
+
+    def __init__(self) -> None:
+        """Initializes an empty frame."""
+        self._lines: List[str] = []
+
+    def line(self, text: str = "") -> None:
+        """Adds a line, like print(text)."""
+        self._lines.append(text)
+
+    def lines(self, texts: Iterable[str]) -> None:
+        """Adds several lines."""
+        self._lines.extend(texts)
+
+    @property
+    def text(self) -> str:
+        """The frame as written to the terminal."""
+        return "".join(f"{line}\n" for line in self._lines)
+
+
+class ScreenWriter:
+    """Writes frames to a stream with one write per frame."""
+
+    def __init__(self, stream: Optional[TextIO] = None, skip_unchanged: bool = False):
+        """Initializes the writer.
+
+        Args:
+            stream: The stream to write to, sys.stdout at the time of writing
+                if None
+            skip_unchanged: Skip a frame identical to the last one written if
+                retain_frame() was called since
+        """
+        self._stream = stream
+        self.skip_unchanged = skip_unchanged
+        self._last_text: Optional[str] = None
+        self._retained = False
+        # "written" and "skipped" frames
+        self.stats: Counter[str] = Counter()
+
+    @contextmanager
+    def frame(self) -> Iterator[Frame]:
+        """Collects a frame and writes it when the block exits."""
+        frame = Frame()
+        yield frame
+        self.write(frame.text)
+
+    def write(self, text: str) -> bool:
+        """Writes a composed frame.
+
+        Returns:
+            False if the frame was skipped because it is still on screen
+        """
+        retained = self._retained
+        self._retained = False
+        if self.skip_unchanged and retained and text == self._last_text:
+            self.stats["skipped"] += 1
+            return False
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write(text)
+        stream.flush()
+        self._last_text = text
+        self.stats["written"] += 1
+        return True
+
+    def retain_frame(self) -> None:
+        """Marks the last frame as still visible.
+
+        Call this when only a short message was printed after the frame, such
+        as an invalid choice, so an identical next frame need not be redrawn.
+        """
+        self._retained = True
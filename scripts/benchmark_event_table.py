@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmark the event table renderer against tabulate.
+
+Formats generated match events with MatchEventTableFormatter, once with the
+native grid renderer and once with tabulate, checks that both produce the
+same table and prints the time per render for 10, 100 and 1000 events.
+
+Usage:
+    python scripts/benchmark_event_table.py [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fogis_api_client.fogis_api_client import EVENT_TYPES  # noqa: E402
+
+import grid_renderer  # noqa: E402
+from match_event_table_formatter import MatchEventTableFormatter  # noqa: E402
+
+TEAM1_ID = 1
+TEAM2_ID = 2
+EVENT_SIZES = (10, 100, 1000)
+
+
+def generate_events(count: int) -> List[Dict[str, Any]]:
+    """Returns count events cycling through goals, cards and substitutions."""
+    event_type_ids = [6, 39, 14, 15, 20, 9, 17, 28]
+    events = []
+    for i in range(count):
+        events.append(
+            {
+                "matchhandelseid": i + 1,
+                "matchhandelsetypid": event_type_ids[i % len(event_type_ids)],
+                "matchlagid": TEAM1_ID if i % 2 == 0 else TEAM2_ID,
+                "matchminut": 1 + i % 90,
+                "period": 1 if i % 90 < 45 else 2,
+                "trojnummer": 1 + i % 23,
+                "trojnummer2": 1 + (i + 7) % 23,
+            }
+        )
+    return events
+
+
+def time_render(events: List[Dict[str, Any]], repeat: int) -> float:
+    """Returns the mean seconds per render with a fresh formatter each time."""
+
+    def render() -> str:
+        formatter = MatchEventTableFormatter(
+            EVENT_TYPES, "IFK Göteborg", "Malmö FF", TEAM1_ID, TEAM2_ID
+        )
+        return formatter.format_structured_table(events, [], [], 3, 2, 1, 1)
+
+    return timeit.timeit(render, number=repeat) / repeat
+
+
+def main() -> int:
+    """Runs the benchmark and returns the exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="renders per size")
+    args = parser.parse_args()
+
+    formatter = MatchEventTableFormatter(
+        EVENT_TYPES, "IFK Göteborg", "Malmö FF", TEAM1_ID, TEAM2_ID
+    )
+    print(f"{'events':>8} {'tabulate':>12} {'native':>12} {'speedup':>8}")
+    for size in EVENT_SIZES:
+        events = generate_events(size)
+        native_table = formatter.format_structured_table(events, [], [], 3, 2, 1, 1)
+        native = time_render(events, args.repeat)
+        with patch(
+            "match_event_table_formatter.render_grid", grid_renderer._tabulate_grid
+        ):
+            tabulate_table = formatter.format_structured_table(
+                events, [], [], 3, 2, 1, 1
+            )
+            tabulated = time_render(events, args.repeat)
+        if native_table != tabulate_table:
+            print(f"ERROR: tables differ for {size} events")
+            return 1
+        print(
+            f"{size:>8} {tabulated * 1000:>10.2f}ms {native * 1000:>10.2f}ms"
+            f" {tabulated / native:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
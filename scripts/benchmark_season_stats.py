@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Benchmark the season statistics with and without NumPy.
+
+Archives generated events of many matches in an in-memory match archive,
+loads them into columns and computes the top scorers, cards per team and
+goals per period and per 15 minutes. Prints the time of each step for the
+plain Python columns and, if NumPy is installed, the vectorized ones, and
+checks that both give the same statistics.
+
+Usage:
+    python scripts/benchmark_season_stats.py [--events N] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from match_archive import MatchArchive  # noqa: E402
+from season_stats import SeasonStats, load_columns, numpy_available  # noqa: E402
+
+EVENTS_PER_MATCH = 20
+TEAMS = 40
+PLAYERS_PER_TEAM = 25
+# Goals, cards and substitutions in roughly the proportions of real matches
+EVENT_TYPE_IDS = [6, 6, 39, 14, 15, 28, 29, 20, 20, 20, 9, 8, 17, 17, 17, 17]
+
+
+def generate_events(count: int) -> List[Tuple[int, Dict[str, Any]]]:
+    """Returns (match id, event) for count events of generated matches."""
+    events = []
+    for i in range(count):
+        match = i // EVENTS_PER_MATCH
+        side = i % 2
+        club = (match + side * 7) % TEAMS
+        minute = 1 + (i * 7) % 90
+        events.append(
+            (
+                match + 1,
+                {
+                    "matchhandelseid": i + 1,
+                    "matchhandelsetypid": EVENT_TYPE_IDS[i % len(EVENT_TYPE_IDS)],
+                    "matchlagid": 2 * match + 1 + side,
+                    "spelareid": club * PLAYERS_PER_TEAM + (i * 13) % PLAYERS_PER_TEAM,
+                    "period": 1 if minute <= 45 else 2,
+                    "matchminut": minute,
+                    "trojnummer": 1 + i % 23,
+                },
+            )
+        )
+    return events
+
+
+def generate_matches(count: int) -> List[Dict[str, Any]]:
+    """Returns a match list for the matches of generate_events."""
+    return [
+        {
+            "matchid": match,
+            "matchlag1id": 2 * match - 1,
+            "matchlag2id": 2 * match,
+            "lag1namn": f"Club {(match - 1) % TEAMS}",
+            "lag2namn": f"Club {(match - 1 + 7) % TEAMS}",
+        }
+        for match in range(1, count + 1)
+    ]
+
+
+def best_time(function: Callable[[], Any], repeat: int) -> float:
+    """Returns the fastest of repeat runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def statistics(stats: SeasonStats) -> Tuple[Any, ...]:
+    """Computes every aggregate."""
+    return (
+        stats.top_scorers(),
+        stats.cards_per_team(),
+        stats.goals_per_period(),
+        stats.goals_per_interval(),
+    )
+
+
+def main() -> int:
+    """Runs the benchmark and returns the exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000, help="events")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per step")
+    args = parser.parse_args()
+
+    archive = MatchArchive(":memory:")
+    events = generate_events(args.events)
+    matches = -(-args.events // EVENTS_PER_MATCH)
+    start = time.perf_counter()
+    archive.store_matches(generate_matches(matches))
+    archive.store_changes(events, [], [])
+    print(
+        f"Archived {len(events)} events of {matches} matches"
+        f" in {time.perf_counter() - start:.2f}s"
+    )
+    start = time.perf_counter()
+    rows = archive.event_rows()
+    team_names = archive.team_names()
+    print(f"Read the events from the archive in {time.perf_counter() - start:.2f}s")
+
+    modes = [False] + ([True] if numpy_available() else [])
+    if not numpy_available():
+        print("NumPy is not installed; only the plain Python columns are timed.")
+    print(f"{'columns':>8} {'load':>10} {'statistics':>12}")
+    results = []
+    for use_numpy in modes:
+        load = best_time(partial(load_columns, rows, use_numpy), args.repeat)
+        stats = SeasonStats(load_columns(rows, use_numpy), team_names)
+        compute = best_time(partial(statistics, stats), args.repeat)
+        results.append(statistics(stats))
+        label = "numpy" if use_numpy else "python"
+        print(f"{label:>8} {load * 1000:>8.1f}ms {compute * 1000:>10.1f}ms")
+    archive.close()
+
+    if any(result != results[0] for result in results):
+        print("ERROR: the statistics differ")
+        return 1
+    top = results[0][0][0]
+    print(f"Top scorer: {top.name} with {top.goals} goals")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Export the reports of all available matches.
+
+Logs in with FOGIS_USERNAME and FOGIS_PASSWORD, fetches the events of every
+match in the match list and writes a summary per match as JSON, Markdown,
+CSV or HTML. Matches are fetched and written one at a time, so a whole
+season is exported with the memory of a single match.
+
+Usage:
+    python scripts/export_match_reports.py [--format FORMAT] [--output PATH]
+"""
+
+import argparse
+import os
+import sys
+from typing import Any, Dict, Iterator, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fogis_api_client.fogis_api_client import (  # noqa: E402
+    EVENT_TYPES,
+    FogisApiClient,
+    FogisLoginError,
+)
+
+from api_utils import safe_fetch_json_list  # noqa: E402
+from match_event_sync import MatchEventIndex  # noqa: E402
+from match_event_table_formatter import MatchEventTableFormatter  # noqa: E402
+from match_report_export import (  # noqa: E402
+    EXPORTERS,
+    FORMAT_MARKDOWN,
+    MatchSummary,
+    export_matches,
+    open_output,
+    summarize_match,
+)
+
+
+def match_summaries(
+    api_client: FogisApiClient, matches: List[Dict[str, Any]]
+) -> Iterator[MatchSummary]:
+    """Yields the summary of each match, fetching its events on demand."""
+    for match in matches:
+        events = safe_fetch_json_list(
+            api_client.fetch_match_events_json, match["matchid"]
+        )
+        index = MatchEventIndex(match["matchlag1id"], match["matchlag2id"])
+        index.apply(events)
+        formatter = MatchEventTableFormatter(
+            EVENT_TYPES,
+            match["lag1namn"],
+            match["lag2namn"],
+            match["matchlag1id"],
+            match["matchlag2id"],
+        )
+        yield summarize_match(formatter, match["matchid"], events, index.scores())
+
+
+def main() -> int:
+    """Runs the export and returns the exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--format", choices=sorted(EXPORTERS), default=FORMAT_MARKDOWN)
+    parser.add_argument(
+        "--output", default="-", help="file to write, - for stdout (default)"
+    )
+    args = parser.parse_args()
+
+    username = os.environ.get("FOGIS_USERNAME")
+    password = os.environ.get("FOGIS_PASSWORD")
+    if not username or not password:
+        print("Error: FOGIS_USERNAME and FOGIS_PASSWORD must be set.", file=sys.stderr)
+        return 1
+    api_client = FogisApiClient(username, password)
+    try:
+        if not api_client.login():
+            print("Login failed.", file=sys.stderr)
+            return 1
+    except FogisLoginError as e:
+        print(f"Login Error: {e}", file=sys.stderr)
+        return 1
+
+    matches = api_client.fetch_matches_list_json() or []
+    with open_output(args.output) as stream:
+        count = export_matches(
+            match_summaries(api_client, matches), args.format, stream
+        )
+    print(f"Exported {count} matches.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
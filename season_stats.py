@@ -0,0 +1,223 @@
+"""Season statistics over the events of the match archive.
+
+Districts follow top scorers, cards per team and goals per period across
+hundreds of matches. SeasonStats loads the archived events into one column
+per field (event type, team, player, period and minute) and computes every
+aggregate as a count of the events of some types grouped by one column.
+
+With NumPy, which requirements.txt installs, the columns are int64 arrays
+and the counts are vectorized: a type mask from np.isin and np.unique over
+the selected values, without a Python loop per event. Where NumPy is not
+available the columns are tuples and the counts are made with
+collections.Counter, with identical results.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from match_archive import MatchArchive
+from match_event_sync import GOAL_EVENT_TYPE_IDS
+
+try:
+    import numpy as np
+except ImportError:  # The statistics fall back to plain Python
+    np = None  # type: ignore[assignment]
+
+OWN_GOAL_TYPE_ID = 15
+# Goals credited to the player who scored them
+SCORER_GOAL_TYPE_IDS = GOAL_EVENT_TYPE_IDS - {OWN_GOAL_TYPE_ID}
+YELLOW_CARD_TYPE_IDS = frozenset({20})
+RED_CARD_TYPE_IDS = frozenset({8, 9})
+
+# Missing values in the columns, as returned by MatchArchive.event_rows
+MISSING = -1
+
+EventRow = Tuple[int, int, int, int, int]
+
+
+def numpy_available() -> bool:
+    """True if NumPy is installed and the statistics are vectorized."""
+    return np is not None
+
+
+@dataclass(frozen=True)
+class EventColumns:
+    """Events as one column per field, aligned by position.
+
+    The columns are int64 arrays when vectorized, tuples otherwise.
+    """
+
+    type_id: Any
+    team_id: Any
+    player_id: Any
+    period: Any
+    minute: Any
+    vectorized: bool
+
+    def __len__(self) -> int:
+        return len(self.type_id)
+
+
+def load_columns(
+    rows: Sequence[EventRow], use_numpy: Optional[bool] = None
+) -> EventColumns:
+    """Loads event rows into columns.
+
+    Args:
+        rows: (type id, team id, player id, period, minute) per event
+        use_numpy: Whether to use NumPy; None uses it when it is installed
+
+    Raises:
+        RuntimeError: If use_numpy is True and NumPy is not installed
+    """
+    if use_numpy is None:
+        use_numpy = numpy_available()
+    if use_numpy:
+        if np is None:
+            raise RuntimeError("Vectorized statistics require NumPy")
+        table = np.array(rows, dtype=np.int64).reshape(-1, 5)
+        columns = [np.ascontiguousarray(table[:, i]) for i in range(5)]
+    else:
+        columns = list(zip(*rows)) or [()] * 5
+    type_id, team_id, player_id, period, minute = columns
+    return EventColumns(type_id, team_id, player_id, period, minute, bool(use_numpy))
+
+
+@dataclass(frozen=True)
+class TopScorer:
+    """Goals of one player, own goals excluded."""
+
+    player_id: int
+    name: str
+    goals: int
+
+
+@dataclass(frozen=True)
+class TeamCards:
+    """Cards of one team over all its matches."""
+
+    team: str
+    yellow: int
+    red: int
+
+
+class SeasonStats:
+    """Aggregates over the events of many matches."""
+
+    def __init__(
+        self,
+        columns: EventColumns,
+        team_names: Optional[Dict[int, str]] = None,
+        player_names: Optional[Dict[int, str]] = None,
+    ):
+        """Initializes the statistics.
+
+        Args:
+            columns: The events
+            team_names: Team id (matchlagid) -> name; teams are grouped by name,
+                since every match has its own team ids
+            player_names: Player id (spelareid) -> name
+        """
+        self.columns = columns
+        self.team_names = team_names or {}
+        self.player_names = player_names or {}
+
+    @classmethod
+    def from_archive(
+        cls, archive: MatchArchive, use_numpy: Optional[bool] = None
+    ) -> "SeasonStats":
+        """Loads every archived event.
+
+        Args:
+            archive: The match archive
+            use_numpy: Whether to use NumPy; None uses it when it is installed
+        """
+        return cls(
+            load_columns(archive.event_rows(), use_numpy),
+            archive.team_names(),
+            archive.player_names(),
+        )
+
+    def count_by(self, values: Any, type_ids: FrozenSet[int]) -> Dict[int, int]:
+        """Counts the events of some types per value of a column.
+
+        Args:
+            values: A column of self.columns, or one derived from it
+            type_ids: The event types counted
+
+        Returns:
+            Value -> number of events, for values that occur
+        """
+        if self.columns.vectorized:
+            mask = np.isin(self.columns.type_id, np.fromiter(type_ids, np.int64))
+            keys, counts = np.unique(values[mask], return_counts=True)
+            return dict(zip(keys.tolist(), counts.tolist()))
+        return dict(
+            Counter(
+                value
+                for type_id, value in zip(self.columns.type_id, values)
+                if type_id in type_ids
+            )
+        )
+
+    def top_scorers(self, limit: int = 10) -> List[TopScorer]:
+        """Returns the players with the most goals, most goals first."""
+        goals = self.count_by(self.columns.player_id, SCORER_GOAL_TYPE_IDS)
+        goals.pop(MISSING, None)
+        ranked = sorted(goals.items(), key=lambda item: (-item[1], item[0]))
+        return [
+            TopScorer(
+                player_id, self.player_names.get(player_id, f"#{player_id}"), count
+            )
+            for player_id, count in ranked[:limit]
+        ]
+
+    def cards_per_team(self) -> List[TeamCards]:
+        """Returns the cards of every team with cards, most cards first."""
+        yellow = self._per_team(
+            self.count_by(self.columns.team_id, YELLOW_CARD_TYPE_IDS)
+        )
+        red = self._per_team(self.count_by(self.columns.team_id, RED_CARD_TYPE_IDS))
+        teams = [
+            TeamCards(team, yellow.get(team, 0), red.get(team, 0))
+            for team in set(yellow) | set(red)
+        ]
+        return sorted(teams, key=lambda cards: (-cards.yellow - cards.red, cards.team))
+
+    def goals_per_period(self) -> Dict[int, int]:
+        """Returns the number of goals per period, own goals included."""
+        goals = self.count_by(self.columns.period, GOAL_EVENT_TYPE_IDS)
+        goals.pop(MISSING, None)
+        return dict(sorted(goals.items()))
+
+    def goals_per_interval(self, minutes: int = 15) -> Dict[int, int]:
+        """Returns the number of goals per interval of match minutes.
+
+        Args:
+            minutes: The interval length
+
+        Returns:
+            First minute of the interval -> goals, e.g. {0: 3, 15: 5, ...}
+        """
+        minute = self.columns.minute
+        if self.columns.vectorized:
+            intervals = np.where(minute >= 0, minute // minutes * minutes, MISSING)
+        else:
+            intervals = tuple(
+                value // minutes * minutes if value >= 0 else MISSING
+                for value in minute
+            )
+        goals = self.count_by(intervals, GOAL_EVENT_TYPE_IDS)
+        goals.pop(MISSING, None)
+        return dict(sorted(goals.items()))
+
+    def _per_team(self, counts: Dict[int, int]) -> Dict[str, int]:
+        """Folds counts per team id into counts per team name."""
+        teams: Dict[str, int] = {}
+        for team_id, count in counts.items():
+            if team_id == MISSING:
+                continue
+            team = self.team_names.get(team_id, f"Team {team_id}")
+            teams[team] = teams.get(team, 0) + count
+        return teams
@@ -0,0 +1,192 @@
+"""Request coalescing for the read endpoints of the FOGIS API.
+
+Menus, the event poller and optimistic reporting all fetch the same match
+events and team sheets. SingleFlight makes concurrent identical requests share
+one network call and keeps the result for a short window, so bursts of
+refreshes cost a single round trip. CoalescingApiClient puts it in front of a
+FogisApiClient and invalidates the affected entries on every write.
+"""
+
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar, Union, cast
+
+from fogis_api_client.fogis_api_client import FogisApiClient
+
+T = TypeVar("T")
+
+# Window in which a completed fetch is reused, in seconds
+DEFAULT_CACHE_TTL = 0.5
+
+
+@dataclass
+class _Flight:
+    """One call shared by every caller with the same key."""
+
+    generation: int
+    future: "Future[Any]" = field(default_factory=Future)
+    finished_at: float = 0.0
+
+
+class SingleFlight:
+    """Shares in-flight and just-completed calls between callers of a key.
+
+    Results are shared objects; callers must not modify them.
+    """
+
+    def __init__(
+        self,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initializes an empty single-flight group.
+
+        Args:
+            cache_ttl: Seconds a successful result is reused after it completed
+            clock: Monotonic time in seconds, replaceable for testing
+        """
+        self.cache_ttl = cache_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._generations: Dict[Hashable, int] = {}
+        # "calls" made, "shared" with an in-flight call, "cached" results reused
+        self.stats: Counter[str] = Counter()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Returns fn(), sharing the call with other callers of the same key."""
+        with self._lock:
+            generation = self._generations.get(key, 0)
+            flight = self._flights.get(key)
+            if flight is not None and flight.generation == generation:
+                if not flight.future.done():
+                    self.stats["shared"] += 1
+                    leader = False
+                elif self._clock() - flight.finished_at < self.cache_ttl:
+                    self.stats["cached"] += 1
+                    leader = False
+                else:
+                    leader = True
+            else:
+                leader = True
+            if leader:
+                flight = _Flight(generation)
+                self._flights[key] = flight
+                self.stats["calls"] += 1
+
+        assert flight is not None
+        if not leader:
+            return cast(T, flight.future.result())
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                # Errors are shared with waiting callers but never cached
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.future.set_exception(e)
+            raise
+        flight.finished_at = self._clock()
+        flight.future.set_result(result)
+        return result
+
+    def forget(self, key: Hashable) -> None:
+        """Makes the next call for a key hit the network.
+
+        Calls already in flight keep running, but callers arriving after this
+        no longer join them, because their result may predate a write.
+        """
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._flights.pop(key, None)
+
+    def forget_all(self, name: str) -> None:
+        """Forgets every key whose first element is name."""
+        with self._lock:
+            keys = [
+                key
+                for key in self._flights
+                if isinstance(key, tuple) and key and key[0] == name
+            ]
+        for key in keys:
+            self.forget(key)
+
+
+MatchId = Union[str, int]
+
+
+class CoalescingApiClient:
+    """FogisApiClient wrapper that coalesces reads and invalidates on writes.
+
+    Methods that are not wrapped here are passed through to the client.
+    """
+
+    def __init__(
+        self, api_client: FogisApiClient, cache_ttl: float = DEFAULT_CACHE_TTL
+    ):
+        """Wraps an API client.
+
+        Args:
+            api_client: The client to forward calls to
+            cache_ttl: Seconds a completed fetch is reused
+        """
+        self.api_client = api_client
+        self.single_flight = SingleFlight(cache_ttl)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.api_client, name)
+
+    def _read(self, name: str, *args: Any) -> Any:
+        key: Tuple[Any, ...] = (name,) + tuple(str(arg) for arg in args)
+        return self.single_flight.do(key, lambda: getattr(self.api_client, name)(*args))
+
+    def _match_written(self, match_id: Any) -> None:
+        self.single_flight.forget(("fetch_match_events_json", str(match_id)))
+
+    def fetch_match_events_json(self, match_id: MatchId) -> Any:
+        """Coalesced FogisApiClient.fetch_match_events_json."""
+        return self._read("fetch_match_events_json", match_id)
+
+    def fetch_team_players_json(self, team_id: MatchId) -> Any:
+        """Coalesced FogisApiClient.fetch_team_players_json."""
+        return self._read("fetch_team_players_json", team_id)
+
+    def fetch_team_officials_json(self, team_id: MatchId) -> Any:
+        """Coalesced FogisApiClient.fetch_team_officials_json."""
+        return self._read("fetch_team_officials_json", team_id)
+
+    def fetch_match_result_json(self, match_id: MatchId) -> Any:
+        """Coalesced FogisApiClient.fetch_match_result_json."""
+        return self._read("fetch_match_result_json", match_id)
+
+    def report_match_event(self, event_data: Dict[str, Any]) -> Any:
+        """Reports an event and invalidates the match's cached events."""
+        try:
+            return self.api_client.report_match_event(event_data)
+        finally:
+            self._match_written(event_data.get("matchid"))
+
+    def delete_match_event(self, event_id: MatchId) -> bool:
+        """Deletes an event and invalidates all cached event lists."""
+        try:
+            return bool(self.api_client.delete_match_event(event_id))
+        finally:
+            # The match of the event is unknown here
+            self.single_flight.forget_all("fetch_match_events_json")
+
+    def clear_match_events(self, match_id: MatchId) -> Any:
+        """Clears the events of a match and invalidates its cached events."""
+        try:
+            return self.api_client.clear_match_events(match_id)
+        finally:
+            self._match_written(match_id)
+
+    def report_match_result(self, result_data: Dict[str, Any]) -> Any:
+        """Reports a result and invalidates the cached results."""
+        try:
+            return self.api_client.report_match_result(result_data)
+        finally:
+            self.single_flight.forget_all("fetch_match_result_json")
@@ -0,0 +1,57 @@
+"""Shared pytest configuration.
+
+Several test modules replace project modules such as match_context with
+MagicMocks in sys.modules before importing fogis_reporter. Each test module
+is therefore imported and run against its own view of the project modules:
+the project modules imported while a test module is collected are put
+aside afterwards and put back while its tests run. Every module sees the
+same imports as when its file is run alone, whatever the collection order.
+"""
+
+import os
+import sys
+from typing import Any, Dict
+
+import pytest
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PROJECT_MODULES = frozenset(
+    name[:-3] for name in os.listdir(_ROOT) if name.endswith(".py")
+) | {"fogis_api_client"}
+
+# Test module node id -> the project modules it was imported with
+_module_imports: Dict[str, Dict[str, Any]] = {}
+
+
+def _is_project_module(name: str) -> bool:
+    return name.split(".", 1)[0] in _PROJECT_MODULES
+
+
+def _take_project_modules() -> Dict[str, Any]:
+    """Removes the project modules from sys.modules and returns them."""
+    names = [name for name in sys.modules if _is_project_module(name)]
+    return {name: sys.modules.pop(name) for name in names}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector):
+    """Imports every test module with freshly imported project modules."""
+    if not isinstance(collector, pytest.Module):
+        yield
+        return
+    outer = _take_project_modules()
+    try:
+        yield
+    finally:
+        _module_imports[collector.nodeid] = _take_project_modules()
+        sys.modules.update(outer)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _project_modules_of_test_module(request):
+    """Runs the tests of a module with the project modules it imported."""
+    outer = _take_project_modules()
+    sys.modules.update(_module_imports.get(request.node.nodeid, {}))
+    yield
+    _take_project_modules()
+    sys.modules.update(outer)
@@ -25,7 +25,10 @@ def test_update_existing_period_end():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Create a mock existing Period End event
     existing_event = {
@@ -76,7 +79,10 @@ def test_create_new_period_end():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Set up the match_events_json to be empty (no existing events)
     match_context_mock.match_events_json = []
@@ -117,7 +123,10 @@ def test_update_existing_game_end():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Create mock existing events
     existing_period_start = {
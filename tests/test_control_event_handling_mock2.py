@@ -58,6 +58,10 @@ def test_find_existing_event():
     api_client_mock = MagicMock()
     api_client_mock.report_match_event.return_value = {'success': True}
     match_context_mock.api_client = api_client_mock
+    match_context_mock.num_periods = 2
+    match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Call the function
     _add_control_event_with_implicit_events(control_event, match_context_mock)
@@ -83,7 +87,10 @@ def test_create_new_events():
     match_context_mock.match_events_json = []
 
     # Set up other required properties
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
     match_context_mock.match_id = 123
 
     # Create a control event
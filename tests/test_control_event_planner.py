@@ -0,0 +1,97 @@
+"""Tests for the control_event_planner module.
+
+This module tests planning of control events and their implicit events.
+"""
+
+from control_event_planner import (
+    GAME_END,
+    PERIOD_END,
+    PERIOD_START,
+    control_event_lookup,
+    plan_control_event,
+)
+
+
+def _control_event(event_type_id, period, minute):
+    return {
+        "matchhandelseid": 0,
+        "matchid": 123,
+        "period": period,
+        "matchminut": minute,
+        "sekund": 0,
+        "matchhandelsetypid": event_type_id,
+        "matchlagid": 0,
+        "hemmamal": 1,
+        "bortamal": 0,
+    }
+
+
+def _existing(event_id, event_type_id, period):
+    return {
+        "matchhandelseid": event_id,
+        "matchhandelsetypid": event_type_id,
+        "period": period,
+    }
+
+
+def test_lookup_ignores_non_control_and_incomplete_events():
+    """Test that only control events with type and period are indexed."""
+    events = [
+        _existing(1, 6, 1),  # Goal
+        {"matchhandelseid": 2, "matchhandelsetypid": 31},  # No period
+        _existing(3, PERIOD_START, 1),
+        _existing(4, PERIOD_START, 1),  # Duplicate, first one wins
+    ]
+
+    lookup = control_event_lookup(events)
+
+    assert list(lookup) == [(PERIOD_START, 1)]
+    assert lookup[(PERIOD_START, 1)]["matchhandelseid"] == 3
+
+
+def test_period_end_without_period_start_plans_implicit_start():
+    """Test a Period End creates the missing Period Start first."""
+    plan = plan_control_event(_control_event(PERIOD_END, 2, 90), {}, 46)
+
+    assert [(s.event_type_id, s.is_update, s.implicit) for s in plan] == [
+        (PERIOD_START, False, True),
+        (PERIOD_END, False, False),
+    ]
+    assert plan[0].payload["matchminut"] == 46
+    assert plan[0].payload["hemmamal"] == 1
+
+
+def test_game_end_plans_steps_in_chronological_order():
+    """Test a Game End on an empty period plans start, end and game end."""
+    plan = plan_control_event(_control_event(GAME_END, 2, 90), {}, 46)
+
+    assert [s.event_type_id for s in plan] == [PERIOD_START, PERIOD_END, GAME_END]
+    assert plan[1].payload["matchminut"] == 90
+
+
+def test_existing_events_are_updated_not_recreated():
+    """Test that an existing Game End is updated and nothing implicit is added."""
+    lookup = control_event_lookup(
+        [
+            _existing(456, PERIOD_START, 2),
+            _existing(457, PERIOD_END, 2),
+            _existing(458, GAME_END, 2),
+        ]
+    )
+
+    plan = plan_control_event(_control_event(GAME_END, 2, 90), lookup, 46)
+
+    assert len(plan) == 1
+    assert plan[0].is_update
+    assert plan[0].payload["matchhandelseid"] == 458
+    assert "Updating existing Game End" in plan[0].describe()
+
+
+def test_planner_does_not_mutate_the_requested_event():
+    """Test that planning is pure with respect to its inputs."""
+    control_event = _control_event(PERIOD_END, 1, 45)
+    lookup = control_event_lookup([_existing(457, PERIOD_END, 1)])
+
+    plan_control_event(control_event, lookup, 1)
+
+    assert control_event["matchhandelseid"] == 0
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 import sys
+import time
 
 # Mock the fogis_api_client module
 sys.modules['fogis_api_client'] = MagicMock()
@@ -15,7 +16,11 @@ sys.modules['match_context'] = MagicMock()
 sys.modules['match_event_table_formatter'] = MagicMock()
 
 # Now we can import from fogis_reporter
-from fogis_reporter import _add_control_event_with_implicit_events
+from fogis_reporter import (
+    _add_control_event_with_implicit_events,
+    report_control_events_menu,
+)
+from match_clock import LiveMatchClock, match_clock_for
 
 # Test for Period Start (31) handling
 def test_period_start_handling():
@@ -25,7 +30,10 @@ def test_period_start_handling():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Create a control event for Period Start
     control_event = {
@@ -66,7 +74,10 @@ def test_period_end_handling():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Create a control event for Period End
     control_event = {
@@ -115,7 +126,10 @@ def test_game_end_handling():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Create a control event for Game End
     control_event = {
@@ -170,7 +184,10 @@ def test_update_existing_period_end():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Create a mock existing Period End event
     existing_period_end = {
@@ -228,7 +245,10 @@ def test_update_existing_game_end():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Create a mock existing Game End event
     existing_game_end = {
@@ -282,3 +302,128 @@ def test_update_existing_game_end():
     assert call_args['matchhandelseid'] == 458  # Existing event ID
     assert call_args['hemmamal'] == 2
     assert call_args['bortamal'] == 1
+
+# Test for the implicit Period Start of an extra time period
+def test_extra_time_period_end_starts_period_at_extra_time_minute():
+    """Test that an implicit extra time Period Start uses the match clock."""
+    # Create mock objects
+    match_context_mock = MagicMock()
+    api_client_mock = MagicMock()
+    match_context_mock.api_client = api_client_mock
+    match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
+    match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 2
+    match_context_mock.extra_period_length = 15
+    match_context_mock.match_events_json = []
+    api_client_mock.report_match_event.return_value = {'success': True}
+
+    # Period End of the second extra time period, which was never started
+    control_event = {
+        'matchhandelseid': 0,
+        'matchid': 123,
+        'period': 4,
+        'matchminut': 120,
+        'sekund': 0,
+        'matchhandelsetypid': 32,  # Period End
+        'matchlagid': 0,
+        'hemmamal': 1,
+        'bortamal': 1
+    }
+
+    _add_control_event_with_implicit_events(control_event, match_context_mock)
+
+    # The implicit Period Start is at minute 106, not 1 + 3 * 45
+    period_start = api_client_mock.report_match_event.call_args_list[0][0][0]
+    assert period_start['matchhandelsetypid'] == 31
+    assert period_start['period'] == 4
+    assert period_start['matchminut'] == 106
+
+
+def _live_clock_context():
+    """Returns a match context without events and with the live clock on."""
+    match_context_mock = MagicMock()
+    match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
+    match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
+    match_context_mock.match_events_json = []
+    match_context_mock.payload_builder = None
+    match_context_mock.scores.regular_time.home = 0
+    match_context_mock.scores.regular_time.away = 0
+    match_context_mock.drain_notices.return_value = []
+    match_context_mock.derived.side_effect = lambda name, compute: compute()
+    match_context_mock.api_client.report_match_event.return_value = {'success': True}
+    match_context_mock.api_client.fetch_match_events_json.return_value = []
+    match_context_mock.live_clock = LiveMatchClock(
+        match_clock_for(match_context_mock), time_source=lambda: 0.0
+    )
+    return match_context_mock
+
+
+# Test that the live clock follows implicit Period Start events
+def test_period_end_starts_the_live_clock_through_the_implicit_period_start():
+    """Test that reporting Period End 1 runs the clock through period 1."""
+    match_context_mock = _live_clock_context()
+
+    with patch('builtins.input', side_effect=['1', '45', '']):
+        report_control_events_menu(match_context_mock)
+
+    reported = [
+        call[0][0]['matchhandelsetypid']
+        for call in match_context_mock.api_client.report_match_event.call_args_list
+    ]
+    assert reported == [31, 32]
+    reading = match_context_mock.live_clock.reading()
+    assert reading is not None
+    assert reading.period == 1
+    assert not reading.running
+
+
+# Test that the first half can be started from the menu
+def test_period_start_option_starts_the_live_clock():
+    """Test that option s reports Period Start 1 and the clock runs."""
+    match_context_mock = _live_clock_context()
+
+    with patch('builtins.input', side_effect=['s', '']):
+        report_control_events_menu(match_context_mock)
+
+    payload = match_context_mock.api_client.report_match_event.call_args[0][0]
+    assert payload['matchhandelsetypid'] == 31
+    assert (payload['period'], payload['matchminut']) == (1, 1)
+    assert match_context_mock.live_clock.is_running
+    assert match_context_mock.live_clock.reading().period == 1
+
+
+# Test that implicit events reach the server in plan order
+def test_implicit_events_are_reported_one_after_another():
+    """Test that Game End without earlier events reports 31, 32, 23 in order."""
+    match_context_mock = _live_clock_context()
+    in_flight = []
+    reported = []
+
+    def report(payload):
+        assert not in_flight, "a step was sent before the previous one returned"
+        in_flight.append(payload)
+        time.sleep(0.01)
+        reported.append(payload['matchhandelsetypid'])
+        in_flight.pop()
+        return {'success': True}
+
+    match_context_mock.api_client.report_match_event.side_effect = report
+    control_event = {
+        'matchhandelseid': 0,
+        'matchid': 123,
+        'period': 2,
+        'matchminut': 90,
+        'sekund': 0,
+        'matchhandelsetypid': 23,  # Game End
+        'matchlagid': 0,
+        'hemmamal': 0,
+        'bortamal': 0
+    }
+
+    _add_control_event_with_implicit_events(control_event, match_context_mock)
+
+    assert reported == [31, 32, 23]
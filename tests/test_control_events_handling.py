@@ -60,6 +60,10 @@ def test_find_existing_event():
         {'matchhandelseid': 457, 'matchhandelsetypid': 32, 'period': 2, 'hemmamal': 1, 'bortamal': 0}
     ]
     match_context_mock.api_client = api_client_mock
+    match_context_mock.num_periods = 2
+    match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Call the function
     _add_control_event_with_implicit_events(control_event, match_context_mock)
@@ -85,7 +89,10 @@ def test_create_new_events():
     match_context_mock.match_events_json = []
 
     # Set up other required properties
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
     match_context_mock.match_id = 123
 
     # Create a control event
@@ -129,7 +136,10 @@ def test_period_start_handling():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Create a control event for Period Start
     control_event = {
@@ -170,7 +180,10 @@ def test_period_end_handling():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Create a control event for Period End
     control_event = {
@@ -219,7 +232,10 @@ def test_game_end_handling():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Create a control event for Game End
     control_event = {
@@ -274,7 +290,10 @@ def test_update_existing_period_end():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Create a mock existing Period End event
     existing_period_end = {
@@ -332,7 +351,10 @@ def test_update_existing_game_end():
     api_client_mock = MagicMock()
     match_context_mock.api_client = api_client_mock
     match_context_mock.match_id = 123
+    match_context_mock.num_periods = 2
     match_context_mock.period_length = 45
+    match_context_mock.num_extra_periods = 0
+    match_context_mock.extra_period_length = 15
 
     # Create a mock existing Game End event
     existing_game_end = {
@@ -0,0 +1,60 @@
+"""Tests for the display_width module.
+
+This module tests width measurement of emoji, ZWJ sequences and names.
+"""
+
+import pytest
+
+import display_width
+from display_width import _stdlib_width, display_width as width, ljust
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Malmö FF", 8),
+        ("IFK Göteborg", 12),
+        ("🟨", 2),
+        ("🟨🟨➡️🟥", 8),  # Arrow with emoji presentation selector
+        ("👨‍💼🟨", 4),  # ZWJ sequence followed by an emoji
+        ("👨‍⚕️🩹", 4),
+        ("▶️", 2),
+        ("漢字", 4),
+        ("é", 1),  # Combining accent
+        ("a\tb", -1),
+    ],
+)
+def test_widths(text, expected):
+    """Known strings have their terminal width, with and without wcwidth."""
+    assert width(text) == expected
+    assert _stdlib_width(text) == expected
+
+
+def test_emoji_prefix_uses_preloaded_width():
+    """An emoji followed by ASCII text is measured without a full scan."""
+    assert "👨‍💼🟥" in display_width._preloaded
+    text = "Coach Red Card (N/A - 12')"
+    assert width(f"👨‍💼🟥 {text}") == 4 + 1 + len(text)
+    assert "👨‍💼🟥 Coach Red Card (N/A - 12')" not in display_width._memoized
+
+
+def test_names_are_memoized(monkeypatch):
+    """Non-ASCII strings are measured once."""
+    calls = []
+
+    def measure(text):
+        calls.append(text)
+        return 11
+
+    monkeypatch.setattr(display_width, "measure_width", measure)
+    monkeypatch.setattr(display_width, "_memoized", {})
+
+    assert width("Åtvidabergs") == 11
+    assert width("Åtvidabergs") == 11
+    assert calls == ["Åtvidabergs"]
+
+
+def test_ljust_pads_by_display_width():
+    """Padding counts emoji as two columns."""
+    assert ljust("⚽ 9", 6) == "⚽ 9  "
+    assert ljust("abc", 2) == "abc"
@@ -0,0 +1,106 @@
+"""Tests for single-event edit and delete in the match events menu."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fogis_reporter import _handle_edit_or_delete_event, report_match_events_menu
+
+
+def _event(event_id, type_id, team_id, period, minute, home, away, jersey=None):
+    return {
+        "matchhandelseid": event_id,
+        "matchid": 123,
+        "matchhandelsetypid": type_id,
+        "matchlagid": team_id,
+        "period": period,
+        "matchminut": minute,
+        "sekund": 0,
+        "spelareid": 1000 + (jersey or 0),
+        "hemmamal": home,
+        "bortamal": away,
+        "trojnummer": jersey,
+    }
+
+
+@pytest.fixture
+def match_context_mock():
+    """Fixture for a match with a home goal (10') and an away goal (60')."""
+    context = MagicMock()
+    context.match_id = 123
+    context.team1_id = 1
+    context.team2_id = 2
+    context.team1_name = "Team 1"
+    context.team2_name = "Team 2"
+    context.num_periods = 2
+    context.period_length = 45
+    context.num_extra_periods = 0
+    context.extra_period_length = 0
+    context.match_events_json = [
+        _event(11, 6, 1, 1, 10, 1, 0, jersey=9),
+        _event(12, 6, 2, 2, 60, 1, 1, jersey=7),
+    ]
+
+    def apply_server_events(events):
+        context.match_events_json = events
+
+    context.apply_server_events.side_effect = apply_server_events
+    return context
+
+
+def test_delete_event_resends_only_stale_scores(match_context_mock):
+    """Test deleting the first goal corrects the later goal's running score."""
+    api_client = match_context_mock.api_client
+    api_client.delete_match_event.return_value = True
+    # Server list after the delete still carries the old 1-1 stamp
+    api_client.fetch_match_events_json.return_value = [
+        _event(12, 6, 2, 2, 60, 1, 1, jersey=7)
+    ]
+
+    with patch("builtins.input", side_effect=["1", "d"]):
+        assert _handle_edit_or_delete_event(match_context_mock)
+
+    api_client.delete_match_event.assert_called_once_with(11)
+    api_client.report_match_event.assert_called_once()
+    payload = api_client.report_match_event.call_args[0][0]
+    assert payload["matchhandelseid"] == 12
+    assert (payload["hemmamal"], payload["bortamal"]) == (0, 1)
+
+
+def test_edit_event_reposts_with_existing_id(match_context_mock):
+    """Test editing the minute re-posts the event under its own id."""
+    api_client = match_context_mock.api_client
+    api_client.fetch_match_events_json.return_value = (
+        match_context_mock.match_events_json
+    )
+
+    with patch("builtins.input", side_effect=["2", "e", "30", ""]):
+        assert _handle_edit_or_delete_event(match_context_mock)
+
+    api_client.delete_match_event.assert_not_called()
+    payload = api_client.report_match_event.call_args_list[0][0][0]
+    assert payload["matchhandelseid"] == 12
+    assert (payload["matchminut"], payload["period"]) == (30, 1)
+    # Stamped scores were already correct, so nothing else is re-sent
+    assert api_client.report_match_event.call_count == 1
+
+
+def test_invalid_selection_changes_nothing(match_context_mock):
+    """Test an out-of-range selection does not call the API."""
+    with patch("builtins.input", side_effect=["5"]):
+        assert not _handle_edit_or_delete_event(match_context_mock)
+
+    match_context_mock.api_client.report_match_event.assert_not_called()
+    match_context_mock.api_client.delete_match_event.assert_not_called()
+
+
+def test_menu_option_4_opens_edit_delete(match_context_mock):
+    """Test that option 4 in the match events menu routes to edit/delete."""
+    with patch("builtins.input", side_effect=["4", ""]):
+        with patch(
+            "fogis_reporter._handle_edit_or_delete_event", return_value=False
+        ) as mock_edit:
+            with patch("fogis_reporter._display_current_events_table"):
+                report_match_events_menu(match_context_mock)
+
+    mock_edit.assert_called_once_with(match_context_mock)
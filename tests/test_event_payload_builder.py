@@ -0,0 +1,106 @@
+"""Tests for the event_payload_builder module.
+
+This module tests the EventPayloadBuilder class and payload validation.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from event_payload_builder import (
+    EVENT_PAYLOAD_FIELDS,
+    EventPayloadBuilder,
+    payload_builder_for,
+    validate_event_payload,
+)
+
+
+@pytest.fixture
+def builder():
+    """Fixture to create a builder for match 123 (teams 1 and 2)."""
+    match_context = MagicMock()
+    match_context.match_id = 123
+    match_context.team1_id = 1
+    match_context.team2_id = 2
+    return EventPayloadBuilder(match_context)
+
+
+def test_goal_payload_has_all_fields_in_order(builder):
+    """Test that a goal payload is complete and in API field order."""
+    payload = builder.goal(6, 2, 200, 2000, 1, 30, 0, 1)
+
+    assert tuple(payload) == EVENT_PAYLOAD_FIELDS
+    assert payload["matchid"] == 123
+    assert payload["matchlagid"] == 2
+    assert payload["spelareid"] == 200
+    assert payload["matchdeltagareid"] == 2000
+    assert (payload["hemmamal"], payload["bortamal"]) == (0, 1)
+    assert payload["matchhandelseid"] == 0
+
+
+def test_substitution_payload_uses_substitution_type(builder):
+    """Test that substitutions carry both players and type 17."""
+    payload = builder.substitution(1, 100, 101, 1000, None, 2, 60, 0, 0)
+
+    assert payload["matchhandelsetypid"] == 17
+    assert (payload["spelareid"], payload["spelareid2"]) == (100, 101)
+    assert (payload["matchdeltagareid"], payload["matchdeltagareid2"]) == (1000, 0)
+
+
+def test_control_payload_can_update_existing_event(builder):
+    """Test that a control event keeps a given matchhandelseid."""
+    payload = builder.control(32, 2, 90, 1, 1, event_id=457)
+
+    assert payload["matchhandelseid"] == 457
+    assert payload["matchlagid"] == 0
+    assert payload["spelareid"] == 0
+
+
+def test_invalid_values_are_rejected(builder):
+    """Test that validation rejects impossible periods and scores."""
+    with pytest.raises(ValueError, match="period"):
+        builder.card(20, 1, 100, None, 0, 10, 0, 0)
+    with pytest.raises(ValueError, match="hemmamal"):
+        builder.control(31, 1, 1, -1, 0)
+    with pytest.raises(ValueError, match="missing"):
+        validate_event_payload({"matchid": 123})
+
+
+def test_goal_and_card_check_the_event_type(builder):
+    """Test that goals and cards reject each other's event types."""
+    assert builder.card(9, 1, 100, None, 1, 10, 0, 0)["matchhandelsetypid"] == 9
+    with pytest.raises(ValueError, match="goal"):
+        builder.goal(20, 1, 100, None, 1, 10, 1, 0)
+    with pytest.raises(ValueError, match="card"):
+        builder.card(6, 1, 100, None, 1, 10, 0, 0)
+
+
+def test_from_event_keeps_id_and_fills_defaults():
+    """Test that a fetched event becomes an update payload."""
+    event = {
+        "matchhandelseid": 11,
+        "matchid": 123,
+        "matchhandelsetypid": 6,
+        "trojnummer": 9,
+    }
+
+    payload = EventPayloadBuilder.from_event(event)
+
+    assert tuple(payload) == EVENT_PAYLOAD_FIELDS
+    assert payload["matchhandelseid"] == 11
+    assert payload["matchid"] == 123
+    assert payload["planpositionx"] == "-1"
+    assert "trojnummer" not in payload
+    with pytest.raises(ValueError, match="matchid"):
+        EventPayloadBuilder.from_event({"matchhandelseid": 11})
+
+
+def test_one_builder_per_match():
+    """Test that payload_builder_for reuses the builder of a match."""
+    match_context = MagicMock()
+    match_context.payload_builder = None
+
+    builder = payload_builder_for(match_context)
+
+    assert isinstance(builder, EventPayloadBuilder)
+    assert payload_builder_for(match_context) is builder
@@ -0,0 +1,123 @@
+"""Tests for the event_poller module.
+
+This module tests change detection and the adaptive polling interval.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from event_poller import EventPoller
+from match_context import MatchContext
+
+
+def _goal(event_id, team_id):
+    return {
+        "matchhandelseid": event_id,
+        "matchhandelsetypid": 6,
+        "matchlagid": team_id,
+        "period": 1,
+        "matchminut": 10,
+    }
+
+
+@pytest.fixture
+def match_context():
+    """Fixture for a match context with one goal and a mocked API client."""
+    api_client = MagicMock()
+    return MatchContext(
+        api_client=api_client,
+        selected_match={},
+        team1_players_json=[],
+        team2_players_json=[],
+        match_events_json=[_goal(1, 1)],
+        num_periods=2,
+        period_length=45,
+        num_extra_periods=0,
+        extra_period_length=0,
+        team1_name="Home",
+        team2_name="Away",
+        team1_id=1,
+        team2_id=2,
+        match_id=123,
+    )
+
+
+def test_unchanged_events_back_off_up_to_max_interval(match_context):
+    """Test that quiet polls grow the interval without touching the context."""
+    match_context.api_client.fetch_match_events_json.return_value = [_goal(1, 1)]
+    events_before = match_context.match_events_json
+    poller = EventPoller(match_context, min_interval=5, max_interval=15)
+
+    assert poller.poll_once() is None
+    assert poller.poll_once() is None
+
+    assert poller.interval == 15
+    assert match_context.match_events_json is events_before
+
+
+def test_external_change_is_applied_and_announced(match_context):
+    """Test that a new event from another device is swapped in and noticed."""
+    match_context.api_client.fetch_match_events_json.return_value = [
+        _goal(1, 1),
+        _goal(2, 2),
+    ]
+    poller = EventPoller(match_context, min_interval=5)
+    poller.interval = 40
+
+    delta = poller.poll_once()
+
+    assert [event["matchhandelseid"] for event in delta.added] == [2]
+    assert poller.interval == 5
+    assert match_context.scores.regular_time.away == 1
+    assert match_context.drain_notices() == [
+        "🔄 Events updated on the server: 1 added, 0 changed, 0 removed"
+    ]
+    assert match_context.drain_notices() == []
+
+
+def test_own_report_already_synced_is_not_announced(match_context):
+    """Test that a change the menus already applied causes no notice."""
+    new_events = [_goal(1, 1), _goal(2, 2)]
+    match_context.api_client.fetch_match_events_json.return_value = new_events
+    poller = EventPoller(match_context)
+    match_context.apply_server_events([dict(event) for event in new_events])
+
+    assert poller.poll_once() is None
+    assert match_context.drain_notices() == []
+
+
+def test_fetch_errors_back_off(match_context):
+    """Test that a failing fetch is retried later instead of raising."""
+    match_context.api_client.fetch_match_events_json.side_effect = ConnectionError
+    poller = EventPoller(match_context, min_interval=5)
+
+    assert poller.poll_once() is None
+    assert poller.interval == 10
+
+
+def test_report_during_fetch_is_not_overwritten(match_context):
+    """Test that a list fetched before a local report is dropped, not applied."""
+    # Goal 3 comes from another device, goal 2 from the menus
+    reported = [_goal(1, 1), _goal(3, 1), _goal(2, 2)]
+
+    def fetch_while_referee_reports(match_id):
+        # The menu reports a goal and applies the server list mid-fetch
+        match_context.apply_server_events([dict(event) for event in reported])
+        return [_goal(1, 1), _goal(3, 1)]
+
+    api_client = match_context.api_client
+    api_client.fetch_match_events_json.side_effect = fetch_while_referee_reports
+    poller = EventPoller(match_context, min_interval=5)
+    poller.interval = 40
+
+    assert poller.poll_once() is None
+    events = match_context.match_events_json
+    assert [event["matchhandelseid"] for event in events] == [1, 3, 2]
+    assert match_context.drain_notices() == []
+    assert poller.interval == 5
+
+    api_client.fetch_match_events_json.side_effect = None
+    api_client.fetch_match_events_json.return_value = reported
+    assert poller.poll_once() is None
+    assert match_context.drain_notices() == []
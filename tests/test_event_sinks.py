@@ -0,0 +1,171 @@
+"""Tests for the event_sinks module.
+
+This module tests batching, backpressure and failure isolation of the
+per-sink queues.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fogis_api_client.fogis_api_client import EVENT_TYPES
+
+from event_sinks import KIND_EVENT, EventFanout, EventSink
+from match_context import MatchContext
+
+
+def _goal(event_id, minute):
+    return {
+        "matchhandelseid": event_id,
+        "matchhandelsetypid": 6,
+        "matchlagid": 1,
+        "period": 1,
+        "matchminut": minute,
+    }
+
+
+class RecordingSink(EventSink):
+    """Collects the delivered batches, optionally waiting or failing."""
+
+    def __init__(self, name, release=None, failures=0):
+        self.name = name
+        self.batches = []
+        self.release = release
+        self.failures = failures
+        self.closed = False
+
+    def deliver(self, records):
+        if self.release is not None:
+            self.release.wait(5)
+        if self.failures:
+            self.failures -= 1
+            raise OSError("receiver down")
+        self.batches.append(list(records))
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def match_context():
+    """Fixture for a match context without events."""
+    return MatchContext(
+        api_client=MagicMock(),
+        selected_match={},
+        team1_players_json=[],
+        team2_players_json=[],
+        match_events_json=[],
+        num_periods=2,
+        period_length=45,
+        num_extra_periods=0,
+        extra_period_length=0,
+        team1_name="Home",
+        team2_name="Away",
+        team1_id=1,
+        team2_id=2,
+        match_id=123,
+    )
+
+
+def _report_goals(match_context, count):
+    events = []
+    for i in range(1, count + 1):
+        events = events + [_goal(i, i)]
+        match_context.apply_server_events(events)
+
+
+def test_slow_sink_drops_only_its_own_records(match_context):
+    """A blocked sink fills its bounded queue without delaying other sinks."""
+    release = threading.Event()
+    slow = RecordingSink("slow", release=release)
+    fast = RecordingSink("fast")
+    fanout = EventFanout(EVENT_TYPES)
+    fanout.add_sink(slow, max_queue=5)
+    fanout.add_sink(fast)
+    fanout.attach(match_context)
+
+    _report_goals(match_context, 10)
+    # Match, 0-0, then an event and a score per goal
+    deadline = time.monotonic() + 5
+    while fanout.stats()["fast"].delivered < 22 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    fanout.close()
+
+    fast_records = [record for batch in fast.batches for record in batch]
+    slow_records = [record for batch in slow.batches for record in batch]
+    assert [r.kind for r in fast_records].count(KIND_EVENT) == 10
+    assert [r.seq for r in fast_records] == list(range(1, len(fast_records) + 1))
+    stats = fanout.stats()
+    assert stats["fast"].dropped == 0
+    assert stats["slow"].dropped > 0
+    assert len(slow_records) + stats["slow"].dropped == len(fast_records)
+    assert slow.closed and fast.closed
+
+
+def test_unbounded_sink_drops_nothing(match_context):
+    """A blocked sink without a queue limit receives every record."""
+    release = threading.Event()
+    archive = RecordingSink("archive", release=release)
+    fast = RecordingSink("fast")
+    fanout = EventFanout(EVENT_TYPES)
+    fanout.add_sink(archive, max_queue=0)
+    fanout.add_sink(fast)
+    fanout.attach(match_context)
+
+    _report_goals(match_context, 10)
+    release.set()
+    fanout.close()
+
+    stats = fanout.stats()
+    assert stats["archive"].dropped == 0
+    assert stats["archive"].delivered == stats["fast"].delivered == 22
+
+
+def test_queued_records_are_delivered_in_batches(match_context):
+    """Records that queued up while the sink was busy arrive together."""
+    release = threading.Event()
+    sink = RecordingSink("archive", release=release)
+    fanout = EventFanout(EVENT_TYPES)
+    fanout.add_sink(sink, max_batch=50)
+    fanout.attach(match_context)
+
+    _report_goals(match_context, 5)
+    release.set()
+    fanout.close()
+
+    assert len(sink.batches) < sum(len(batch) for batch in sink.batches)
+    assert fanout.stats()["archive"].batches == len(sink.batches)
+    # stats() returns copies that later deliveries do not change
+    stats = fanout.stats()["archive"]
+    stats.delivered = -1
+    assert fanout.stats()["archive"].delivered > 0
+
+
+def test_failing_sink_is_retried_then_skipped(match_context):
+    """Failed batches are retried and given up without stopping the sink."""
+    sink = RecordingSink("webhook", failures=3)
+    fanout = EventFanout(EVENT_TYPES, max_attempts=2, sleep=lambda _: None)
+    fanout.add_sink(sink, max_batch=1)
+    fanout.attach(match_context)
+
+    match_context.apply_server_events([_goal(1, 10)])
+    fanout.close()
+
+    stats = fanout.stats()["webhook"]
+    assert stats.failed == 1
+    assert stats.last_error == "receiver down"
+    # The match record failed twice, the 0-0 score after one retry succeeded
+    assert [batch[0].kind for batch in sink.batches] == ["score", "event", "score"]
+    assert "could not be delivered to webhook" in match_context.drain_notices()[0]
+
+
+def test_sink_must_implement_deliver():
+    """A sink without deliver cannot be created."""
+
+    class IncompleteSink(EventSink):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteSink()
@@ -0,0 +1,118 @@
+"""Tests for the event_stream module."""
+
+import io
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from fogis_api_client.fogis_api_client import EVENT_TYPES
+
+from event_sinks import EventFanout
+from event_stream import NdjsonSink
+from fogis_reporter import _parse_args
+from match_context import MatchContext
+
+
+def _event(event_id, type_id, team_id, minute, period=1):
+    return {
+        "matchhandelseid": event_id,
+        "matchhandelsetypid": type_id,
+        "matchlagid": team_id,
+        "period": period,
+        "matchminut": minute,
+        "trojnummer": 9,
+    }
+
+
+@pytest.fixture
+def match_context():
+    """Fixture for a match context with a period start and one goal."""
+    return MatchContext(
+        api_client=MagicMock(),
+        selected_match={},
+        team1_players_json=[],
+        team2_players_json=[],
+        match_events_json=[_event(1, 31, 1, 1), _event(2, 6, 1, 10)],
+        num_periods=2,
+        period_length=45,
+        num_extra_periods=0,
+        extra_period_length=0,
+        team1_name="Home",
+        team2_name="Away",
+        team1_id=1,
+        team2_id=2,
+        match_id=123,
+    )
+
+
+def _lines(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_attach_writes_the_current_state(match_context):
+    """A consumer gets the match, its events and the score on attach."""
+    stream = io.StringIO()
+    fanout = EventFanout(EVENT_TYPES)
+    fanout.add_sink(NdjsonSink(stream))
+
+    fanout.attach(match_context)
+    fanout.close()
+
+    lines = _lines(stream)
+    assert [line["kind"] for line in lines] == ["match", "control", "event", "score"]
+    assert [line["seq"] for line in lines] == [1, 2, 3, 4]
+    assert lines[2]["type"] == "Regular Goal"
+    assert lines[2]["team"] == "Home"
+    assert lines[3]["home"] == 1 and lines[3]["away"] == 0
+    assert all(line["ts"].endswith("+00:00") for line in lines)
+
+
+def test_changes_are_streamed_and_pending_events_skipped(match_context):
+    """Confirmed changes and score changes follow; pending events do not."""
+    stream = io.StringIO()
+    fanout = EventFanout(EVENT_TYPES)
+    fanout.add_sink(NdjsonSink(stream))
+    fanout.attach(match_context)
+
+    pending = {**_event(None, 6, 2, 20), "pending": True}
+    match_context.append_local_event(pending)
+    match_context.confirm_local_event(
+        pending, match_context.match_events_json[:2] + [_event(3, 6, 2, 20)]
+    )
+    match_context.apply_server_events([_event(1, 31, 1, 1), _event(3, 6, 2, 20)])
+    fanout.close()
+
+    lines = _lines(stream)[4:]
+    assert [(line["kind"], line.get("action")) for line in lines] == [
+        ("event", "added"),
+        ("score", None),
+        ("event", "removed"),
+        ("score", None),
+    ]
+    assert lines[0]["event_id"] == 3
+    assert (lines[3]["home"], lines[3]["away"]) == (0, 1)
+    assert [line["seq"] for line in _lines(stream)] == list(range(1, 9))
+
+
+def test_detached_match_is_not_streamed(match_context):
+    """Changes after detach are not written."""
+    stream = io.StringIO()
+    fanout = EventFanout(EVENT_TYPES)
+    fanout.add_sink(NdjsonSink(stream))
+    fanout.attach(match_context)
+    fanout.detach()
+
+    match_context.apply_server_events([])
+    fanout.close()
+
+    assert len(_lines(stream)) == 4
+
+
+def test_stream_to_stdout_is_rejected(capsys):
+    """The stream cannot share stdout with the menus."""
+    with pytest.raises(SystemExit):
+        _parse_args(["--emit-ndjson", "-"])
+    assert "cannot write to stdout" in capsys.readouterr().err
+    assert _parse_args(["--emit-ndjson", "events.ndjson"]).emit_ndjson == (
+        "events.ndjson"
+    )
@@ -0,0 +1,111 @@
+"""Tests for the event_submission module.
+
+This module tests that retried event submissions never create duplicates.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from event_submission import submit_event
+
+
+def _card(event_id, minute=30):
+    return {
+        "matchhandelseid": event_id,
+        "matchhandelsetypid": 20,
+        "matchlagid": 1,
+        "spelareid": 100,
+        "period": 1,
+        "matchminut": minute,
+    }
+
+
+@pytest.fixture
+def api_client():
+    """Fixture for an API client mock."""
+    return MagicMock()
+
+
+def test_success_on_first_attempt_does_not_fetch(api_client):
+    """Test that a successful report needs no duplicate check."""
+    api_client.report_match_event.return_value = {"id": 5}
+
+    result = submit_event(api_client, 123, _card(0), [], sleep=MagicMock())
+
+    assert result.response == {"id": 5}
+    assert result.attempts == 1
+    api_client.fetch_match_events_json.assert_not_called()
+
+
+def test_timeout_after_store_is_not_resent(api_client):
+    """Test that an event stored before the timeout is found, not resent."""
+    api_client.report_match_event.side_effect = TimeoutError
+    api_client.fetch_match_events_json.return_value = [_card(5)]
+
+    result = submit_event(api_client, 123, _card(0), [], sleep=MagicMock())
+
+    assert result.already_stored and result.succeeded
+    assert result.stored_event["matchhandelseid"] == 5
+    assert api_client.report_match_event.call_count == 1
+
+
+def test_existing_identical_event_does_not_hide_a_lost_one(api_client):
+    """Test that an identical earlier event is not mistaken for the new one."""
+    api_client.report_match_event.side_effect = [ConnectionError, {"id": 6}]
+    api_client.fetch_match_events_json.return_value = [_card(5)]
+    sleep = MagicMock()
+
+    result = submit_event(api_client, 123, _card(0), [_card(5)], sleep=sleep)
+
+    assert result.response == {"id": 6}
+    assert result.attempts == 2
+    sleep.assert_called_once_with(1.0)
+
+
+def test_gives_up_after_max_attempts(api_client):
+    """Test that the last error is raised once all attempts have failed."""
+    api_client.report_match_event.side_effect = ConnectionError("offline")
+    api_client.fetch_match_events_json.return_value = []
+    sleep = MagicMock()
+
+    with pytest.raises(ConnectionError, match="offline"):
+        submit_event(api_client, 123, _card(0), [], max_attempts=3, sleep=sleep)
+
+    assert api_client.report_match_event.call_count == 3
+    assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0]
+
+
+def test_reentered_event_after_failed_submission_is_not_resent(api_client):
+    """Test that an event stored by a failed submission is found on re-entry."""
+    unresolved = {}
+    api_client.report_match_event.side_effect = TimeoutError
+    api_client.fetch_match_events_json.side_effect = TimeoutError
+
+    with pytest.raises(TimeoutError):
+        submit_event(api_client, 123, _card(0), [], unresolved, sleep=MagicMock())
+    assert unresolved
+
+    # The first attempt had been stored; the caller's list is still stale
+    api_client.fetch_match_events_json.side_effect = None
+    api_client.fetch_match_events_json.return_value = [_card(5)]
+    result = submit_event(api_client, 123, _card(0), [], unresolved, sleep=MagicMock())
+
+    assert result.already_stored
+    assert result.stored_event["matchhandelseid"] == 5
+    assert api_client.report_match_event.call_count == 1
+    assert unresolved == {}
+
+
+def test_reentered_event_that_was_lost_is_sent(api_client):
+    """Test that an event lost by a failed submission is sent on re-entry."""
+    unresolved = {}
+    api_client.report_match_event.side_effect = [ConnectionError] * 3 + [{"id": 6}]
+    api_client.fetch_match_events_json.return_value = []
+
+    with pytest.raises(ConnectionError):
+        submit_event(api_client, 123, _card(0), [], unresolved, sleep=MagicMock())
+    result = submit_event(api_client, 123, _card(0), [], unresolved, sleep=MagicMock())
+
+    assert result.response == {"id": 6}
+    assert unresolved == {}
@@ -0,0 +1,46 @@
+"""Tests for the grid_renderer module.
+
+This module checks that render_grid matches tabulate's grid format.
+"""
+
+import pytest
+from tabulate import tabulate
+
+from emoji_config import EVENT_EMOJIS
+from grid_renderer import render_grid
+
+HEADERS = ["Event Type", "**IFK Göteborg**", "**Malmö FF**"]
+
+
+def _tabulate(rows, headers=HEADERS):
+    return tabulate(
+        rows, headers=headers, tablefmt="grid", numalign="left", stralign="left"
+    )
+
+
+@pytest.mark.parametrize("emoji", sorted(set(EVENT_EMOJIS.values())))
+def test_matches_tabulate_for_event_emoji(emoji):
+    """Every event emoji is measured like tabulate measures it."""
+    rows = [
+        ["**Score**", "", ""],
+        ["", "Full: 2", "Full: 1"],
+        ["⚽️ **Goals**", "", ""],
+        ["", f"{emoji} 9 - 45'", f"{emoji} Period End (N/A - 90')"],
+    ]
+
+    assert render_grid(rows, HEADERS) == _tabulate(rows)
+
+
+def test_matches_tabulate_for_padded_and_empty_cells():
+    """Data cells are stripped, headers are not."""
+    rows = [["  ℹ️ **Other Events**", "", " 🟨 7 - 12' (pending) "], ["", "", ""]]
+    headers = ["Event Type ", "**Åtvidaberg**", "**B**"]
+
+    assert render_grid(rows, headers) == _tabulate(rows, headers)
+
+
+def test_multiline_cells_fall_back_to_tabulate():
+    """Cells with line breaks are rendered by tabulate."""
+    rows = [["**Goals**", "⚽ 9 - 45'\n⚽ 9 - 80'", ""]]
+
+    assert render_grid(rows, HEADERS) == _tabulate(rows)
@@ -0,0 +1,164 @@
+"""Tests for the match_archive module.
+
+This module tests storing and reading back matches, team sheets, events and
+results, and archiving the changes delivered by the event fanout.
+"""
+
+from functools import partial
+from unittest.mock import MagicMock
+
+import pytest
+from fogis_api_client.fogis_api_client import EVENT_TYPES, FogisAPIRequestError
+
+from api_utils import safe_fetch_json_list
+from event_sinks import EventFanout
+from fogis_reporter import _fetch_list
+from match_archive import ArchiveSink, MatchArchive
+from match_context import MatchContext, Score, Scores
+
+MATCH = {
+    "matchid": 123,
+    "matchlag1id": 1,
+    "matchlag2id": 2,
+    "lag1namn": "Home",
+    "lag2namn": "Away",
+    "label": "Home - Away",
+}
+
+
+def _goal(event_id, team_id, minute, period=1):
+    return {
+        "matchhandelseid": event_id,
+        "matchhandelsetypid": 6,
+        "matchlagid": team_id,
+        "period": period,
+        "matchminut": minute,
+        "trojnummer": 9,
+        "spelareid": 900 + team_id,
+    }
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Fixture for an archive in a temporary file."""
+    archive = MatchArchive(str(tmp_path / "archive.db"))
+    yield archive
+    archive.close()
+
+
+@pytest.fixture
+def match_context():
+    """Fixture for the match context of MATCH without events."""
+    return MatchContext(
+        api_client=MagicMock(),
+        selected_match=MATCH,
+        team1_players_json=[],
+        team2_players_json=[],
+        match_events_json=[],
+        num_periods=2,
+        period_length=45,
+        num_extra_periods=0,
+        extra_period_length=0,
+        team1_name="Home",
+        team2_name="Away",
+        team1_id=1,
+        team2_id=2,
+        match_id=123,
+    )
+
+
+def test_matches_and_team_sheets_are_cached(archive):
+    """Fetched lists are returned unchanged; a failed fetch keeps the old ones."""
+    players = [{"spelareid": 7, "trojnummer": 10, "fornamn": "Å", "efternamn": "B"}]
+    officials = [{"fornamn": "C", "efternamn": "D"}]
+    archive.store_matches([MATCH])
+    archive.store_team_sheet(123, 1, players, officials)
+    archive.store_team_sheet(123, 1, None, None)
+
+    assert archive.matches() == [MATCH]
+    assert archive.team_players(1) == players
+    assert archive.team_officials(1) == officials
+    assert archive.team_players(2) is None
+    assert archive.match_events(123) is None
+
+    connection = archive._connection
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    indexes = {row[1] for row in connection.execute("PRAGMA index_list(events)")}
+    assert {"events_match", "events_type_period"} <= indexes
+    assert connection.execute(
+        "SELECT name FROM players WHERE team_id = 1 AND jersey = 10"
+    ).fetchone() == ("Å B",)
+
+
+def test_archive_sink_stores_fanout_changes(archive, match_context):
+    """Added, changed and removed events and the scores reach the archive."""
+    fanout = EventFanout(EVENT_TYPES)
+    fanout.add_sink(ArchiveSink(archive))
+    fanout.attach(match_context)
+
+    first, second = _goal(1, 1, 10), _goal(2, 2, 50, period=2)
+    match_context.apply_server_events([first, second])
+    moved = dict(first, matchminut=12)
+    match_context.apply_server_events([moved])
+    fanout.close()
+
+    assert archive.match_events(123) == [moved]
+    assert archive.result(123) == Scores(regular_time=Score(1, 0), halftime=Score(1, 0))
+    assert archive._connection.execute(
+        "SELECT event_type, team_id, player_id, period, minute FROM events"
+    ).fetchall() == [(6, 1, 901, 1, 12)]
+
+
+def test_reported_result_outlives_computed_scores(tmp_path):
+    """A reported result is kept per session and preferred over computed ones."""
+    path = str(tmp_path / "archive.db")
+    archive = MatchArchive(path)
+    reported = Scores(regular_time=Score(2, 1), halftime=Score(1, 1))
+    archive.store_result(123, reported)
+    archive.store_changes([], [], [(123, Scores(regular_time=Score(5, 5)))])
+    archive.close()
+
+    later = MatchArchive(path)
+    later.store_changes([], [], [(123, Scores(regular_time=Score(3, 1)))])
+    assert later.session_id == archive.session_id + 1
+    assert later.result(123) == reported
+    assert later._connection.execute(
+        "SELECT COUNT(*) FROM results WHERE match_id = 123"
+    ).fetchone() == (2,)
+    later.close()
+
+
+def _fetch_players(archive, api_client):
+    return _fetch_list(
+        partial(safe_fetch_json_list, api_client.fetch_team_players_json, 1),
+        "Team 1 players",
+        archive,
+        lambda archived: archived.team_players(1),
+        lambda archived, players: archived.store_team_sheet(123, 1, players, None),
+        archive_when_empty=True,
+    )
+
+
+def test_failed_fetch_uses_the_archived_team_sheet(archive):
+    """A raising fetch falls back to the archive, which is left unchanged."""
+    players = [{"spelareid": 7, "trojnummer": 10}]
+    api_client = MagicMock()
+    api_client.fetch_team_players_json.return_value = {"spelare": players}
+    assert _fetch_players(archive, api_client) == players
+
+    api_client.fetch_team_players_json.side_effect = FogisAPIRequestError("down")
+    assert _fetch_players(archive, api_client) == players
+    assert _fetch_players(None, api_client) is None
+    assert archive.team_players(1) == players
+
+
+def test_empty_response_does_not_wipe_the_archive(archive):
+    """A None response is served from the archive instead of replacing it."""
+    players = [{"spelareid": 7, "trojnummer": 10}]
+    archive.store_team_sheet(123, 1, players, None)
+    api_client = MagicMock()
+    api_client.fetch_team_players_json.return_value = None
+
+    assert _fetch_players(archive, api_client) == players
+    assert archive.team_players(1) == players
+    assert _fetch_players(None, api_client) == []
@@ -0,0 +1,108 @@
+"""Tests for the match_clock module.
+
+This module tests the MatchClockModel period boundary table and lookups.
+"""
+
+import pytest
+
+from match_clock import LiveMatchClock, MatchClockModel, get_match_clock
+
+
+@pytest.fixture
+def clock():
+    """Fixture for a 2x45 match with 2x15 minutes of extra time."""
+    return MatchClockModel(2, 45, 2, 15)
+
+
+def test_boundaries_cover_regular_and_extra_time(clock):
+    """Test that boundaries are computed for every period."""
+    assert [(b.period, b.start_minute, b.end_minute) for b in clock.boundaries] == [
+        (1, 1, 45),
+        (2, 46, 90),
+        (3, 91, 105),
+        (4, 106, 120),
+    ]
+    assert [b.is_extra_time for b in clock.boundaries] == [False, False, True, True]
+    assert clock.period_start_minute(3) == 91
+
+
+def test_period_for_minute(clock):
+    """Test minute to period lookup at the period boundaries."""
+    assert [clock.period_for_minute(m) for m in (1, 45, 46, 90, 91, 106, 120)] == [
+        1,
+        1,
+        2,
+        2,
+        3,
+        4,
+        4,
+    ]
+    with pytest.raises(ValueError):
+        clock.period_for_minute(121)
+
+
+def test_classify_timestamp(clock):
+    """Test that boundary minutes map to the right control events."""
+    assert clock.classify_timestamp(1) == (31, "Period Start", 1)
+    assert clock.classify_timestamp(90) == (32, "Period End", 2)
+    assert clock.classify_timestamp(120) == (23, "Game End", 4)
+    assert MatchClockModel(2, 45, 0, 0).classify_timestamp(90) == (23, "Game End", 2)
+    with pytest.raises(ValueError, match="doesn't correspond"):
+        clock.classify_timestamp(30)
+
+
+def test_parse_minute_with_stoppage_time(clock):
+    """Test that stoppage time counts towards the period of the base minute."""
+    assert clock.parse_minute("45+2") == (47, 1)
+    assert clock.parse_minute("105+1") == (106, 3)
+    with pytest.raises(ValueError, match="Invalid minute format"):
+        clock.parse_minute("121+1")
+
+
+def test_help_lines_mark_end_of_game():
+    """Test that the help text marks the last period as the end of the game."""
+    lines = MatchClockModel(2, 45, 0, 0).timestamp_help_lines
+
+    assert lines == (
+        "  1 → Start of Period 1",
+        "  45 → End of Period 1",
+        "  46 → Start of Period 2",
+        "  90 → End of Period 2 and End of Game",
+    )
+
+
+def test_get_match_clock_is_shared():
+    """Test that the same match structure reuses one model."""
+    assert get_match_clock(2, 45, 0, 0) is get_match_clock(2, 45, 0, 0)
+
+
+class FakeTime:
+    """Manually advanced replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_live_clock_runs_from_period_start_and_pauses_at_period_end(clock):
+    """Test that the live clock follows the period and stoppage time."""
+    fake_time = FakeTime()
+    live_clock = LiveMatchClock(clock, time_source=fake_time)
+    assert live_clock.reading() is None
+
+    live_clock.start_period(2)
+    fake_time.now += 10 * 60 + 15
+    reading = live_clock.reading()
+    assert (reading.period, reading.minute, reading.second) == (2, 56, 15)
+    assert reading.display == "56"
+    assert reading.running
+
+    fake_time.now += 36 * 60
+    live_clock.stop_period()
+    fake_time.now += 5 * 60
+    reading = live_clock.reading()
+    assert (reading.minute, reading.stoppage, reading.running) == (92, 2, False)
+    assert reading.display == "90+2"
+    assert clock.parse_minute(reading.display) == (92, 2)
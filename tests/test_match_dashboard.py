@@ -0,0 +1,144 @@
+"""Tests for the match_dashboard module.
+
+This module tests the region layout, the line diffing and the background
+refresh; the curses loop itself needs a terminal and is not tested here.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fogis_api_client.fogis_api_client import EVENT_TYPES
+
+from match_context import MatchContext
+from match_dashboard import (
+    REGION_COMMAND,
+    REGION_HEADER,
+    REGION_TIMELINE,
+    DashboardView,
+    LineDiffer,
+    MatchDashboard,
+    clip,
+    layout,
+)
+
+
+def _goal(event_id, team_id, minute):
+    return {
+        "matchhandelseid": event_id,
+        "matchhandelsetypid": 6,
+        "matchlagid": team_id,
+        "period": 1,
+        "matchminut": minute,
+        "trojnummer": 9,
+    }
+
+
+@pytest.fixture
+def match_context():
+    """Fixture for a match context with one goal and a mocked API client."""
+    return MatchContext(
+        api_client=MagicMock(),
+        selected_match={},
+        team1_players_json=[],
+        team2_players_json=[],
+        match_events_json=[_goal(1, 1, 10)],
+        num_periods=2,
+        period_length=45,
+        num_extra_periods=0,
+        extra_period_length=0,
+        team1_name="Home",
+        team2_name="Away",
+        team1_id=1,
+        team2_id=2,
+        match_id=123,
+    )
+
+
+@pytest.fixture
+def view(match_context):
+    """Fixture for a view with one command."""
+    return DashboardView(match_context, EVENT_TYPES, {"1": ("events", print)})
+
+
+def test_layout_gives_remaining_rows_to_the_timeline():
+    """Header, status and command line keep their size."""
+    regions = layout(24)
+
+    assert regions[REGION_HEADER].top == 0
+    assert regions[REGION_TIMELINE].rows == 24 - 4 - 3 - 1
+    assert regions[REGION_COMMAND].top == 23
+
+
+def test_only_changed_lines_are_redrawn(match_context, view):
+    """A new event redraws the score and the new timeline line only."""
+    regions = layout(20)
+    differ = LineDiffer()
+    first = differ.changes(regions, view.render(regions, 60, ""))
+    assert len(first) == 20
+
+    match_context.apply_server_events(
+        match_context.match_events_json + [_goal(2, 2, 30)]
+    )
+    changes = differ.changes(regions, view.render(regions, 60, ""))
+
+    assert [row for row, _ in changes] == [1, 5]
+    assert "1 - 1 Away" in changes[0][1]
+    assert changes[1][1].startswith(" 30'")
+    assert differ.changes(regions, view.render(regions, 60, "")) == []
+
+
+def test_timeline_shows_the_latest_events(match_context, view):
+    """Events that do not fit scroll off the top of the timeline."""
+    match_context.apply_server_events(
+        [_goal(i, 1, i) for i in range(1, 31)] + [{**_goal(99, 2, 3), "pending": 1}]
+    )
+    regions = layout(12)
+
+    timeline = view.render(regions, 60, "")[REGION_TIMELINE]
+
+    assert len(timeline) == regions[REGION_TIMELINE].rows
+    assert timeline[-1].startswith(" 30'")
+    assert "(pending)" not in "".join(timeline)
+    assert "(pending)" in view.timeline_lines()[3]
+
+
+def test_command_line_lists_every_key(view):
+    """The command line shows the actions, refresh and quit."""
+    assert view.command_line("1") == "1:events  r:refresh  q:quit > 1"
+
+
+def test_timeline_tolerates_null_minutes_and_periods(match_context, view):
+    """Events with a null minute or period are listed first, at minute 0."""
+    match_context.apply_server_events(
+        [_goal(1, 1, 10), {**_goal(2, 2, None), "period": None}]
+    )
+
+    lines = view.timeline_lines()
+
+    assert lines[0].startswith("  0'")
+    assert lines[1].startswith(" 10'")
+
+
+def test_clip_counts_wide_characters():
+    """Emoji take two columns when lines are clipped."""
+    assert clip("⚽ Goal", 4) == "⚽ G"
+    assert clip("Goal", 10) == "Goal"
+
+
+def test_refresh_runs_in_the_background(match_context):
+    """A refresh applies the server events without blocking the caller."""
+    match_context.api_client.fetch_match_events_json.return_value = [
+        _goal(1, 1, 10),
+        _goal(2, 2, 50),
+    ]
+    dashboard = MatchDashboard(match_context, EVENT_TYPES, {})
+
+    refresh = dashboard.start_refresh()
+    assert dashboard.start_refresh() is refresh
+    refresh.result(timeout=5)
+
+    assert len(match_context.match_events_json) == 2
+    assert dashboard.view.busy == "Refreshing events"
+    dashboard._collect_notices()
+    assert dashboard.view.busy is None
+    assert "1 added" in dashboard.view.notices[-1]
@@ -0,0 +1,161 @@
+"""Tests for the match_event_sync module.
+
+This module tests the event diffing and the incrementally patched event index.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from match_context import MatchContext
+from match_event_sync import (
+    MatchEventIndex,
+    diff_match_events,
+    event_content_hash,
+)
+
+
+def _goal(event_id, team_id, period, minute):
+    return {
+        "matchhandelseid": event_id,
+        "matchhandelsetypid": 6,
+        "matchlagid": team_id,
+        "period": period,
+        "matchminut": minute,
+    }
+
+
+class TestDiffMatchEvents:
+    """Test class for diff_match_events."""
+
+    def test_identical_lists_produce_empty_delta(self):
+        """Test that unchanged events are not reported."""
+        events = [_goal(1, 10, 1, 5), _goal(2, 20, 2, 60)]
+
+        delta = diff_match_events(events, [dict(e) for e in events])
+
+        assert delta.is_empty
+        assert len(delta) == 0
+
+    def test_added_changed_removed(self):
+        """Test that each kind of change is detected by id and content."""
+        old_events = [_goal(1, 10, 1, 5), _goal(2, 20, 2, 60)]
+        new_events = [_goal(1, 10, 1, 7), _goal(3, 10, 2, 70)]
+
+        delta = diff_match_events(old_events, new_events)
+
+        assert delta.added == [new_events[1]]
+        assert delta.changed == [new_events[0]]
+        assert delta.removed == [old_events[1]]
+
+    def test_content_hash_ignores_key_order(self):
+        """Test that the content hash is independent of dict ordering."""
+        event = _goal(1, 10, 1, 5)
+        reordered = dict(reversed(list(event.items())))
+
+        assert event_content_hash(event) == event_content_hash(reordered)
+
+
+class TestMatchEventIndex:
+    """Test class for MatchEventIndex."""
+
+    def test_scores_are_patched_incrementally(self):
+        """Test that goal tallies follow added, changed and removed goals."""
+        index = MatchEventIndex(team1_id=10, team2_id=20)
+        index.apply([_goal(1, 10, 1, 5), _goal(2, 20, 2, 60)])
+
+        scores = index.scores()
+        assert (scores.regular_time.home, scores.regular_time.away) == (1, 1)
+        assert (scores.halftime.home, scores.halftime.away) == (1, 0)
+
+        # Goal 1 moves to the second half, goal 2 is removed
+        index.apply([_goal(1, 10, 2, 50)])
+
+        scores = index.scores()
+        assert (scores.regular_time.home, scores.regular_time.away) == (1, 0)
+        assert (scores.halftime.home, scores.halftime.away) == (0, 0)
+
+    def test_find_by_type_and_period(self):
+        """Test lookup of control events by type and period."""
+        period_start = {"matchhandelseid": 5, "matchhandelsetypid": 31, "period": 2}
+        index = MatchEventIndex()
+        index.apply([period_start])
+
+        assert index.find(31, 2) == period_start
+        assert index.find(32, 2) is None
+
+        index.apply([])
+        assert index.find(31, 2) is None
+
+    def test_events_without_id_are_keyed_by_content(self):
+        """Test that unsaved events (id 0) are still tracked."""
+        unsaved = _goal(0, 10, 1, 5)
+        index = MatchEventIndex(team1_id=10, team2_id=20)
+
+        assert index.apply([unsaved]).added == [unsaved]
+        assert index.apply([dict(unsaved)]).is_empty
+
+
+class TestMatchContextSync:
+    """Test class for MatchContext.apply_server_events."""
+
+    @pytest.fixture
+    def match_context(self):
+        """Fixture to create a MatchContext with one existing goal."""
+        return MatchContext(
+            api_client=MagicMock(),
+            selected_match={},
+            team1_players_json=[],
+            team2_players_json=[],
+            match_events_json=[_goal(1, 10, 1, 5)],
+            num_periods=2,
+            period_length=45,
+            num_extra_periods=0,
+            extra_period_length=0,
+            team1_name="Team 1",
+            team2_name="Team 2",
+            team1_id=10,
+            team2_id=20,
+            match_id=123,
+        )
+
+    def test_apply_server_events_returns_delta(self, match_context):
+        """Test that syncing swaps the list and reports only the new goal."""
+        new_events = [_goal(1, 10, 1, 5), _goal(2, 20, 1, 30)]
+
+        delta = match_context.apply_server_events(new_events)
+
+        assert delta.added == [new_events[1]]
+        assert not delta.changed and not delta.removed
+        assert match_context.match_events_json is new_events
+        assert match_context.scores.regular_time.away == 1
+        assert match_context.scores.halftime.home == 1
+
+    def test_scores_fall_back_when_list_is_replaced(self, match_context):
+        """Test that direct assignment bypasses the stale index."""
+        match_context.apply_server_events([_goal(1, 10, 1, 5)])
+        match_context.match_events_json = []
+
+        assert match_context.scores.regular_time.home == 0
+
+    def test_version_changes_only_with_the_events(self, match_context):
+        """Test that the version is bumped by real changes only."""
+        version, events = match_context.snapshot()
+
+        match_context.apply_server_events([dict(event) for event in events])
+        assert match_context.version == version
+
+        new_version = match_context.append_local_event(_goal(0, 20, 2, 60))
+        assert new_version == version + 1
+        assert match_context.snapshot()[0] == new_version
+        assert events == [_goal(1, 10, 1, 5)]  # Old list is left untouched
+
+    def test_derived_values_are_cached_per_version(self, match_context):
+        """Test that derived values are recomputed after a change only."""
+        compute = MagicMock(side_effect=lambda: len(match_context.match_events_json))
+
+        assert match_context.derived("count", compute) == 1
+        assert match_context.derived("count", compute) == 1
+        match_context.apply_server_events([_goal(1, 10, 1, 5), _goal(2, 20, 1, 30)])
+        assert match_context.derived("count", compute) == 2
+        assert compute.call_count == 2
@@ -0,0 +1,129 @@
+"""Tests for the match_report_export module."""
+
+import csv
+import io
+import json
+
+import pytest
+from fogis_api_client.fogis_api_client import EVENT_TYPES
+
+from match_context import Score, Scores
+from match_event_table_formatter import MatchEventTableFormatter
+from match_report_export import (
+    FORMAT_CSV,
+    FORMAT_HTML,
+    FORMAT_JSON,
+    FORMAT_MARKDOWN,
+    MatchExporter,
+    export_matches,
+    summarize_match,
+)
+
+EVENTS = [
+    {
+        "matchhandelsetypid": 6,
+        "matchlagid": 1,
+        "period": 1,
+        "matchminut": 10,
+        "trojnummer": 9,
+    },
+    {
+        "matchhandelsetypid": 20,
+        "matchlagid": 2,
+        "period": 2,
+        "matchminut": 70,
+        "trojnummer": 4,
+    },
+    # Unknown team, skipped as in the table
+    {
+        "matchhandelsetypid": 6,
+        "matchlagid": 99,
+        "period": 1,
+        "matchminut": 15,
+        "trojnummer": 7,
+    },
+]
+
+
+def _summary(match_id=1, team2_name="Malmö <FF>"):
+    formatter = MatchEventTableFormatter(EVENT_TYPES, "IFK Göteborg", team2_name, 1, 2)
+    scores = Scores(regular_time=Score(1, 0), halftime=Score(1, 0))
+    return summarize_match(formatter, match_id, EVENTS, scores)
+
+
+def test_summary_groups_events_like_the_table():
+    """The summary holds the table's cell texts by category and team."""
+    summary = _summary()
+
+    assert summary.categories() == ["Goals", "Yellow Cards"]
+    assert summary.team_events("Goals") == [["⚽ 9 - 10'"], []]
+    assert summary.team_events("Yellow Cards") == [[], ["🟨 4 - 70'"]]
+
+
+def test_json_export_streams_an_array_of_matches():
+    """Each match becomes one object of a JSON array."""
+    stream = io.StringIO()
+
+    count = export_matches((_summary(i) for i in (1, 2)), FORMAT_JSON, stream)
+
+    documents = json.loads(stream.getvalue())
+    assert count == 2
+    assert [document["match_id"] for document in documents] == [1, 2]
+    assert documents[0]["scores"]["full_time"] == [1, 0]
+    assert documents[0]["scores"]["penalties"] is None
+    assert documents[0]["events"]["Goals"] == {"home": ["⚽ 9 - 10'"], "away": []}
+
+
+def test_csv_export_writes_a_row_per_event():
+    """Rows carry the match, the category, the team and the event text."""
+    stream = io.StringIO()
+
+    export_matches([_summary()], FORMAT_CSV, stream)
+
+    rows = list(csv.reader(io.StringIO(stream.getvalue())))
+    assert rows[0][0] == "match_id"
+    assert rows[1] == [
+        "1",
+        "IFK Göteborg",
+        "Malmö <FF>",
+        "1",
+        "0",
+        "Goals",
+        "IFK Göteborg",
+        "⚽ 9 - 10'",
+    ]
+    assert len(rows) == 3
+
+
+def test_markdown_and_html_exports():
+    """Markdown and HTML show the teams, the score and escaped names."""
+    markdown = io.StringIO()
+    page = io.StringIO()
+
+    export_matches([_summary()], FORMAT_MARKDOWN, markdown)
+    export_matches([_summary()], FORMAT_HTML, page)
+
+    assert "## IFK Göteborg vs Malmö <FF>" in markdown.getvalue()
+    assert "**Score:** 1 - 0 (HT 1 - 0)" in markdown.getvalue()
+    assert "| **Goals** | ⚽ 9 - 10' |  |" in markdown.getvalue()
+    assert "Malmö &lt;FF&gt;" in page.getvalue()
+    assert page.getvalue().rstrip().endswith("</html>")
+
+
+def test_unknown_format_is_rejected():
+    """An unknown format raises before anything is written."""
+    stream = io.StringIO()
+
+    with pytest.raises(ValueError):
+        export_matches([_summary()], "pdf", stream)
+    assert stream.getvalue() == ""
+
+
+def test_exporter_must_implement_write_match():
+    """An exporter without write_match cannot be created."""
+
+    class IncompleteExporter(MatchExporter):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteExporter(io.StringIO())
@@ -173,7 +173,10 @@ def test_report_match_results_interactively():
     )  # API returns None on success
 
     # Patch the necessary functions
-    with patch("fogis_reporter._get_score_input_from_user", get_score_input_mock):
+    # The local result check is tested in tests/test_result_validation.py
+    with patch(
+        "fogis_reporter._get_score_input_from_user", get_score_input_mock
+    ), patch("fogis_reporter._check_results_before_submission", return_value=True):
         with patch("fogis_reporter._verify_match_results", verify_results_mock):
             # We need to patch the _mark_reporting_finished_with_error_handling function
             # to make it actually call our mock
@@ -260,7 +263,10 @@ def test_report_match_results_verification_failure():
     )  # API returns None on success
 
     # Patch the necessary functions
-    with patch("fogis_reporter._get_score_input_from_user", get_score_input_mock):
+    # The local result check is tested in tests/test_result_validation.py
+    with patch(
+        "fogis_reporter._get_score_input_from_user", get_score_input_mock
+    ), patch("fogis_reporter._check_results_before_submission", return_value=True):
         with patch("fogis_reporter._verify_match_results", verify_results_mock):
             with patch(
                 "fogis_reporter._mark_reporting_finished_with_error_handling",
@@ -0,0 +1,120 @@
+"""Tests for the optimistic_reporting module.
+
+This module tests local apply, confirmation and rollback of pending events.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fogis_reporter import _run_requested_reconciliation
+from match_context import PENDING_EVENT_KEY, MatchContext
+from optimistic_reporting import OptimisticReporter
+
+
+def _goal(event_id, team_id, minute):
+    return {
+        "matchhandelseid": event_id,
+        "matchid": 123,
+        "matchhandelsetypid": 6,
+        "matchlagid": team_id,
+        "period": 1,
+        "matchminut": minute,
+    }
+
+
+@pytest.fixture
+def match_context():
+    """Fixture for a match context with one confirmed goal."""
+    return MatchContext(
+        api_client=MagicMock(),
+        selected_match={},
+        team1_players_json=[],
+        team2_players_json=[],
+        match_events_json=[_goal(1, 1, 10)],
+        num_periods=2,
+        period_length=45,
+        num_extra_periods=0,
+        extra_period_length=0,
+        team1_name="Home",
+        team2_name="Away",
+        team1_id=1,
+        team2_id=2,
+        match_id=123,
+    )
+
+
+def test_confirmed_event_is_replaced_by_server_version(match_context):
+    """Test that a confirmed event takes the server matchhandelseid."""
+    api_client = match_context.api_client
+    api_client.report_match_event.return_value = {"d": None}
+    api_client.fetch_match_events_json.return_value = [
+        _goal(1, 1, 10),
+        _goal(2, 2, 20),
+    ]
+    on_confirmed = MagicMock()
+    reporter = OptimisticReporter(match_context, on_confirmed=on_confirmed)
+
+    future = reporter.submit(_goal(0, 2, 20), "Goal by #9", {"trojnummer": 9})
+    reporter.close()
+
+    assert future.result() is True
+    assert [e["matchhandelseid"] for e in match_context.match_events_json] == [1, 2]
+    assert not any(PENDING_EVENT_KEY in e for e in match_context.match_events_json)
+    on_confirmed.assert_called_once()
+
+
+def test_pending_event_is_visible_until_resolved(match_context):
+    """Test that the local event counts at once and survives a server sync."""
+    reporter = OptimisticReporter(match_context)
+    reporter._executor.submit = MagicMock()  # Keep the event pending
+
+    reporter.submit(_goal(0, 2, 20), "Goal by #9", {"trojnummer": 9})
+    match_context.apply_server_events([_goal(1, 1, 10)])
+
+    pending = match_context.match_events_json[-1]
+    assert pending[PENDING_EVENT_KEY] is True
+    assert pending["trojnummer"] == 9
+    assert match_context.scores.regular_time.away == 1
+
+
+def test_failed_report_is_rolled_back_with_notice(match_context):
+    """Test that a rejected event is removed and announced."""
+    match_context.api_client.report_match_event.side_effect = ValueError("rejected")
+    reporter = OptimisticReporter(match_context)
+
+    future = reporter.submit(_goal(0, 2, 20), "Goal by #9")
+    reporter.close()
+
+    assert future.result() is False
+    assert match_context.match_events_json == [_goal(1, 1, 10)]
+    assert match_context.scores.regular_time.away == 0
+    notices = match_context.drain_notices()
+    assert len(notices) == 1
+    assert "Goal by #9 was NOT reported (rejected)" in notices[0]
+    match_context.api_client.fetch_match_events_json.assert_not_called()
+
+
+def test_reconciliation_runs_on_the_reporting_thread(match_context):
+    """Test that a confirmation only requests the running score check."""
+    match_context.api_client.fetch_match_events_json.return_value = [
+        _goal(1, 1, 10),
+        _goal(2, 2, 20),
+    ]
+    threads = []
+    with patch(
+        "fogis_reporter._reconcile_running_scores",
+        side_effect=lambda context: threads.append(threading.current_thread()),
+    ):
+        reporter = OptimisticReporter(
+            match_context, on_confirmed=match_context.reconcile_requested.set
+        )
+        reporter.submit(_goal(0, 2, 20), "Goal by #9")
+        reporter.close()
+        assert threads == []
+
+        _run_requested_reconciliation(match_context)
+        _run_requested_reconciliation(match_context)
+
+    assert threads == [threading.current_thread()]
@@ -0,0 +1,152 @@
+"""Tests for the request_scheduler module.
+
+This module tests the token bucket, priority ordering and the scheduled
+API client.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from request_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE_READ,
+    PRIORITY_INTERACTIVE_WRITE,
+    PRIORITY_RESULT_REPORTING,
+    RequestScheduler,
+    ScheduledApiClient,
+    TokenBucket,
+    SchedulerMetrics,
+    background_requests,
+)
+from single_flight import CoalescingApiClient
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_burst_and_refill():
+    """A full bucket allows a burst, then refills at the configured rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.5
+    clock.now += 0.5
+    assert bucket.try_acquire() == 0.0
+
+
+def test_waiting_calls_are_admitted_by_priority():
+    """When tokens run out, higher priority calls are sent first."""
+    scheduler = RequestScheduler(TokenBucket(rate=4.0, burst=1))
+    scheduler.call(PRIORITY_INTERACTIVE_READ, lambda: None)  # Empty the bucket
+    order = []
+    threads = []
+    for priority in (PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE_WRITE):
+        thread = threading.Thread(
+            target=scheduler.call, args=(priority, order.append, priority)
+        )
+        thread.start()
+        threads.append(thread)
+        # Make sure the background call is queued first
+        while sum(scheduler.metrics().queue_depth.values()) < len(threads):
+            time.sleep(0.001)
+    for thread in threads:
+        thread.join(5)
+
+    assert order == [PRIORITY_INTERACTIVE_WRITE, PRIORITY_BACKGROUND]
+    metrics = scheduler.metrics()
+    assert metrics.max_queue_depth == 2
+    assert sum(metrics.queue_depth.values()) == 0
+    assert metrics.requests["background"] == 1
+
+
+def test_scheduled_client_priorities():
+    """Client methods map to their priority class."""
+    assert (
+        ScheduledApiClient.priority_for("report_match_event")
+        == PRIORITY_INTERACTIVE_WRITE
+    )
+    assert (
+        ScheduledApiClient.priority_for("report_match_result")
+        == PRIORITY_RESULT_REPORTING
+    )
+    assert (
+        ScheduledApiClient.priority_for("fetch_match_events_json")
+        == PRIORITY_INTERACTIVE_READ
+    )
+    with background_requests():
+        assert (
+            ScheduledApiClient.priority_for("fetch_match_events_json")
+            == PRIORITY_BACKGROUND
+        )
+    assert (
+        ScheduledApiClient.priority_for("fetch_match_events_json")
+        == PRIORITY_INTERACTIVE_READ
+    )
+
+
+def test_scheduled_client_forwards_calls():
+    """Calls are forwarded with their arguments and counted per priority."""
+    api_client = MagicMock()
+    api_client.fetch_match_events_json.return_value = [{"matchhandelseid": 1}]
+    scheduler = RequestScheduler(TokenBucket(rate=10.0, burst=5))
+    client = ScheduledApiClient(api_client, scheduler)
+
+    assert client.fetch_match_events_json(123) == [{"matchhandelseid": 1}]
+    client.report_match_event({"matchid": 123})
+
+    api_client.fetch_match_events_json.assert_called_once_with(123)
+    api_client.report_match_event.assert_called_once_with({"matchid": 123})
+    requests = scheduler.metrics().requests
+    assert requests["interactive read"] == 1
+    assert requests["interactive write"] == 1
+
+
+def test_interactive_read_does_not_join_a_queued_background_read():
+    """A menu read is not held back by a poll waiting at background priority."""
+    main_thread = threading.current_thread()
+    callers = []
+    api_client = MagicMock()
+    api_client.fetch_match_events_json.side_effect = lambda match_id: callers.append(
+        threading.current_thread() is main_thread
+    )
+    scheduler = RequestScheduler(TokenBucket(rate=4.0, burst=1))
+    client = ScheduledApiClient(CoalescingApiClient(api_client, 0.0), scheduler)
+    scheduler.call(PRIORITY_INTERACTIVE_READ, lambda: None)  # Empty the bucket
+
+    def poll():
+        with background_requests():
+            client.fetch_match_events_json(123)
+
+    thread = threading.Thread(target=poll)
+    thread.start()
+    while sum(scheduler.metrics().queue_depth.values()) < 1:
+        time.sleep(0.001)
+    client.fetch_match_events_json(123)
+    thread.join(5)
+
+    assert callers == [True, False]
+
+
+def test_metrics_summary():
+    """The summary lists the calls per priority and the waiting time."""
+    metrics = SchedulerMetrics(
+        queue_depth={"background": 0},
+        max_queue_depth=3,
+        requests={"interactive write": 2, "background": 5, "interactive read": 0},
+        total_wait=1.5,
+    )
+
+    assert metrics.summary() == (
+        "API requests: 2 interactive write, 5 background;"
+        " waited 1.50s for the rate limit, at most 3 queued"
+    )
@@ -0,0 +1,79 @@
+"""Tests for the result_validation module.
+
+This module tests the local checks run on match results before submission.
+"""
+
+from match_context import Score, Scores
+from result_validation import validate_results
+
+GAME_END_EVENT = {"matchhandelsetypid": 23, "period": 2}
+
+
+def _scores(halftime, fulltime):
+    return Scores(regular_time=Score(*fulltime), halftime=Score(*halftime))
+
+
+def _validate(entered, calculated=None, events=None, num_extra_periods=0):
+    return validate_results(
+        entered,
+        calculated if calculated is not None else entered,
+        events if events is not None else [GAME_END_EVENT],
+        2,
+        num_extra_periods,
+    )
+
+
+def test_consistent_results_have_no_issues():
+    """Results matching the events of a finished match pass."""
+    assert _validate(_scores((1, 0), (2, 1))) == []
+
+
+def test_halftime_higher_than_fulltime_is_blocking():
+    """A team cannot have more goals at halftime than at fulltime."""
+    issues = _validate(_scores((2, 0), (1, 1)), calculated=_scores((0, 0), (0, 0)))
+
+    assert issues[0].blocking
+    assert "higher than the fulltime score 1-1" in issues[0].message
+    # Mismatches with the events are reported after the blocking issue
+    assert [issue.blocking for issue in issues] == [True, False, False]
+
+
+def test_mismatch_with_events_needs_confirmation():
+    """Scores that differ from the reported goals are a warning."""
+    issues = _validate(_scores((0, 0), (1, 0)), calculated=_scores((0, 0), (2, 0)))
+
+    assert len(issues) == 1
+    assert not issues[0].blocking
+    assert "Fulltime score 1-0 does not match the reported goals (2-0)" in (
+        issues[0].message
+    )
+
+
+def test_missing_game_end_needs_confirmation():
+    """A match without a Game End event is a warning."""
+    issues = _validate(_scores((0, 0), (0, 0)), events=[])
+
+    assert len(issues) == 1
+    assert not issues[0].blocking
+    assert "Game End" in issues[0].message
+
+
+def test_events_after_the_last_period_are_blocking():
+    """Events must fit the periods of the match structure."""
+    events = [GAME_END_EVENT, {"matchhandelsetypid": 6, "period": 3}]
+    issues = _validate(_scores((0, 0), (1, 0)), events=events)
+
+    assert [issue.message for issue in issues] == [
+        "Events are reported in period 3, but the match has only 2 periods."
+    ]
+    assert issues[0].blocking
+
+    # With extra time, events in period 3 are fine
+    assert _validate(_scores((0, 0), (1, 1)), events=events, num_extra_periods=2) == []
+
+
+def test_events_without_period_are_ignored():
+    """Events with a missing or null period do not break the period check."""
+    events = [GAME_END_EVENT, {"matchhandelsetypid": 6, "period": None}, {}]
+
+    assert _validate(_scores((0, 0), (0, 0)), events=events) == []
@@ -0,0 +1,149 @@
+"""Tests for the results_pipeline module.
+
+This module tests the verification backoff, step timings and resuming an
+interrupted result report.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from results_pipeline import (
+    STEP_MARK_FINISHED,
+    STEP_SUBMIT,
+    STEP_VERIFY,
+    ResultsPipeline,
+    poll_with_backoff,
+)
+
+RESULT_DATA = {"matchresultatListaJSON": [{"matchid": 123, "matchlag1mal": 2}]}
+
+
+class FakeClock:
+    """Clock that advances by one second on every reading."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+def test_poll_with_backoff_doubles_delay_up_to_max():
+    """The delay doubles between attempts and is capped."""
+    sleep = MagicMock()
+    check = MagicMock(side_effect=[None, None, None, "ok"])
+
+    value, attempts = poll_with_backoff(
+        check, max_attempts=5, initial_delay=1.0, max_delay=3.0, sleep=sleep
+    )
+
+    assert (value, attempts) == ("ok", 4)
+    assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0, 3.0]
+
+
+def test_poll_with_backoff_gives_up():
+    """After max_attempts the poll returns None without a final sleep."""
+    sleep = MagicMock()
+
+    value, attempts = poll_with_backoff(lambda: None, max_attempts=3, sleep=sleep)
+
+    assert (value, attempts) == (None, 3)
+    assert sleep.call_count == 2
+
+
+def test_pipeline_records_timings():
+    """Every step is timed, including mark finished."""
+    api_client = MagicMock()
+    api_client.mark_reporting_finished.return_value = {"success": True}
+    pipeline = ResultsPipeline(api_client, 123, RESULT_DATA, clock=FakeClock())
+
+    pipeline.submit()
+    assert pipeline.verify(lambda: True)
+    pipeline.mark_finished()
+
+    api_client.report_match_result.assert_called_once_with(RESULT_DATA)
+    api_client.mark_reporting_finished.assert_called_once_with(123)
+    assert pipeline.finished
+    assert pipeline.timing_summary() == (
+        "submit 1.00s, verify 1.00s, mark finished 1.00s"
+    )
+
+
+def test_pipeline_resubmits_after_failed_verification():
+    """Results that failed verification are submitted again, not resumed."""
+    api_client = MagicMock()
+    pipeline = ResultsPipeline(api_client, 123, RESULT_DATA, clock=FakeClock())
+
+    pipeline.submit()
+    assert not pipeline.verify(lambda: False)
+    assert not pipeline.can_resume(dict(RESULT_DATA))
+    assert pipeline.next_step == STEP_SUBMIT
+
+    pipeline.submit()
+    assert pipeline.verify(lambda: True)
+    assert api_client.report_match_result.call_count == 2
+    assert pipeline.next_step == STEP_MARK_FINISHED
+
+
+def test_pipeline_resumes_after_interrupted_verification():
+    """An interrupted verification resumes without resubmitting."""
+    api_client = MagicMock()
+    pipeline = ResultsPipeline(api_client, 123, RESULT_DATA, clock=FakeClock())
+    check = MagicMock(side_effect=[KeyboardInterrupt, True])
+
+    pipeline.submit()
+    with pytest.raises(KeyboardInterrupt):
+        pipeline.verify(check)
+    assert pipeline.can_resume(dict(RESULT_DATA))
+    assert pipeline.next_step == STEP_VERIFY
+    assert not pipeline.can_resume({"matchresultatListaJSON": []})
+
+    pipeline.submit()
+    assert pipeline.verify(check)
+    assert api_client.report_match_result.call_count == 1
+
+
+def test_pipeline_resumes_after_interrupt_following_verification():
+    """An interrupt after verification resumes at mark finished."""
+    api_client = MagicMock()
+    api_client.mark_reporting_finished.side_effect = [
+        KeyboardInterrupt,
+        {"success": True},
+    ]
+    check = MagicMock(return_value=True)
+    pipeline = ResultsPipeline(api_client, 123, RESULT_DATA, clock=FakeClock())
+
+    pipeline.submit()
+    assert pipeline.verify(check)
+    with pytest.raises(KeyboardInterrupt):
+        pipeline.mark_finished()
+    assert pipeline.can_resume(RESULT_DATA)
+    assert pipeline.next_step == STEP_MARK_FINISHED
+
+    pipeline.submit()
+    assert pipeline.verify(check)
+    assert pipeline.mark_finished() == {"success": True}
+    assert api_client.report_match_result.call_count == 1
+    assert check.call_count == 1
+    assert pipeline.next_step is None
+    assert not pipeline.can_resume(RESULT_DATA)
+    assert pipeline.mark_finished() is None
+    assert api_client.mark_reporting_finished.call_count == 2
+
+
+def test_pipeline_failed_submit_is_retried():
+    """A failed submission is timed as failed and not marked as done."""
+    api_client = MagicMock()
+    api_client.report_match_result.side_effect = [ConnectionError("down"), None]
+    pipeline = ResultsPipeline(api_client, 123, RESULT_DATA, clock=FakeClock())
+
+    with pytest.raises(ConnectionError):
+        pipeline.submit()
+    assert not pipeline.submitted
+    assert not pipeline.can_resume(RESULT_DATA)
+
+    pipeline.submit()
+    assert pipeline.submitted
+    assert pipeline.timing_summary() == "submit 1.00s (failed), submit 1.00s"
@@ -0,0 +1,81 @@
+"""Tests for the score_reconciliation module.
+
+This module tests the running-score computation and the correction planner.
+"""
+
+from score_reconciliation import (
+    compute_running_scores,
+    match_order_key,
+    plan_score_corrections,
+)
+
+
+def _event(event_id, type_id, team_id, period, minute, home, away, second=0):
+    return {
+        "matchhandelseid": event_id,
+        "matchhandelsetypid": type_id,
+        "matchlagid": team_id,
+        "period": period,
+        "matchminut": minute,
+        "sekund": second,
+        "hemmamal": home,
+        "bortamal": away,
+    }
+
+
+class TestComputeRunningScores:
+    """Test class for compute_running_scores."""
+
+    def test_events_are_scored_in_match_order(self):
+        """Test that events are sorted by period, minute and second."""
+        events = [
+            _event(3, 6, 1, 2, 60, 1, 0),
+            _event(1, 20, 2, 1, 10, 0, 0),  # Yellow card
+            _event(2, 6, 2, 1, 30, 0, 1),
+        ]
+
+        running = compute_running_scores(events, 1, 2)
+
+        assert [(e["matchhandelseid"], h, a) for e, h, a in running] == [
+            (1, 0, 0),
+            (2, 0, 1),
+            (3, 1, 1),
+        ]
+
+    def test_stoppage_time_sorts_by_period_first(self):
+        """Test that 45+2 (minute 47, period 1) sorts before minute 46."""
+        stoppage = _event(1, 6, 1, 1, 47, 0, 0)
+        second_half = _event(2, 6, 1, 2, 46, 0, 0)
+
+        assert match_order_key(stoppage) < match_order_key(second_half)
+
+
+class TestPlanScoreCorrections:
+    """Test class for plan_score_corrections."""
+
+    def test_late_goal_corrects_only_later_events(self):
+        """Test a 30' goal entered after a 60' goal fixes only the 60' goal."""
+        events = [
+            _event(10, 6, 1, 2, 60, 1, 0),  # Reported first, stamped 1-0
+            _event(11, 6, 2, 1, 30, 1, 1),  # Reported late, stamped 1-1
+            _event(12, 20, 1, 1, 5, 0, 0),  # Early card, already correct
+        ]
+
+        corrections = plan_score_corrections(events, 1, 2)
+
+        assert [(c.event_id, c.home, c.away) for c in corrections] == [
+            (11, 0, 1),
+            (10, 1, 1),
+        ]
+
+    def test_consistent_events_need_no_corrections(self):
+        """Test that nothing is planned when every stamp is right."""
+        events = [_event(1, 6, 1, 1, 10, 1, 0), _event(2, 6, 2, 2, 50, 1, 1)]
+
+        assert plan_score_corrections(events, 1, 2) == []
+
+    def test_unsaved_events_are_skipped(self):
+        """Test that events without an id are never planned for update."""
+        events = [_event(0, 6, 1, 1, 10, 0, 0)]
+
+        assert plan_score_corrections(events, 1, 2) == []
@@ -0,0 +1,109 @@
+"""Tests for the scoreboard_server module."""
+
+import http.client
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fogis_api_client.fogis_api_client import EVENT_TYPES
+
+from match_context import MatchContext
+from scoreboard_server import ScoreboardServer
+
+
+def _goal(event_id, team_id, minute):
+    return {
+        "matchhandelseid": event_id,
+        "matchhandelsetypid": 6,
+        "matchlagid": team_id,
+        "period": 1,
+        "matchminut": minute,
+        "trojnummer": 9,
+    }
+
+
+@pytest.fixture
+def match_context():
+    """Fixture for a match context with one home goal."""
+    return MatchContext(
+        api_client=MagicMock(),
+        selected_match={},
+        team1_players_json=[],
+        team2_players_json=[],
+        match_events_json=[_goal(1, 1, 10)],
+        num_periods=2,
+        period_length=45,
+        num_extra_periods=0,
+        extra_period_length=0,
+        team1_name="Home",
+        team2_name="Away",
+        team1_id=1,
+        team2_id=2,
+        match_id=123,
+    )
+
+
+@pytest.fixture
+def scoreboard():
+    """Fixture for a running server on a free port."""
+    server = ScoreboardServer(EVENT_TYPES, port=0, heartbeat=0.2)
+    server.start()
+    yield server
+    server.stop()
+
+
+def _connect(scoreboard, path):
+    connection = http.client.HTTPConnection(*scoreboard.address, timeout=5)
+    connection.request("GET", path)
+    return connection.getresponse()
+
+
+def _read_message(response):
+    """Returns the data of the next SSE message, skipping keep-alives."""
+    data = None
+    deadline = time.monotonic() + 5
+    while True:
+        assert time.monotonic() < deadline, "no update received"
+        raw = response.fp.readline()
+        assert raw, "event stream closed"
+        line = raw.decode("utf-8").rstrip("\n")
+        if line.startswith("data: "):
+            data = json.loads(line[len("data: ") :])
+        elif line == "" and data is not None:
+            return data
+
+
+def test_snapshot_is_served_and_cached(scoreboard, match_context):
+    """The JSON snapshot shows the score and is rendered once per version."""
+    scoreboard.attach(match_context)
+
+    document = json.loads(_connect(scoreboard, "/scores.json").read())
+
+    assert document["match"]["scores"]["full_time"] == [1, 0]
+    assert document["match"]["events"]["Goals"]["home"] == ["⚽ 9 - 10'"]
+    assert scoreboard.snapshot() is scoreboard.snapshot()
+
+
+def test_events_stream_pushes_changes(scoreboard, match_context):
+    """Each confirmed change is pushed; pending events are not shown."""
+    scoreboard.attach(match_context)
+    response = _connect(scoreboard, "/events")
+    assert response.getheader("Content-Type") == "text/event-stream"
+    assert _read_message(response)["match"]["scores"]["full_time"] == [1, 0]
+
+    match_context.append_local_event({**_goal(None, 2, 20), "pending": True})
+    match_context.apply_server_events([_goal(1, 1, 10), _goal(2, 2, 30)])
+
+    update = _read_message(response)
+    assert update["match"]["scores"]["full_time"] == [1, 1]
+    assert update["match"]["events"]["Goals"]["away"] == ["⚽ 9 - 30'"]
+    response.close()
+
+
+def test_page_and_unknown_paths(scoreboard):
+    """The page is served without a match; other paths are not found."""
+    page = _connect(scoreboard, "/")
+    assert b"EventSource" in page.read()
+    assert json.loads(_connect(scoreboard, "/scores.json").read()) == {"match": None}
+    assert _connect(scoreboard, "/missing").status == 404
@@ -0,0 +1,50 @@
+"""Tests for the screen_writer module."""
+
+import io
+
+from screen_writer import ScreenWriter
+
+
+def _menu(writer, choice):
+    with writer.frame() as frame:
+        frame.line("=" * 10)
+        frame.line(f"MENU {choice}")
+        frame.lines(["1: Goal", "2: Card"])
+
+
+def test_frame_is_written_in_one_call():
+    """A frame goes to the stream as a single write."""
+    stream = io.StringIO()
+    writes = []
+    stream.write = lambda text: writes.append(text) or len(text)
+    writer = ScreenWriter(stream)
+
+    _menu(writer, "A")
+
+    assert writes == ["==========\nMENU A\n1: Goal\n2: Card\n"]
+
+
+def test_unchanged_frame_is_skipped_only_when_retained():
+    """An identical frame is redrawn unless the last one is still on screen."""
+    stream = io.StringIO()
+    writer = ScreenWriter(stream, skip_unchanged=True)
+
+    _menu(writer, "A")
+    _menu(writer, "A")
+    writer.retain_frame()
+    _menu(writer, "A")
+    writer.retain_frame()
+    _menu(writer, "B")
+
+    assert stream.getvalue().count("MENU A") == 2
+    assert stream.getvalue().count("MENU B") == 1
+    assert writer.stats == {"written": 3, "skipped": 1}
+
+
+def test_frames_go_to_current_stdout(capsys):
+    """Without a stream, frames are written to sys.stdout at write time."""
+    writer = ScreenWriter()
+
+    _menu(writer, "A")
+
+    assert "MENU A\n" in capsys.readouterr().out
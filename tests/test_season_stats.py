@@ -0,0 +1,104 @@
+"""Tests for the season_stats module.
+
+This module tests the season aggregates over archived events, with and
+without NumPy.
+"""
+
+import pytest
+
+from match_archive import MatchArchive
+from season_stats import (
+    SeasonStats,
+    TeamCards,
+    TopScorer,
+    load_columns,
+    numpy_available,
+)
+
+MATCHES = [
+    {
+        "matchid": 1,
+        "matchlag1id": 11,
+        "matchlag2id": 12,
+        "lag1namn": "Home",
+        "lag2namn": "Away",
+    },
+    {
+        "matchid": 2,
+        "matchlag1id": 21,
+        "matchlag2id": 22,
+        "lag1namn": "Away",
+        "lag2namn": "Home",
+    },
+]
+
+
+def _event(event_id, type_id, team_id, player_id, period, minute):
+    return {
+        "matchhandelseid": event_id,
+        "matchhandelsetypid": type_id,
+        "matchlagid": team_id,
+        "spelareid": player_id,
+        "period": period,
+        "matchminut": minute,
+    }
+
+
+@pytest.fixture
+def archive():
+    """Fixture for an archive with two matches between the same teams."""
+    archive = MatchArchive(":memory:")
+    archive.store_matches(MATCHES)
+    archive.store_team_sheet(
+        1, 11, [{"spelareid": 7, "fornamn": "Anna", "efternamn": "Berg"}], []
+    )
+    events = [
+        (1, _event(1, 6, 11, 7, 1, 10)),  # Goal
+        (1, _event(2, 14, 11, 7, 2, 60)),  # Penalty goal
+        (1, _event(3, 15, 12, 7, 2, 80)),  # Own goal, credited to Away
+        (1, _event(4, 20, 12, 8, 1, 30)),  # Yellow card
+        (2, _event(5, 39, 21, 8, 1, 44)),  # Header goal
+        (2, _event(6, 9, 22, 7, 2, 70)),  # Red card
+        (2, _event(7, 20, 21, None, 2, 75)),  # Yellow card to an unknown player
+        (2, _event(8, 17, 22, 7, 2, 46)),  # Substitution
+    ]
+    archive.store_changes(events, [], [])
+    yield archive
+    archive.close()
+
+
+def test_season_aggregates(archive):
+    """Scorers, cards per team and goals per period span all matches."""
+    stats = SeasonStats.from_archive(archive, use_numpy=False)
+
+    assert len(stats.columns) == 8
+    assert stats.top_scorers() == [TopScorer(7, "Anna Berg", 2), TopScorer(8, "#8", 1)]
+    assert stats.cards_per_team() == [TeamCards("Away", 2, 0), TeamCards("Home", 0, 1)]
+    assert stats.goals_per_period() == {1: 2, 2: 2}
+    assert stats.goals_per_interval(45) == {0: 2, 45: 2}
+
+
+def test_vectorized_aggregates_match_plain_python(archive):
+    """NumPy columns give the same statistics as the fallback."""
+    pytest.importorskip("numpy")
+    rows = archive.event_rows()
+    names = archive.team_names()
+    plain = SeasonStats(load_columns(rows, use_numpy=False), names)
+    vectorized = SeasonStats(load_columns(rows, use_numpy=True), names)
+
+    assert vectorized.columns.vectorized
+    assert vectorized.top_scorers() == plain.top_scorers()
+    assert vectorized.cards_per_team() == plain.cards_per_team()
+    assert vectorized.goals_per_period() == plain.goals_per_period()
+    assert vectorized.goals_per_interval() == plain.goals_per_interval()
+
+
+def test_empty_archive_and_missing_numpy():
+    """No events give empty statistics; requiring absent NumPy is an error."""
+    stats = SeasonStats(load_columns([]))
+    assert stats.top_scorers() == []
+    assert stats.cards_per_team() == []
+    assert stats.goals_per_period() == {}
+    if not numpy_available():
+        with pytest.raises(RuntimeError):
+            load_columns([], use_numpy=True)
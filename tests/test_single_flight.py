@@ -0,0 +1,119 @@
+"""Tests for the single_flight module.
+
+This module tests call sharing, the micro-cache window and invalidation on
+writes.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from single_flight import CoalescingApiClient, SingleFlight
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_concurrent_callers_share_one_call():
+    """Callers arriving while a call is in flight get its result."""
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return ["event"]
+
+    results = []
+    leader = threading.Thread(
+        target=lambda: results.append(single_flight.do("events", fetch))
+    )
+    leader.start()
+    started.wait(5)
+    followers = [
+        threading.Thread(
+            target=lambda: results.append(single_flight.do("events", fetch))
+        )
+        for _ in range(3)
+    ]
+    for follower in followers:
+        follower.start()
+    while single_flight.stats["shared"] < 3:
+        pass
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == [["event"]] * 4
+    assert single_flight.stats["shared"] == 3
+
+
+def test_result_reused_within_cache_ttl():
+    """A completed result is reused until the window has passed."""
+    clock = FakeClock()
+    single_flight = SingleFlight(cache_ttl=0.5, clock=clock)
+    fetch = MagicMock(side_effect=[1, 2])
+
+    assert single_flight.do("key", fetch) == 1
+    clock.now += 0.4
+    assert single_flight.do("key", fetch) == 1
+    clock.now += 0.2
+    assert single_flight.do("key", fetch) == 2
+    assert fetch.call_count == 2
+    assert single_flight.stats["cached"] == 1
+
+
+def test_errors_are_not_cached():
+    """A failed call is retried by the next caller."""
+    single_flight = SingleFlight(clock=FakeClock())
+    fetch = MagicMock(side_effect=[ConnectionError("down"), "ok"])
+
+    with pytest.raises(ConnectionError):
+        single_flight.do("key", fetch)
+    assert single_flight.do("key", fetch) == "ok"
+
+
+def test_forget_bypasses_cache():
+    """forget() makes the next call hit the network inside the window."""
+    single_flight = SingleFlight(clock=FakeClock())
+    fetch = MagicMock(side_effect=[1, 2])
+
+    single_flight.do("key", fetch)
+    single_flight.forget("key")
+    assert single_flight.do("key", fetch) == 2
+
+
+def test_client_invalidates_events_on_report():
+    """Reporting an event refreshes the cached events of that match."""
+    api_client = MagicMock()
+    api_client.fetch_match_events_json.side_effect = [[], [{"id": 1}]]
+    client = CoalescingApiClient(api_client)
+
+    assert client.fetch_match_events_json(123) == []
+    assert client.fetch_match_events_json("123") == []
+    client.report_match_event({"matchid": 123})
+    assert client.fetch_match_events_json(123) == [{"id": 1}]
+    assert api_client.fetch_match_events_json.call_count == 2
+
+
+def test_client_passes_through_other_methods():
+    """Methods that are not coalesced go straight to the client."""
+    api_client = MagicMock()
+    api_client.fetch_matches_list_json.return_value = ["match"]
+    client = CoalescingApiClient(api_client)
+
+    assert client.fetch_matches_list_json() == ["match"]
+    client.fetch_matches_list_json()
+    assert api_client.fetch_matches_list_json.call_count == 2